@@ -0,0 +1,161 @@
+"""Import-time and render benchmark for every page route in main.py.
+
+Runs the app headless through Streamlit's AppTest and records, per page key:
+
+- import_s:       cold import of the page module in a fresh interpreter
+- first_run_s:    first full script run (page module already imported)
+- slider_rerun_s: rerun after moving the first slider on the page
+
+Results are written as sorted, indented JSON so two runs can be diffed:
+
+    python benchmarks/bench_pages.py -o before.json
+    python benchmarks/bench_pages.py -o after.json --compare before.json
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from streamlit.testing.v1 import AppTest
+
+from modules.page_registry import PAGES, cold_import_cost
+
+MAIN_SCRIPT = os.path.join(REPO_ROOT, 'main.py')
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True, cwd=REPO_ROOT
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _new_app(page_key, timeout):
+    at = AppTest.from_file(MAIN_SCRIPT, default_timeout=timeout)
+    at.session_state['page'] = page_key
+    return at
+
+
+def _timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    return time.perf_counter() - start
+
+
+def _move_first_slider(at):
+    """Move the first single-value slider to another end of its range.
+
+    Returns the slider label, or None when the page has no such slider.
+    """
+    for slider in at.slider:
+        if isinstance(slider.value, (tuple, list)):
+            continue
+        new_value = slider.min if slider.value == slider.max else slider.max
+        slider.set_value(new_value)
+        return slider.label
+    return None
+
+
+def bench_page(page_key, repeat=3, timeout=120):
+    """Benchmark one page key and return a result dict"""
+    result = {'import_s': round(cold_import_cost(page_key), 4)}
+
+    # Import outside the timed runs so first_run_s is pure render cost
+    importlib.import_module(PAGES[page_key][0])
+
+    first_runs = []
+    slider_reruns = []
+    slider_label = None
+    errors = []
+
+    for _ in range(repeat):
+        at = _new_app(page_key, timeout)
+        first_runs.append(_timed_run(at))
+        errors.extend(e.value for e in at.exception)
+
+        slider_label = _move_first_slider(at)
+        if slider_label is None:
+            continue
+        slider_reruns.append(_timed_run(at))
+        errors.extend(e.value for e in at.exception)
+
+    result['first_run_s'] = round(statistics.median(first_runs), 4)
+    result['slider_rerun_s'] = round(statistics.median(slider_reruns), 4) if slider_reruns else None
+    result['slider'] = slider_label
+    result['errors'] = sorted(set(errors))
+    return result
+
+
+def run_benchmarks(page_keys, repeat=3, timeout=120):
+    # Warm Streamlit itself up so the first page measured isn't penalised
+    _new_app('home', timeout).run()
+
+    pages = {}
+    for page_key in page_keys:
+        pages[page_key] = bench_page(page_key, repeat=repeat, timeout=timeout)
+        print(f"{page_key:<28} import {pages[page_key]['import_s']:7.3f}s  "
+              f"first run {pages[page_key]['first_run_s']:7.3f}s  "
+              f"slider rerun {pages[page_key]['slider_rerun_s'] or 0:7.3f}s",
+              file=sys.stderr)
+
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'repeat': repeat,
+        },
+        'pages': pages,
+    }
+
+
+def compare(current, baseline):
+    """Print per-page timing deltas against a previous results file"""
+    metrics = ['import_s', 'first_run_s', 'slider_rerun_s']
+    print(f"{'page':<28}" + "".join(f"{m:>24}" for m in metrics))
+    for page_key, row in current['pages'].items():
+        old = baseline['pages'].get(page_key)
+        if old is None:
+            continue
+        cells = []
+        for metric in metrics:
+            if row.get(metric) is None or not old.get(metric):
+                cells.append(f"{'-':>24}")
+                continue
+            change = (row[metric] - old[metric]) / old[metric] * 100
+            cells.append(f"{old[metric]:8.3f} → {row[metric]:7.3f} {change:+5.0f}%")
+        print(f"{page_key:<28}" + "".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--output', default=os.path.join(REPO_ROOT, 'benchmarks', 'results.json'))
+    parser.add_argument('-p', '--pages', nargs='+', choices=list(PAGES), default=list(PAGES))
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('--compare', help="previous results JSON to diff against")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.pages, repeat=args.repeat, timeout=args.timeout)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write('\n')
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
 from math import log
+from modules.figure_cache import show_figure
 
 # Custom CSS for better styling
 st.markdown("""
@@ -147,85 +147,8 @@ def show_exponential_functions():
     months = np.arange(1, months_to_show + 1)
     customers = initial_customers * (growth_multiplier ** (months - 1))
     
-    # Create comprehensive visualization
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-    
-    # Plot 1: Exponential Growth Curve
-    ax1.plot(months, customers, 'b-', linewidth=3, label=f'Customers = {initial_customers} × {growth_multiplier:.2f}^(Month-1)')
-    ax1.scatter(months[:6], customers[:6], color='red', s=100, zorder=5, label='First 6 Months')
-    
-    # Highlight key points
-    month_6_customers = initial_customers * (growth_multiplier ** 5)
-    month_12_customers = initial_customers * (growth_multiplier ** 11)
-    
-    ax1.plot(6, month_6_customers, 'go', markersize=12, label=f'Month 6: {month_6_customers:.0f} customers')
-    if months_to_show >= 12:
-        ax1.plot(12, month_12_customers, 'ro', markersize=12, label=f'Month 12: {month_12_customers:.0f} customers')
-    
-    ax1.set_xlabel('Month')
-    ax1.set_ylabel('Regular Customers')
-    ax1.set_title('Maya\'s Customer Growth: The Exponential Curve')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # Plot 2: Linear vs Exponential Comparison
-    linear_growth = initial_customers + (months - 1) * (growth_rate * initial_customers / 100)
-    
-    ax2.plot(months, customers, 'b-', linewidth=3, label=f'Exponential ({growth_rate}% monthly)')
-    ax2.plot(months, linear_growth, 'r--', linewidth=3, label=f'Linear (+{growth_rate * initial_customers / 100:.0f} customers/month)')
-    
-    ax2.set_xlabel('Month')
-    ax2.set_ylabel('Customers')
-    ax2.set_title('Why Exponential Growth is Powerful')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-    
-    # Add annotation showing the difference
-    if months_to_show >= 8:
-        month_8_exp = initial_customers * (growth_multiplier ** 7)
-        month_8_lin = initial_customers + 7 * (growth_rate * initial_customers / 100)
-        difference = month_8_exp - month_8_lin
-        ax2.annotate(f'Month 8 difference:\n{difference:.0f} customers!', 
-                    xy=(8, month_8_exp), xytext=(10, month_8_exp * 0.7),
-                    arrowprops=dict(arrowstyle='->', color='green'),
-                    fontsize=10, ha='center')
-    
-    # Plot 3: Monthly Growth Analysis
-    monthly_growth = np.diff(customers)
-    monthly_growth = np.insert(monthly_growth, 0, 0)  # Add 0 for month 1
-    
-    ax3.bar(months, monthly_growth, alpha=0.7, color='orange', label='New Customers Each Month')
-    ax3.set_xlabel('Month')
-    ax3.set_ylabel('New Customers Added')
-    ax3.set_title('Accelerating Monthly Growth')
-    ax3.legend()
-    ax3.grid(True, alpha=0.3)
-    
-    # Plot 4: Doubling Time Analysis
-    # Calculate when customer base doubles, triples, etc.
-    multiples = [2, 3, 4, 5]
-    doubling_times = []
-    
-    for multiple in multiples:
-        target = initial_customers * multiple
-        # Solve: target = initial_customers * (growth_multiplier)^(t-1)
-        # t = log(target/initial_customers) / log(growth_multiplier) + 1
-        if growth_multiplier > 1:
-            time_to_reach = log(multiple) / log(growth_multiplier) + 1
-            doubling_times.append(time_to_reach)
-        else:
-            doubling_times.append(float('inf'))
-    
-    ax4.bar(range(len(multiples)), doubling_times, color=['green', 'blue', 'orange', 'red'])
-    ax4.set_xlabel('Multiple of Initial Customers')
-    ax4.set_ylabel('Months to Reach')
-    ax4.set_title('Time to Reach Customer Milestones')
-    ax4.set_xticks(range(len(multiples)))
-    ax4.set_xticklabels([f'{m}x\n({initial_customers * m:.0f})' for m in multiples])
-    ax4.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
+    # Dashboard image, rendered once per slider combination and shared across sessions
+    show_figure(_draw_growth_dashboard, initial_customers, growth_rate, months_to_show)
     
     # Mathematical Representation
     st.header("🧮 Maya's Exponential Equation")
@@ -536,4 +459,87 @@ def show_exponential_functions():
     with nav_col3:
         if st.button("Logarithmic Functions →"):
             st.session_state.page = 'algebra_logarithmic'
-            st.rerun()
\ No newline at end of file
+            st.rerun()
+
+
+def _draw_growth_dashboard(fig, initial_customers, growth_rate, months_to_show):
+    """Growth curve, linear comparison, monthly additions and milestone times"""
+    growth_multiplier = 1 + (growth_rate / 100)
+    months = np.arange(1, months_to_show + 1)
+    customers = initial_customers * (growth_multiplier ** (months - 1))
+    
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+    
+    # Plot 1: Exponential Growth Curve
+    ax1.plot(months, customers, 'b-', linewidth=3, label=f'Customers = {initial_customers} × {growth_multiplier:.2f}^(Month-1)')
+    ax1.scatter(months[:6], customers[:6], color='red', s=100, zorder=5, label='First 6 Months')
+    
+    # Highlight key points
+    month_6_customers = initial_customers * (growth_multiplier ** 5)
+    month_12_customers = initial_customers * (growth_multiplier ** 11)
+    
+    ax1.plot(6, month_6_customers, 'go', markersize=12, label=f'Month 6: {month_6_customers:.0f} customers')
+    if months_to_show >= 12:
+        ax1.plot(12, month_12_customers, 'ro', markersize=12, label=f'Month 12: {month_12_customers:.0f} customers')
+    
+    ax1.set_xlabel('Month')
+    ax1.set_ylabel('Regular Customers')
+    ax1.set_title('Maya\'s Customer Growth: The Exponential Curve')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    
+    # Plot 2: Linear vs Exponential Comparison
+    linear_growth = initial_customers + (months - 1) * (growth_rate * initial_customers / 100)
+    
+    ax2.plot(months, customers, 'b-', linewidth=3, label=f'Exponential ({growth_rate}% monthly)')
+    ax2.plot(months, linear_growth, 'r--', linewidth=3, label=f'Linear (+{growth_rate * initial_customers / 100:.0f} customers/month)')
+    
+    ax2.set_xlabel('Month')
+    ax2.set_ylabel('Customers')
+    ax2.set_title('Why Exponential Growth is Powerful')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    
+    # Add annotation showing the difference
+    if months_to_show >= 8:
+        month_8_exp = initial_customers * (growth_multiplier ** 7)
+        month_8_lin = initial_customers + 7 * (growth_rate * initial_customers / 100)
+        difference = month_8_exp - month_8_lin
+        ax2.annotate(f'Month 8 difference:\n{difference:.0f} customers!', 
+                    xy=(8, month_8_exp), xytext=(10, month_8_exp * 0.7),
+                    arrowprops=dict(arrowstyle='->', color='green'),
+                    fontsize=10, ha='center')
+    
+    # Plot 3: Monthly Growth Analysis
+    monthly_growth = np.diff(customers)
+    monthly_growth = np.insert(monthly_growth, 0, 0)  # Add 0 for month 1
+    
+    ax3.bar(months, monthly_growth, alpha=0.7, color='orange', label='New Customers Each Month')
+    ax3.set_xlabel('Month')
+    ax3.set_ylabel('New Customers Added')
+    ax3.set_title('Accelerating Monthly Growth')
+    ax3.legend()
+    ax3.grid(True, alpha=0.3)
+    
+    # Plot 4: Doubling Time Analysis
+    # Calculate when customer base doubles, triples, etc.
+    multiples = [2, 3, 4, 5]
+    doubling_times = []
+    
+    for multiple in multiples:
+        target = initial_customers * multiple
+        # Solve: target = initial_customers * (growth_multiplier)^(t-1)
+        # t = log(target/initial_customers) / log(growth_multiplier) + 1
+        if growth_multiplier > 1:
+            time_to_reach = log(multiple) / log(growth_multiplier) + 1
+            doubling_times.append(time_to_reach)
+        else:
+            doubling_times.append(float('inf'))
+    
+    ax4.bar(range(len(multiples)), doubling_times, color=['green', 'blue', 'orange', 'red'])
+    ax4.set_xlabel('Multiple of Initial Customers')
+    ax4.set_ylabel('Months to Reach')
+    ax4.set_title('Time to Reach Customer Milestones')
+    ax4.set_xticks(range(len(multiples)))
+    ax4.set_xticklabels([f'{m}x\n({initial_customers * m:.0f})' for m in multiples])
+    ax4.grid(True, alpha=0.3)
@@ -1,8 +1,8 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
 from math import sqrt
+from modules.figure_cache import show_figure
 
 # Custom CSS for better styling
 st.markdown("""
@@ -148,113 +148,10 @@ def show_inverse_functions():
                                help="How sensitive customers are to price changes")
     
     # Define forward and inverse functions
-    def forward_function(price):
-        return max_sales - sensitivity * (price - optimal_price)**2
-    
-    def inverse_function(sales):
-        if sales > max_sales:
-            return None, None  # Impossible sales target
-        discriminant = (max_sales - sales) / sensitivity
-        if discriminant < 0:
-            return None, None
-        sqrt_val = sqrt(discriminant)
-        price1 = optimal_price - sqrt_val
-        price2 = optimal_price + sqrt_val
-        return price1, price2
+    forward_function, inverse_function = _demand_functions(optimal_price, max_sales, sensitivity)
     
-    # Generate data for visualization
-    price_range = np.linspace(5, 25, 200)
-    sales_from_price = np.array([max(0, forward_function(p)) for p in price_range])
-    
-    # Create comprehensive visualization
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-    
-    # Plot 1: Original Function (Price → Sales)
-    ax1.plot(price_range, sales_from_price, 'b-', linewidth=3, label=f'Sales = {max_sales} - {sensitivity}×(Price - {optimal_price})²')
-    ax1.scatter([optimal_price], [max_sales], color='red', s=100, zorder=5, label=f'Peak: ₹{optimal_price} → {max_sales} cups')
-    
-    # Add example points
-    example_prices = [12, 15, 18]
-    for ep in example_prices:
-        es = forward_function(ep)
-        if es > 0:
-            ax1.scatter([ep], [es], color='orange', s=60, zorder=4)
-            ax1.annotate(f'₹{ep}→{es:.0f}cups', xy=(ep, es), xytext=(ep, es+10),
-                        ha='center', fontsize=9)
-    
-    ax1.set_xlabel('Price (₹)')
-    ax1.set_ylabel('Sales (cups)')
-    ax1.set_title('Forward Function: Price → Sales')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # Plot 2: Inverse Function (Sales → Price)
-    # We need to flip the axes for the inverse
-    ax2.plot(sales_from_price, price_range, 'g-', linewidth=3, label='Inverse: Sales → Price')
-    ax2.scatter([max_sales], [optimal_price], color='red', s=100, zorder=5, label=f'Peak: {max_sales} cups → ₹{optimal_price}')
-    
-    # Add example points for inverse
-    example_sales = [200, 225, 240]
-    for es in example_sales:
-        if es <= max_sales:
-            p1, p2 = inverse_function(es)
-            if p1 is not None and p2 is not None:
-                ax2.scatter([es, es], [p1, p2], color='orange', s=60, zorder=4)
-                ax2.annotate(f'{es}→₹{p1:.1f}', xy=(es, p1), xytext=(es-15, p1),
-                           ha='center', fontsize=9)
-                ax2.annotate(f'{es}→₹{p2:.1f}', xy=(es, p2), xytext=(es-15, p2),
-                           ha='center', fontsize=9)
-    
-    ax2.set_xlabel('Sales (cups)')
-    ax2.set_ylabel('Price (₹)')
-    ax2.set_title('Inverse Function: Sales → Price')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-    
-    # Plot 3: Revenue Analysis
-    revenue = price_range * sales_from_price
-    ax3.plot(price_range, revenue, 'purple', linewidth=3, label='Revenue = Price × Sales')
-    
-    # Find maximum revenue point
-    max_revenue_idx = np.argmax(revenue)
-    max_revenue_price = price_range[max_revenue_idx]
-    max_revenue_value = revenue[max_revenue_idx]
-    
-    ax3.scatter([max_revenue_price], [max_revenue_value], color='red', s=100, zorder=5,
-               label=f'Max Revenue: ₹{max_revenue_value:.0f} at ₹{max_revenue_price:.1f}')
-    
-    ax3.set_xlabel('Price (₹)')
-    ax3.set_ylabel('Revenue (₹)')
-    ax3.set_title('Revenue Optimization Using Inverse Thinking')
-    ax3.legend()
-    ax3.grid(True, alpha=0.3)
-    
-    # Plot 4: Multiple Solutions Demonstration
-    target_sales = 200
-    if target_sales <= max_sales:
-        p1, p2 = inverse_function(target_sales)
-        if p1 is not None and p2 is not None:
-            # Show both solutions
-            ax4.plot(price_range, sales_from_price, 'b-', linewidth=2, alpha=0.7, label='Sales Function')
-            ax4.axhline(y=target_sales, color='red', linestyle='--', alpha=0.7, label=f'Target: {target_sales} cups')
-            ax4.scatter([p1, p2], [target_sales, target_sales], color='red', s=100, zorder=5)
-            
-            # Add annotations
-            ax4.annotate(f'Solution 1:\n₹{p1:.2f}', xy=(p1, target_sales), 
-                        xytext=(p1, target_sales+20), ha='center', fontsize=10,
-                        arrowprops=dict(arrowstyle='->', color='red'))
-            ax4.annotate(f'Solution 2:\n₹{p2:.2f}', xy=(p2, target_sales), 
-                        xytext=(p2, target_sales+20), ha='center', fontsize=10,
-                        arrowprops=dict(arrowstyle='->', color='red'))
-            
-            ax4.set_xlabel('Price (₹)')
-            ax4.set_ylabel('Sales (cups)')
-            ax4.set_title(f'Two Prices Give Same Sales: {target_sales} cups')
-            ax4.legend()
-            ax4.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
+    # Dashboard image, rendered once per slider combination and shared across sessions
+    show_figure(_draw_inverse_dashboard, optimal_price, max_sales, sensitivity)
     
     # Mathematical Representation
     st.header("🧮 Maya's Forward and Inverse Equations")
@@ -626,4 +523,118 @@ def show_inverse_functions():
             st.session_state.page = 'algebra'
             st.rerun()
     
-    
\ No newline at end of file
+    
+
+
+def _demand_functions(optimal_price, max_sales, sensitivity):
+    """Forward (price → sales) and inverse (sales → two prices) demand functions"""
+    def forward_function(price):
+        return max_sales - sensitivity * (price - optimal_price)**2
+    
+    def inverse_function(sales):
+        if sales > max_sales:
+            return None, None  # Impossible sales target
+        discriminant = (max_sales - sales) / sensitivity
+        if discriminant < 0:
+            return None, None
+        sqrt_val = sqrt(discriminant)
+        price1 = optimal_price - sqrt_val
+        price2 = optimal_price + sqrt_val
+        return price1, price2
+    
+    return forward_function, inverse_function
+
+
+def _draw_inverse_dashboard(fig, optimal_price, max_sales, sensitivity):
+    """Forward and inverse demand, revenue and the two-prices-one-target plot"""
+    forward_function, inverse_function = _demand_functions(optimal_price, max_sales, sensitivity)
+    
+    # Generate data for visualization
+    price_range = np.linspace(5, 25, 200)
+    sales_from_price = np.array([max(0, forward_function(p)) for p in price_range])
+    
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+    
+    # Plot 1: Original Function (Price → Sales)
+    ax1.plot(price_range, sales_from_price, 'b-', linewidth=3, label=f'Sales = {max_sales} - {sensitivity}×(Price - {optimal_price})²')
+    ax1.scatter([optimal_price], [max_sales], color='red', s=100, zorder=5, label=f'Peak: ₹{optimal_price} → {max_sales} cups')
+    
+    # Add example points
+    example_prices = [12, 15, 18]
+    for ep in example_prices:
+        es = forward_function(ep)
+        if es > 0:
+            ax1.scatter([ep], [es], color='orange', s=60, zorder=4)
+            ax1.annotate(f'₹{ep}→{es:.0f}cups', xy=(ep, es), xytext=(ep, es+10),
+                        ha='center', fontsize=9)
+    
+    ax1.set_xlabel('Price (₹)')
+    ax1.set_ylabel('Sales (cups)')
+    ax1.set_title('Forward Function: Price → Sales')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    
+    # Plot 2: Inverse Function (Sales → Price)
+    # We need to flip the axes for the inverse
+    ax2.plot(sales_from_price, price_range, 'g-', linewidth=3, label='Inverse: Sales → Price')
+    ax2.scatter([max_sales], [optimal_price], color='red', s=100, zorder=5, label=f'Peak: {max_sales} cups → ₹{optimal_price}')
+    
+    # Add example points for inverse
+    example_sales = [200, 225, 240]
+    for es in example_sales:
+        if es <= max_sales:
+            p1, p2 = inverse_function(es)
+            if p1 is not None and p2 is not None:
+                ax2.scatter([es, es], [p1, p2], color='orange', s=60, zorder=4)
+                ax2.annotate(f'{es}→₹{p1:.1f}', xy=(es, p1), xytext=(es-15, p1),
+                           ha='center', fontsize=9)
+                ax2.annotate(f'{es}→₹{p2:.1f}', xy=(es, p2), xytext=(es-15, p2),
+                           ha='center', fontsize=9)
+    
+    ax2.set_xlabel('Sales (cups)')
+    ax2.set_ylabel('Price (₹)')
+    ax2.set_title('Inverse Function: Sales → Price')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    
+    # Plot 3: Revenue Analysis
+    revenue = price_range * sales_from_price
+    ax3.plot(price_range, revenue, 'purple', linewidth=3, label='Revenue = Price × Sales')
+    
+    # Find maximum revenue point
+    max_revenue_idx = np.argmax(revenue)
+    max_revenue_price = price_range[max_revenue_idx]
+    max_revenue_value = revenue[max_revenue_idx]
+    
+    ax3.scatter([max_revenue_price], [max_revenue_value], color='red', s=100, zorder=5,
+               label=f'Max Revenue: ₹{max_revenue_value:.0f} at ₹{max_revenue_price:.1f}')
+    
+    ax3.set_xlabel('Price (₹)')
+    ax3.set_ylabel('Revenue (₹)')
+    ax3.set_title('Revenue Optimization Using Inverse Thinking')
+    ax3.legend()
+    ax3.grid(True, alpha=0.3)
+    
+    # Plot 4: Multiple Solutions Demonstration
+    target_sales = 200
+    if target_sales <= max_sales:
+        p1, p2 = inverse_function(target_sales)
+        if p1 is not None and p2 is not None:
+            # Show both solutions
+            ax4.plot(price_range, sales_from_price, 'b-', linewidth=2, alpha=0.7, label='Sales Function')
+            ax4.axhline(y=target_sales, color='red', linestyle='--', alpha=0.7, label=f'Target: {target_sales} cups')
+            ax4.scatter([p1, p2], [target_sales, target_sales], color='red', s=100, zorder=5)
+            
+            # Add annotations
+            ax4.annotate(f'Solution 1:\n₹{p1:.2f}', xy=(p1, target_sales), 
+                        xytext=(p1, target_sales+20), ha='center', fontsize=10,
+                        arrowprops=dict(arrowstyle='->', color='red'))
+            ax4.annotate(f'Solution 2:\n₹{p2:.2f}', xy=(p2, target_sales), 
+                        xytext=(p2, target_sales+20), ha='center', fontsize=10,
+                        arrowprops=dict(arrowstyle='->', color='red'))
+            
+            ax4.set_xlabel('Price (₹)')
+            ax4.set_ylabel('Sales (cups)')
+            ax4.set_title(f'Two Prices Give Same Sales: {target_sales} cups')
+            ax4.legend()
+            ax4.grid(True, alpha=0.3)
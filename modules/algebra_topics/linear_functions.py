@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
+from modules.figure_cache import show_figure
 
 
 # Custom CSS for better styling
@@ -139,76 +139,8 @@ def show_linear_functions():
     """)
     st.markdown('</div>', unsafe_allow_html=True)
     
-    # Generate data for visualization
-    cups_range = np.arange(0, 15001, 500)
-    total_cost = fixed_costs + variable_cost * cups_range
-    total_revenue = selling_price * cups_range
-    profit = total_revenue - total_cost
-    
-    # Create comprehensive visualization
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-    
-    # Plot 1: Cost vs Revenue vs Profit
-    ax1.plot(cups_range, total_cost, 'r-', linewidth=2, label=f'Total Cost (₹{fixed_costs:,} + ₹{variable_cost}n)')
-    ax1.plot(cups_range, total_revenue, 'g-', linewidth=2, label=f'Total Revenue (₹{selling_price}n)')
-    ax1.plot(cups_range, profit, 'b-', linewidth=2, label=f'Profit (₹{profit_per_cup}n - ₹{fixed_costs:,})')
-    
-    # Add break-even point
-    if break_even_cups <= 15000:
-        ax1.axvline(x=break_even_cups, color='orange', linestyle='--', linewidth=2, 
-                   label=f'Break-even: {break_even_cups:.0f} cups')
-        ax1.plot(break_even_cups, selling_price * break_even_cups, 'ro', markersize=8)
-    
-    ax1.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    ax1.set_xlabel('Cups Sold per Month')
-    ax1.set_ylabel('Amount (₹)')
-    ax1.set_title('Maya\'s Tea Stall: Complete Financial Overview')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    ax1.ticklabel_format(style='plain', axis='y')
-    
-    # Plot 2: Profit zones
-    ax2.fill_between(cups_range, profit, 0, where=(profit >= 0), alpha=0.3, color='green', label='Profit Zone')
-    ax2.fill_between(cups_range, profit, 0, where=(profit < 0), alpha=0.3, color='red', label='Loss Zone')
-    ax2.plot(cups_range, profit, 'b-', linewidth=2, label='Profit Line')
-    if break_even_cups <= 15000:
-        ax2.axvline(x=break_even_cups, color='orange', linestyle='--', linewidth=2, label='Break-even')
-    ax2.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    ax2.set_xlabel('Cups Sold per Month')
-    ax2.set_ylabel('Profit (₹)')
-    ax2.set_title('Profit Analysis: When Does Maya Make Money?')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-    
-    # Plot 3: Daily breakdown
-    daily_cups = cups_range / 30
-    daily_profit = profit / 30
-    ax3.plot(daily_cups, daily_profit, 'purple', linewidth=2)
-    ax3.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    if break_even_daily <= 500:
-        ax3.axvline(x=break_even_daily, color='orange', linestyle='--', linewidth=2, 
-                   label=f'Daily break-even: {break_even_daily:.0f} cups')
-    ax3.set_xlabel('Cups Sold per Day')
-    ax3.set_ylabel('Daily Profit (₹)')
-    ax3.set_title('Daily Profit Target')
-    ax3.legend()
-    ax3.grid(True, alpha=0.3)
-    
-    # Plot 4: Hourly breakdown
-    hourly_cups = daily_cups / 12
-    ax4.plot(hourly_cups, daily_profit, 'brown', linewidth=2)
-    ax4.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    if break_even_hourly <= 50:
-        ax4.axvline(x=break_even_hourly, color='orange', linestyle='--', linewidth=2, 
-                   label=f'Hourly break-even: {break_even_hourly:.1f} cups')
-    ax4.set_xlabel('Cups Sold per Hour')
-    ax4.set_ylabel('Daily Profit (₹)')
-    ax4.set_title('Hourly Sales Target (12-hour operation)')
-    ax4.legend()
-    ax4.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
+    # Dashboard image, rendered once per slider combination and shared across sessions
+    show_figure(_draw_business_dashboard, fixed_costs, variable_cost, selling_price)
     
     # Key Business Metrics
     st.header("📊 Maya's Business Dashboard")
@@ -432,3 +364,77 @@ def show_linear_functions():
                - **Better choice:** {"New location" if new_profit_10k > old_profit_10k else "Current location"}
             """)
 
+
+def _draw_business_dashboard(fig, fixed_costs, variable_cost, selling_price):
+    """Cost/revenue/profit overview with daily and hourly break-even targets"""
+    profit_per_cup = selling_price - variable_cost
+    break_even_cups = fixed_costs / profit_per_cup if profit_per_cup > 0 else float('inf')
+    break_even_daily = break_even_cups / 30
+    break_even_hourly = break_even_daily / 12  # Assuming 12 hours operation
+    
+    # Generate data for visualization
+    cups_range = np.arange(0, 15001, 500)
+    total_cost = fixed_costs + variable_cost * cups_range
+    total_revenue = selling_price * cups_range
+    profit = total_revenue - total_cost
+    
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+    
+    # Plot 1: Cost vs Revenue vs Profit
+    ax1.plot(cups_range, total_cost, 'r-', linewidth=2, label=f'Total Cost (₹{fixed_costs:,} + ₹{variable_cost}n)')
+    ax1.plot(cups_range, total_revenue, 'g-', linewidth=2, label=f'Total Revenue (₹{selling_price}n)')
+    ax1.plot(cups_range, profit, 'b-', linewidth=2, label=f'Profit (₹{profit_per_cup}n - ₹{fixed_costs:,})')
+    
+    # Add break-even point
+    if break_even_cups <= 15000:
+        ax1.axvline(x=break_even_cups, color='orange', linestyle='--', linewidth=2, 
+                   label=f'Break-even: {break_even_cups:.0f} cups')
+        ax1.plot(break_even_cups, selling_price * break_even_cups, 'ro', markersize=8)
+    
+    ax1.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+    ax1.set_xlabel('Cups Sold per Month')
+    ax1.set_ylabel('Amount (₹)')
+    ax1.set_title('Maya\'s Tea Stall: Complete Financial Overview')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    ax1.ticklabel_format(style='plain', axis='y')
+    
+    # Plot 2: Profit zones
+    ax2.fill_between(cups_range, profit, 0, where=(profit >= 0), alpha=0.3, color='green', label='Profit Zone')
+    ax2.fill_between(cups_range, profit, 0, where=(profit < 0), alpha=0.3, color='red', label='Loss Zone')
+    ax2.plot(cups_range, profit, 'b-', linewidth=2, label='Profit Line')
+    if break_even_cups <= 15000:
+        ax2.axvline(x=break_even_cups, color='orange', linestyle='--', linewidth=2, label='Break-even')
+    ax2.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+    ax2.set_xlabel('Cups Sold per Month')
+    ax2.set_ylabel('Profit (₹)')
+    ax2.set_title('Profit Analysis: When Does Maya Make Money?')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    
+    # Plot 3: Daily breakdown
+    daily_cups = cups_range / 30
+    daily_profit = profit / 30
+    ax3.plot(daily_cups, daily_profit, 'purple', linewidth=2)
+    ax3.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+    if break_even_daily <= 500:
+        ax3.axvline(x=break_even_daily, color='orange', linestyle='--', linewidth=2, 
+                   label=f'Daily break-even: {break_even_daily:.0f} cups')
+    ax3.set_xlabel('Cups Sold per Day')
+    ax3.set_ylabel('Daily Profit (₹)')
+    ax3.set_title('Daily Profit Target')
+    ax3.legend()
+    ax3.grid(True, alpha=0.3)
+    
+    # Plot 4: Hourly breakdown
+    hourly_cups = daily_cups / 12
+    ax4.plot(hourly_cups, daily_profit, 'brown', linewidth=2)
+    ax4.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+    if break_even_hourly <= 50:
+        ax4.axvline(x=break_even_hourly, color='orange', linestyle='--', linewidth=2, 
+                   label=f'Hourly break-even: {break_even_hourly:.1f} cups')
+    ax4.set_xlabel('Cups Sold per Hour')
+    ax4.set_ylabel('Daily Profit (₹)')
+    ax4.set_title('Hourly Sales Target (12-hour operation)')
+    ax4.legend()
+    ax4.grid(True, alpha=0.3)
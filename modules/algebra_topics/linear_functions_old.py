@@ -1,9 +1,8 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 from fpdf import FPDF
-import base64
 from datetime import datetime
+from modules.figures import managed_figure
 
 def create_pdf_report(selling_price, cost_per_pizza, fixed_costs, profit_per_pizza, break_even_point):
     """Create a PDF report with the current analysis"""
@@ -156,43 +155,44 @@ def show_linear_functions():
         break_even_point = float('inf')
     
     # Create the graph
-    fig, ax = plt.subplots(figsize=(12, 7))
-    
-    # Plot profit line
-    ax.plot(pizzas_sold, total_profit, 'b-', linewidth=3, label=f'Profit Line (${profit_per_pizza}/pizza)')
-    
-    # Add break-even point
-    if break_even_point <= 100:
-        ax.axvline(x=break_even_point, color='red', linestyle='--', linewidth=2, 
-                  label=f'Break-even: {break_even_point:.1f} pizzas')
-        ax.plot(break_even_point, 0, 'ro', markersize=10)
-        ax.annotate(f'Break-even\n{break_even_point:.1f} pizzas', 
-                   xy=(break_even_point, 0), xytext=(break_even_point + 15, 100),
-                   arrowprops=dict(arrowstyle='->', color='red'),
-                   fontsize=10, ha='center')
-    
-    # Add zero line
-    ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    
-    # Color areas
-    ax.fill_between(pizzas_sold, total_profit, 0, where=(total_profit >= 0), 
-                   alpha=0.3, color='green', label='Profit Zone')
-    ax.fill_between(pizzas_sold, total_profit, 0, where=(total_profit < 0), 
-                   alpha=0.3, color='red', label='Loss Zone')
-    
-    # Formatting
-    ax.set_xlabel('Number of Pizzas Sold', fontsize=12)
-    ax.set_ylabel('Daily Profit ($)', fontsize=12)
-    ax.set_title('Pizza Palace: Daily Profit Analysis', fontsize=14, fontweight='bold')
-    ax.grid(True, alpha=0.3)
-    ax.legend(loc='upper left')
-    
-    # Set reasonable axis limits
-    ax.set_xlim(0, 100)
-    ax.set_ylim(-300, 500)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
+    with managed_figure(figsize=(12, 7)) as fig:
+        ax = fig.subplots()
+    
+        # Plot profit line
+        ax.plot(pizzas_sold, total_profit, 'b-', linewidth=3, label=f'Profit Line (${profit_per_pizza}/pizza)')
+    
+        # Add break-even point
+        if break_even_point <= 100:
+            ax.axvline(x=break_even_point, color='red', linestyle='--', linewidth=2, 
+                      label=f'Break-even: {break_even_point:.1f} pizzas')
+            ax.plot(break_even_point, 0, 'ro', markersize=10)
+            ax.annotate(f'Break-even\n{break_even_point:.1f} pizzas', 
+                       xy=(break_even_point, 0), xytext=(break_even_point + 15, 100),
+                       arrowprops=dict(arrowstyle='->', color='red'),
+                       fontsize=10, ha='center')
+    
+        # Add zero line
+        ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+    
+        # Color areas
+        ax.fill_between(pizzas_sold, total_profit, 0, where=(total_profit >= 0), 
+                       alpha=0.3, color='green', label='Profit Zone')
+        ax.fill_between(pizzas_sold, total_profit, 0, where=(total_profit < 0), 
+                       alpha=0.3, color='red', label='Loss Zone')
+    
+        # Formatting
+        ax.set_xlabel('Number of Pizzas Sold', fontsize=12)
+        ax.set_ylabel('Daily Profit ($)', fontsize=12)
+        ax.set_title('Pizza Palace: Daily Profit Analysis', fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='upper left')
+    
+        # Set reasonable axis limits
+        ax.set_xlim(0, 100)
+        ax.set_ylim(-300, 500)
+    
+        fig.tight_layout()
+        st.pyplot(fig)
     
     # Download Report Button
     st.subheader("📄 Download Analysis Report")
@@ -205,10 +205,13 @@ def show_linear_functions():
                 pdf_bytes = create_pdf_report(selling_price, cost_per_pizza, fixed_costs, 
                                             profit_per_pizza, break_even_point)
                 
-                b64_pdf = base64.b64encode(pdf_bytes).decode()
-                href = f'<a href="data:application/pdf;base64,{b64_pdf}" download="pizza_palace_analysis.pdf">Click here to download PDF</a>'
-                st.markdown(href, unsafe_allow_html=True)
-                st.success("✅ PDF report generated! Click the link above to download.")
+                st.download_button(
+                    "📥 Download PDF",
+                    pdf_bytes,
+                    file_name="pizza_palace_analysis.pdf",
+                    mime="application/pdf"
+                )
+                st.success("✅ PDF report generated! Click the button above to download.")
                 
             except Exception as e:
                 st.error("PDF generation requires fpdf2 library. Install with: pip install fpdf2")
@@ -1,8 +1,8 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
 from math import log, log2
+from modules.figure_cache import show_figure
 
 # Custom CSS for better styling
 st.markdown("""
@@ -153,100 +153,11 @@ def show_logarithmic_functions():
         max_weeks = st.slider("Weeks to Show", 16, 128, 64, 16,
                              help="How far to project Maya's learning curve")
     
-    # Generate logarithmic data
-    weeks_range = np.logspace(0, log2(max_weeks), 100, base=2)  # From 1 to max_weeks, logarithmically spaced
-    
     # Maya's logarithmic equation: Skill = base_skill + improvement_per_doubling * log2(weeks)
-    def maya_skill(weeks):
-        return base_skill + improvement_per_doubling * np.log2(weeks)
-    
-    skills = maya_skill(weeks_range)
-    
-    # Create comprehensive visualization
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-    
-    # Plot 1: The Logarithmic Learning Curve
-    ax1.plot(weeks_range, skills, 'b-', linewidth=3, label=f'Skill = {base_skill} + {improvement_per_doubling} × log₂(weeks)')
-    
-    # Add Maya's actual data points for key weeks
-    key_weeks = [1, 2, 4, 8, 16, 32]
-    key_skills = [maya_skill(w) for w in key_weeks if w <= max_weeks]
-    key_weeks_filtered = [w for w in key_weeks if w <= max_weeks]
-    
-    ax1.scatter(key_weeks_filtered, key_skills, color='red', s=100, zorder=5, label='Maya\'s Practice Milestones')
-    
-    # Highlight plateau effect
-    plateau_weeks = max_weeks * 0.8
-    plateau_skill = maya_skill(plateau_weeks)
-    ax1.plot(plateau_weeks, plateau_skill, 'go', markersize=12, label=f'Plateau Region: {plateau_skill:.1f} cups/hour')
+    maya_skill = _skill_curve(base_skill, improvement_per_doubling)
     
-    ax1.set_xlabel('Weeks of Practice')
-    ax1.set_ylabel('Cups per Hour')
-    ax1.set_title('Maya\'s Learning Curve: Diminishing Returns')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xscale('log', base=2)
-    
-    # Plot 2: Linear vs Logarithmic Comparison
-    # Linear improvement would be: base_skill + (weeks - 1) * improvement_rate
-    linear_improvement_rate = improvement_per_doubling / 2  # Approximate linear rate
-    linear_skills = base_skill + (weeks_range - 1) * linear_improvement_rate
-    
-    ax2.plot(weeks_range, skills, 'b-', linewidth=3, label='Logarithmic (Real Learning)')
-    ax2.plot(weeks_range, linear_skills, 'r--', linewidth=3, label='Linear (Unrealistic)')
-    
-    ax2.set_xlabel('Weeks of Practice')
-    ax2.set_ylabel('Cups per Hour')
-    ax2.set_title('Why Learning Follows Logarithmic Pattern')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-    
-    # Add annotation showing the difference
-    mid_weeks = max_weeks / 4
-    log_skill_mid = maya_skill(mid_weeks)
-    lin_skill_mid = base_skill + (mid_weeks - 1) * linear_improvement_rate
-    
-    ax2.annotate(f'Reality: Diminishing returns\nmake improvement harder', 
-                xy=(mid_weeks, log_skill_mid), xytext=(mid_weeks * 2, log_skill_mid + 5),
-                arrowprops=dict(arrowstyle='->', color='blue'),
-                fontsize=10, ha='center')
-    
-    # Plot 3: Improvement Rate Analysis
-    # Calculate the derivative (rate of improvement)
-    weeks_for_derivative = weeks_range[1:]
-    improvement_rate = np.diff(skills) / np.diff(weeks_range)
-    
-    ax3.plot(weeks_for_derivative, improvement_rate, 'purple', linewidth=3, label='Rate of Improvement')
-    ax3.set_xlabel('Weeks of Practice')
-    ax3.set_ylabel('Cups/Hour Improvement per Week')
-    ax3.set_title('Why Maya Gets Frustrated: Slowing Improvement Rate')
-    ax3.legend()
-    ax3.grid(True, alpha=0.3)
-    
-    ax3.annotate('Fast improvement\nat the beginning', 
-                xy=(2, improvement_rate[10]), xytext=(8, improvement_rate[10] + 0.5),
-                arrowprops=dict(arrowstyle='->', color='green'),
-                fontsize=10, ha='center')
-    
-    # Plot 4: Doubling Effort Analysis
-    doubling_weeks = [1, 2, 4, 8, 16, 32, 64]
-    doubling_weeks_filtered = [w for w in doubling_weeks if w <= max_weeks]
-    doubling_skills = [maya_skill(w) for w in doubling_weeks_filtered]
-    doubling_improvements = [0] + [doubling_skills[i] - doubling_skills[i-1] for i in range(1, len(doubling_skills))]
-    
-    ax4.bar(range(len(doubling_weeks_filtered)), doubling_improvements, 
-            color=['gray'] + ['orange'] * (len(doubling_improvements) - 1),
-            alpha=0.7, label='Improvement from Doubling Effort')
-    ax4.set_xlabel('Doubling Period')
-    ax4.set_ylabel('Improvement (Cups/Hour)')
-    ax4.set_title('Consistent Gain from Doubling Effort')
-    ax4.set_xticks(range(len(doubling_weeks_filtered)))
-    ax4.set_xticklabels([f'{w}w' for w in doubling_weeks_filtered])
-    ax4.legend()
-    ax4.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
+    # Dashboard image, rendered once per slider combination and shared across sessions
+    show_figure(_draw_learning_dashboard, base_skill, improvement_per_doubling, max_weeks)
     
     # Mathematical Representation
     st.header("🧮 Maya's Logarithmic Equation")
@@ -587,4 +498,103 @@ def show_logarithmic_functions():
     with nav_col3:
         if st.button("Piecewise Functions →"):
             st.session_state.page = 'algebra_piecewise'
-            st.rerun()
\ No newline at end of file
+            st.rerun()
+
+
+def _skill_curve(base_skill, improvement_per_doubling):
+    """Maya's logarithmic equation: Skill = base_skill + improvement_per_doubling * log2(weeks)"""
+    def maya_skill(weeks):
+        return base_skill + improvement_per_doubling * np.log2(weeks)
+    
+    return maya_skill
+
+
+def _draw_learning_dashboard(fig, base_skill, improvement_per_doubling, max_weeks):
+    """Learning curve, linear comparison, improvement rate and doubling gains"""
+    maya_skill = _skill_curve(base_skill, improvement_per_doubling)
+    
+    # Generate logarithmic data
+    weeks_range = np.logspace(0, log2(max_weeks), 100, base=2)  # From 1 to max_weeks, logarithmically spaced
+    skills = maya_skill(weeks_range)
+    
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+    
+    # Plot 1: The Logarithmic Learning Curve
+    ax1.plot(weeks_range, skills, 'b-', linewidth=3, label=f'Skill = {base_skill} + {improvement_per_doubling} × log₂(weeks)')
+    
+    # Add Maya's actual data points for key weeks
+    key_weeks = [1, 2, 4, 8, 16, 32]
+    key_skills = [maya_skill(w) for w in key_weeks if w <= max_weeks]
+    key_weeks_filtered = [w for w in key_weeks if w <= max_weeks]
+    
+    ax1.scatter(key_weeks_filtered, key_skills, color='red', s=100, zorder=5, label='Maya\'s Practice Milestones')
+    
+    # Highlight plateau effect
+    plateau_weeks = max_weeks * 0.8
+    plateau_skill = maya_skill(plateau_weeks)
+    ax1.plot(plateau_weeks, plateau_skill, 'go', markersize=12, label=f'Plateau Region: {plateau_skill:.1f} cups/hour')
+    
+    ax1.set_xlabel('Weeks of Practice')
+    ax1.set_ylabel('Cups per Hour')
+    ax1.set_title('Maya\'s Learning Curve: Diminishing Returns')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xscale('log', base=2)
+    
+    # Plot 2: Linear vs Logarithmic Comparison
+    # Linear improvement would be: base_skill + (weeks - 1) * improvement_rate
+    linear_improvement_rate = improvement_per_doubling / 2  # Approximate linear rate
+    linear_skills = base_skill + (weeks_range - 1) * linear_improvement_rate
+    
+    ax2.plot(weeks_range, skills, 'b-', linewidth=3, label='Logarithmic (Real Learning)')
+    ax2.plot(weeks_range, linear_skills, 'r--', linewidth=3, label='Linear (Unrealistic)')
+    
+    ax2.set_xlabel('Weeks of Practice')
+    ax2.set_ylabel('Cups per Hour')
+    ax2.set_title('Why Learning Follows Logarithmic Pattern')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    
+    # Add annotation showing the difference
+    mid_weeks = max_weeks / 4
+    log_skill_mid = maya_skill(mid_weeks)
+    lin_skill_mid = base_skill + (mid_weeks - 1) * linear_improvement_rate
+    
+    ax2.annotate(f'Reality: Diminishing returns\nmake improvement harder', 
+                xy=(mid_weeks, log_skill_mid), xytext=(mid_weeks * 2, log_skill_mid + 5),
+                arrowprops=dict(arrowstyle='->', color='blue'),
+                fontsize=10, ha='center')
+    
+    # Plot 3: Improvement Rate Analysis
+    # Calculate the derivative (rate of improvement)
+    weeks_for_derivative = weeks_range[1:]
+    improvement_rate = np.diff(skills) / np.diff(weeks_range)
+    
+    ax3.plot(weeks_for_derivative, improvement_rate, 'purple', linewidth=3, label='Rate of Improvement')
+    ax3.set_xlabel('Weeks of Practice')
+    ax3.set_ylabel('Cups/Hour Improvement per Week')
+    ax3.set_title('Why Maya Gets Frustrated: Slowing Improvement Rate')
+    ax3.legend()
+    ax3.grid(True, alpha=0.3)
+    
+    ax3.annotate('Fast improvement\nat the beginning', 
+                xy=(2, improvement_rate[10]), xytext=(8, improvement_rate[10] + 0.5),
+                arrowprops=dict(arrowstyle='->', color='green'),
+                fontsize=10, ha='center')
+    
+    # Plot 4: Doubling Effort Analysis
+    doubling_weeks = [1, 2, 4, 8, 16, 32, 64]
+    doubling_weeks_filtered = [w for w in doubling_weeks if w <= max_weeks]
+    doubling_skills = [maya_skill(w) for w in doubling_weeks_filtered]
+    doubling_improvements = [0] + [doubling_skills[i] - doubling_skills[i-1] for i in range(1, len(doubling_skills))]
+    
+    ax4.bar(range(len(doubling_weeks_filtered)), doubling_improvements, 
+            color=['gray'] + ['orange'] * (len(doubling_improvements) - 1),
+            alpha=0.7, label='Improvement from Doubling Effort')
+    ax4.set_xlabel('Doubling Period')
+    ax4.set_ylabel('Improvement (Cups/Hour)')
+    ax4.set_title('Consistent Gain from Doubling Effort')
+    ax4.set_xticks(range(len(doubling_weeks_filtered)))
+    ax4.set_xticklabels([f'{w}w' for w in doubling_weeks_filtered])
+    ax4.legend()
+    ax4.grid(True, alpha=0.3)
@@ -1,7 +1,9 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
+from modules.datasets import delivery_customer_distances
+from modules.algebra_topics.tiered import TieredFunction, smallest_at_least
+from modules.figure_cache import show_figure
 
 # Custom CSS for better styling
 st.markdown("""
@@ -178,111 +180,22 @@ def show_piecewise_functions():
         medium_threshold = st.slider("Medium/Long Boundary (km)", 4.0, 8.0, 5.0, 0.1,
                                     help="Distance where pricing changes to long")
     
-    # Define piecewise function
-    def delivery_charge(distance):
-        if distance <= short_threshold:
-            return short_charge
-        elif distance <= medium_threshold:
-            return medium_charge
-        else:
-            return long_charge
-    
-    # Generate data for visualization
-    distances = np.linspace(0, 10, 1000)
-    charges = np.array([delivery_charge(d) for d in distances])
-    
-    # Create comprehensive visualization
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-    
-    # Plot 1: Piecewise Function Graph
-    ax1.plot(distances, charges, 'b-', linewidth=3, label='Maya\'s Delivery Pricing')
-    
-    # Add vertical lines at thresholds
-    ax1.axvline(x=short_threshold, color='red', linestyle='--', alpha=0.7, label=f'Threshold 1: {short_threshold} km')
-    ax1.axvline(x=medium_threshold, color='orange', linestyle='--', alpha=0.7, label=f'Threshold 2: {medium_threshold} km')
-    
-    # Add annotations for each piece
-    ax1.annotate(f'₹{short_charge}', xy=(short_threshold/2, short_charge), xytext=(short_threshold/2, short_charge + 5),
-                ha='center', fontsize=12, fontweight='bold')
-    ax1.annotate(f'₹{medium_charge}', xy=((short_threshold + medium_threshold)/2, medium_charge), 
-                xytext=((short_threshold + medium_threshold)/2, medium_charge + 5),
-                ha='center', fontsize=12, fontweight='bold')
-    ax1.annotate(f'₹{long_charge}', xy=(medium_threshold + 1, long_charge), xytext=(medium_threshold + 1, long_charge + 5),
-                ha='center', fontsize=12, fontweight='bold')
-    
-    ax1.set_xlabel('Distance (km)')
-    ax1.set_ylabel('Delivery Charge (₹)')
-    ax1.set_title('Maya\'s Piecewise Delivery Pricing')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xlim(0, 10)
-    
-    # Plot 2: Customer Distribution Analysis
-    # Simulate customer distribution across distances
-    np.random.seed(42)
-    customer_distances = np.random.exponential(2.5, 100)  # Most customers are nearby
-    customer_distances = customer_distances[customer_distances <= 10]  # Limit to 10km
+    # Define piecewise function (evaluates scalars or whole arrays)
+    delivery_charge = TieredFunction(
+        [short_threshold, medium_threshold],
+        [short_charge, medium_charge, long_charge]
+    )
     
-    customer_charges = np.array([delivery_charge(d) for d in customer_distances])
+    # Dashboard image, rendered once per slider combination and shared across sessions
+    show_figure(_draw_delivery_dashboard, short_charge, medium_charge, long_charge, short_threshold, medium_threshold)
     
-    ax2.scatter(customer_distances, customer_charges, alpha=0.6, s=50, c='purple')
-    ax2.set_xlabel('Customer Distance (km)')
-    ax2.set_ylabel('Charge Paid (₹)')
-    ax2.set_title('Customer Charge Distribution')
-    ax2.grid(True, alpha=0.3)
-    
-    # Add average charge per zone
-    short_customers = customer_distances[customer_distances <= short_threshold]
-    medium_customers = customer_distances[(customer_distances > short_threshold) & (customer_distances <= medium_threshold)]
-    long_customers = customer_distances[customer_distances > medium_threshold]
-    
-    ax2.axhline(y=short_charge, xmax=short_threshold/10, color='blue', linewidth=3, alpha=0.7)
-    ax2.axhline(y=medium_charge, xmin=short_threshold/10, xmax=medium_threshold/10, color='green', linewidth=3, alpha=0.7)
-    ax2.axhline(y=long_charge, xmin=medium_threshold/10, color='red', linewidth=3, alpha=0.7)
-    
-    # Plot 3: Revenue Analysis by Distance Zone
+    # Customer base and production tiers used by the dashboard below
+    customer_distances = delivery_customer_distances()
+    customer_charges = delivery_charge(customer_distances)
     zone_names = ['Short\n(0-2km)', 'Medium\n(2-5km)', 'Long\n(5+km)']
-    zone_customers = [len(short_customers), len(medium_customers), len(long_customers)]
-    zone_revenues = [len(short_customers) * short_charge, 
-                    len(medium_customers) * medium_charge,
-                    len(long_customers) * long_charge]
+    zone_customers = list(np.bincount(delivery_charge.tier(customer_distances), minlength=3))
+    production_cost_per_cup = TieredFunction([200, 400], [5, 7, 10])
     
-    ax3.bar(zone_names, zone_revenues, color=['lightblue', 'lightgreen', 'lightcoral'], alpha=0.8)
-    ax3.set_ylabel('Total Revenue (₹)')
-    ax3.set_title('Revenue by Distance Zone')
-    ax3.grid(True, alpha=0.3)
-    
-    # Add customer count labels on bars
-    for i, (customers, revenue) in enumerate(zip(zone_customers, zone_revenues)):
-        ax3.text(i, revenue + max(zone_revenues) * 0.02, f'{customers} customers\n₹{revenue:.0f}', 
-                ha='center', va='bottom', fontweight='bold')
-    
-    # Plot 4: Production Cost Analysis (Maya's second piecewise example)
-    # Production costs with different tiers
-    production_volumes = np.arange(0, 600, 1)
-    
-    def production_cost_per_cup(volume):
-        if volume <= 200:
-            return 5
-        elif volume <= 400:
-            return 7
-        else:
-            return 10
-    
-    production_costs = np.array([production_cost_per_cup(v) for v in production_volumes])
-    
-    ax4.plot(production_volumes, production_costs, 'g-', linewidth=3, label='Cost per Cup')
-    ax4.axvline(x=200, color='red', linestyle='--', alpha=0.7, label='200 cup threshold')
-    ax4.axvline(x=400, color='orange', linestyle='--', alpha=0.7, label='400 cup threshold')
-    
-    ax4.set_xlabel('Daily Production (cups)')
-    ax4.set_ylabel('Cost per Cup (₹)')
-    ax4.set_title('Maya\'s Production Cost Structure')
-    ax4.legend()
-    ax4.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
     
     # Mathematical Representation
     st.header("🧮 Maya's Piecewise Equations")
@@ -318,7 +231,7 @@ def show_piecewise_functions():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        avg_delivery_revenue = np.mean([delivery_charge(d) for d in customer_distances])
+        avg_delivery_revenue = customer_charges.mean()
         st.metric("Avg Delivery Revenue", f"₹{avg_delivery_revenue:.1f}", "per delivery")
     
     with col2:
@@ -326,7 +239,7 @@ def show_piecewise_functions():
         st.metric("Sample Customers", f"{total_customers}", "this week")
     
     with col3:
-        total_delivery_revenue = sum([delivery_charge(d) for d in customer_distances])
+        total_delivery_revenue = customer_charges.sum()
         st.metric("Total Delivery Revenue", f"₹{total_delivery_revenue:.0f}", "this week")
     
     with col4:
@@ -402,14 +315,8 @@ def show_piecewise_functions():
         
         cost_per_cup = production_cost_per_cup(production_volume)
         
-        # Calculate total cost using piecewise logic
-        total_cost = 0
-        if production_volume <= 200:
-            total_cost = production_volume * 5
-        elif production_volume <= 400:
-            total_cost = 200 * 5 + (production_volume - 200) * 7
-        else:
-            total_cost = 200 * 5 + 200 * 7 + (production_volume - 400) * 10
+        # Calculate total cost using piecewise logic (each cup at its tier's rate)
+        total_cost = production_cost_per_cup.cumulative(production_volume)
         
         st.success(f"🏭 {production_volume} cups → **₹{cost_per_cup}/cup, ₹{total_cost} total**")
         
@@ -525,13 +432,7 @@ def show_piecewise_functions():
         """)
         
         if st.button("Show Solutions", key="ex2_piece"):
-            def bulk_price_total(cups):
-                if cups <= 50:
-                    return cups * 15
-                elif cups <= 100:
-                    return 50 * 15 + (cups - 50) * 13
-                else:
-                    return 50 * 15 + 50 * 13 + (cups - 100) * 11
+            bulk_price_total = TieredFunction([50, 100], [15, 13, 11]).cumulative
             
             regular_price_total = lambda cups: cups * 15
             
@@ -557,15 +458,12 @@ def show_piecewise_functions():
                 
                 st.write(f"   - **{order} cups:** {breakdown} = **₹{bulk_total}** (saves ₹{savings})")
             
-            # Find when savings reach ₹100
+            # Find when savings reach ₹100 (savings never shrink as orders grow)
             target_savings = 100
-            cups_for_100_savings = None
-            
-            for cups in range(51, 200):
-                savings = regular_price_total(cups) - bulk_price_total(cups)
-                if savings >= target_savings and cups_for_100_savings is None:
-                    cups_for_100_savings = cups
-                    break
+            cups_for_100_savings = smallest_at_least(
+                lambda cups: regular_price_total(cups) - bulk_price_total(cups),
+                target_savings, 51, 199
+            )
             
             # Revenue loss on 200-cup order
             bulk_200 = bulk_price_total(200)
@@ -620,4 +518,97 @@ def show_piecewise_functions():
     with nav_col3:
         if st.button("Inverse Functions →"):
             st.session_state.page = 'algebra_inverse'
-            st.rerun()
\ No newline at end of file
+            st.rerun()
+
+
+def _draw_delivery_dashboard(fig, short_charge, medium_charge, long_charge, short_threshold, medium_threshold):
+    """Delivery pricing, customer charges, zone revenue and production cost tiers"""
+    delivery_charge = TieredFunction(
+        [short_threshold, medium_threshold],
+        [short_charge, medium_charge, long_charge]
+    )
+    
+    # Generate data for visualization
+    distances = np.linspace(0, 10, 1000)
+    charges = delivery_charge(distances)
+    
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+    
+    # Plot 1: Piecewise Function Graph
+    ax1.plot(distances, charges, 'b-', linewidth=3, label='Maya\'s Delivery Pricing')
+    
+    # Add vertical lines at thresholds
+    ax1.axvline(x=short_threshold, color='red', linestyle='--', alpha=0.7, label=f'Threshold 1: {short_threshold} km')
+    ax1.axvline(x=medium_threshold, color='orange', linestyle='--', alpha=0.7, label=f'Threshold 2: {medium_threshold} km')
+    
+    # Add annotations for each piece
+    ax1.annotate(f'₹{short_charge}', xy=(short_threshold/2, short_charge), xytext=(short_threshold/2, short_charge + 5),
+                ha='center', fontsize=12, fontweight='bold')
+    ax1.annotate(f'₹{medium_charge}', xy=((short_threshold + medium_threshold)/2, medium_charge), 
+                xytext=((short_threshold + medium_threshold)/2, medium_charge + 5),
+                ha='center', fontsize=12, fontweight='bold')
+    ax1.annotate(f'₹{long_charge}', xy=(medium_threshold + 1, long_charge), xytext=(medium_threshold + 1, long_charge + 5),
+                ha='center', fontsize=12, fontweight='bold')
+    
+    ax1.set_xlabel('Distance (km)')
+    ax1.set_ylabel('Delivery Charge (₹)')
+    ax1.set_title('Maya\'s Piecewise Delivery Pricing')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xlim(0, 10)
+    
+    # Plot 2: Customer Distribution Analysis
+    # Simulated customer distribution across distances (cached, shared across sessions)
+    customer_distances = delivery_customer_distances()
+    
+    customer_charges = delivery_charge(customer_distances)
+    
+    ax2.scatter(customer_distances, customer_charges, alpha=0.6, s=50, c='purple')
+    ax2.set_xlabel('Customer Distance (km)')
+    ax2.set_ylabel('Charge Paid (₹)')
+    ax2.set_title('Customer Charge Distribution')
+    ax2.grid(True, alpha=0.3)
+    
+    # Add average charge per zone
+    short_customers = customer_distances[customer_distances <= short_threshold]
+    medium_customers = customer_distances[(customer_distances > short_threshold) & (customer_distances <= medium_threshold)]
+    long_customers = customer_distances[customer_distances > medium_threshold]
+    
+    ax2.axhline(y=short_charge, xmax=short_threshold/10, color='blue', linewidth=3, alpha=0.7)
+    ax2.axhline(y=medium_charge, xmin=short_threshold/10, xmax=medium_threshold/10, color='green', linewidth=3, alpha=0.7)
+    ax2.axhline(y=long_charge, xmin=medium_threshold/10, color='red', linewidth=3, alpha=0.7)
+    
+    # Plot 3: Revenue Analysis by Distance Zone
+    zone_names = ['Short\n(0-2km)', 'Medium\n(2-5km)', 'Long\n(5+km)']
+    zone_customers = [len(short_customers), len(medium_customers), len(long_customers)]
+    zone_revenues = [len(short_customers) * short_charge, 
+                    len(medium_customers) * medium_charge,
+                    len(long_customers) * long_charge]
+    
+    ax3.bar(zone_names, zone_revenues, color=['lightblue', 'lightgreen', 'lightcoral'], alpha=0.8)
+    ax3.set_ylabel('Total Revenue (₹)')
+    ax3.set_title('Revenue by Distance Zone')
+    ax3.grid(True, alpha=0.3)
+    
+    # Add customer count labels on bars
+    for i, (customers, revenue) in enumerate(zip(zone_customers, zone_revenues)):
+        ax3.text(i, revenue + max(zone_revenues) * 0.02, f'{customers} customers\n₹{revenue:.0f}', 
+                ha='center', va='bottom', fontweight='bold')
+    
+    # Plot 4: Production Cost Analysis (Maya's second piecewise example)
+    # Production costs with different tiers
+    production_volumes = np.arange(0, 600, 1)
+    
+    production_cost_per_cup = TieredFunction([200, 400], [5, 7, 10])
+    
+    production_costs = production_cost_per_cup(production_volumes)
+    
+    ax4.plot(production_volumes, production_costs, 'g-', linewidth=3, label='Cost per Cup')
+    ax4.axvline(x=200, color='red', linestyle='--', alpha=0.7, label='200 cup threshold')
+    ax4.axvline(x=400, color='orange', linestyle='--', alpha=0.7, label='400 cup threshold')
+    
+    ax4.set_xlabel('Daily Production (cups)')
+    ax4.set_ylabel('Cost per Cup (₹)')
+    ax4.set_title('Maya\'s Production Cost Structure')
+    ax4.legend()
+    ax4.grid(True, alpha=0.3)
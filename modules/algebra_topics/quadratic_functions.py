@@ -1,8 +1,8 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
 from math import sqrt
+from modules.figure_cache import show_figure
 
 # Custom CSS for better styling
 st.markdown("""
@@ -146,89 +146,15 @@ def show_quadratic_functions():
     # Ensure sales don't go below 0
     sales = np.maximum(sales, 0)
     
-    # Create comprehensive visualization
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+    # Dashboard image, rendered once per slider combination and shared across sessions
+    show_figure(_draw_pricing_dashboard, optimal_price, max_sales, sensitivity)
     
-    # Plot 1: The Quadratic Curve with Maya's Data Points
-    ax1.plot(price_range, sales, 'b-', linewidth=3, label=f'Sales = {max_sales} - {sensitivity}×(P - {optimal_price})²')
-    
-    # Add Maya's original data points
-    maya_prices = [12, 13, 14, 15, 16, 17, 18]
-    maya_sales = [200, 230, 240, 250, 240, 230, 200]
-    ax1.scatter(maya_prices, maya_sales, color='red', s=100, zorder=5, label="Maya's Experiment Data")
-    
-    # Highlight the optimal point
-    ax1.plot(optimal_price, max_sales, 'go', markersize=12, label=f'Sweet Spot: ₹{optimal_price}')
-    
-    ax1.set_xlabel('Price per Cup (₹)')
-    ax1.set_ylabel('Cups Sold per Day')
-    ax1.set_title('Maya\'s Sales Curve: Finding the Sweet Spot')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xlim(8, 22)
-    
-    # Plot 2: Revenue Analysis
+    # Revenue-maximizing price on the plotted price grid
     revenue = price_range * sales
     max_revenue_idx = np.argmax(revenue)
     max_revenue_price = price_range[max_revenue_idx]
     max_revenue_value = revenue[max_revenue_idx]
     
-    ax2.plot(price_range, revenue, 'g-', linewidth=3, label='Daily Revenue')
-    ax2.plot(max_revenue_price, max_revenue_value, 'ro', markersize=12, 
-             label=f'Max Revenue: ₹{max_revenue_value:.0f} at ₹{max_revenue_price:.1f}')
-    ax2.plot(optimal_price, optimal_price * max_sales, 'bo', markersize=10, 
-             label=f'Max Sales Point: ₹{optimal_price * max_sales:.0f} at ₹{optimal_price}')
-    
-    ax2.set_xlabel('Price per Cup (₹)')
-    ax2.set_ylabel('Daily Revenue (₹)')
-    ax2.set_title('Revenue vs Price: Sales ≠ Revenue Maximization')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-    ax2.set_xlim(8, 22)
-    
-    # Plot 3: Distance from Optimal Analysis
-    distance_from_optimal = np.abs(price_range - optimal_price)
-    sales_loss = max_sales - sales
-    
-    ax3.plot(distance_from_optimal, sales_loss, 'purple', linewidth=3, label='Sales Lost')
-    ax3.set_xlabel('Distance from Optimal Price (₹)')
-    ax3.set_ylabel('Cups Lost from Peak')
-    ax3.set_title('Why It\'s Quadratic: Accelerating Losses')
-    ax3.legend()
-    ax3.grid(True, alpha=0.3)
-    
-    # Add annotation showing quadratic relationship
-    ax3.annotate('Losses accelerate!\nFar from optimal = Big losses', 
-                xy=(3, sensitivity * 9), xytext=(4, sensitivity * 15),
-                arrowprops=dict(arrowstyle='->', color='red'),
-                fontsize=10, ha='center')
-    
-    # Plot 4: Profit Analysis (assuming cost structure)
-    cost_per_cup = 8  # Maya's cost from linear functions story
-    profit_per_cup = price_range - cost_per_cup
-    total_profit = profit_per_cup * sales
-    
-    # Only show positive profits
-    positive_profit_mask = total_profit > 0
-    if np.any(positive_profit_mask):
-        ax4.plot(price_range[positive_profit_mask], total_profit[positive_profit_mask], 
-                'orange', linewidth=3, label='Daily Profit')
-        
-        max_profit_idx = np.argmax(total_profit)
-        if total_profit[max_profit_idx] > 0:
-            ax4.plot(price_range[max_profit_idx], total_profit[max_profit_idx], 
-                    'ro', markersize=12, 
-                    label=f'Max Profit: ₹{total_profit[max_profit_idx]:.0f} at ₹{price_range[max_profit_idx]:.1f}')
-    
-    ax4.set_xlabel('Price per Cup (₹)')
-    ax4.set_ylabel('Daily Profit (₹)')
-    ax4.set_title('Profit Optimization: The Ultimate Goal')
-    ax4.legend()
-    ax4.grid(True, alpha=0.3)
-    ax4.set_xlim(8, 22)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
     
     # Mathematical Representation
     st.header("🧮 Maya's Mathematical Discovery")
@@ -525,4 +451,90 @@ def show_quadratic_functions():
             # At the end:
     
 # This would be called from the main navigation system
-# No st.set_page_config() needed here - handled by main.py
\ No newline at end of file
+# No st.set_page_config() needed here - handled by main.py
+
+
+def _draw_pricing_dashboard(fig, optimal_price, max_sales, sensitivity):
+    """Sales curve, revenue, accelerating losses and profit over the price range"""
+    price_range = np.linspace(8, 22, 100)
+    sales = np.maximum(max_sales - sensitivity * (price_range - optimal_price)**2, 0)
+    
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+    
+    # Plot 1: The Quadratic Curve with Maya's Data Points
+    ax1.plot(price_range, sales, 'b-', linewidth=3, label=f'Sales = {max_sales} - {sensitivity}×(P - {optimal_price})²')
+    
+    # Add Maya's original data points
+    maya_prices = [12, 13, 14, 15, 16, 17, 18]
+    maya_sales = [200, 230, 240, 250, 240, 230, 200]
+    ax1.scatter(maya_prices, maya_sales, color='red', s=100, zorder=5, label="Maya's Experiment Data")
+    
+    # Highlight the optimal point
+    ax1.plot(optimal_price, max_sales, 'go', markersize=12, label=f'Sweet Spot: ₹{optimal_price}')
+    
+    ax1.set_xlabel('Price per Cup (₹)')
+    ax1.set_ylabel('Cups Sold per Day')
+    ax1.set_title('Maya\'s Sales Curve: Finding the Sweet Spot')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xlim(8, 22)
+    
+    # Plot 2: Revenue Analysis
+    revenue = price_range * sales
+    max_revenue_idx = np.argmax(revenue)
+    max_revenue_price = price_range[max_revenue_idx]
+    max_revenue_value = revenue[max_revenue_idx]
+    
+    ax2.plot(price_range, revenue, 'g-', linewidth=3, label='Daily Revenue')
+    ax2.plot(max_revenue_price, max_revenue_value, 'ro', markersize=12, 
+             label=f'Max Revenue: ₹{max_revenue_value:.0f} at ₹{max_revenue_price:.1f}')
+    ax2.plot(optimal_price, optimal_price * max_sales, 'bo', markersize=10, 
+             label=f'Max Sales Point: ₹{optimal_price * max_sales:.0f} at ₹{optimal_price}')
+    
+    ax2.set_xlabel('Price per Cup (₹)')
+    ax2.set_ylabel('Daily Revenue (₹)')
+    ax2.set_title('Revenue vs Price: Sales ≠ Revenue Maximization')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    ax2.set_xlim(8, 22)
+    
+    # Plot 3: Distance from Optimal Analysis
+    distance_from_optimal = np.abs(price_range - optimal_price)
+    sales_loss = max_sales - sales
+    
+    ax3.plot(distance_from_optimal, sales_loss, 'purple', linewidth=3, label='Sales Lost')
+    ax3.set_xlabel('Distance from Optimal Price (₹)')
+    ax3.set_ylabel('Cups Lost from Peak')
+    ax3.set_title('Why It\'s Quadratic: Accelerating Losses')
+    ax3.legend()
+    ax3.grid(True, alpha=0.3)
+    
+    # Add annotation showing quadratic relationship
+    ax3.annotate('Losses accelerate!\nFar from optimal = Big losses', 
+                xy=(3, sensitivity * 9), xytext=(4, sensitivity * 15),
+                arrowprops=dict(arrowstyle='->', color='red'),
+                fontsize=10, ha='center')
+    
+    # Plot 4: Profit Analysis (assuming cost structure)
+    cost_per_cup = 8  # Maya's cost from linear functions story
+    profit_per_cup = price_range - cost_per_cup
+    total_profit = profit_per_cup * sales
+    
+    # Only show positive profits
+    positive_profit_mask = total_profit > 0
+    if np.any(positive_profit_mask):
+        ax4.plot(price_range[positive_profit_mask], total_profit[positive_profit_mask], 
+                'orange', linewidth=3, label='Daily Profit')
+        
+        max_profit_idx = np.argmax(total_profit)
+        if total_profit[max_profit_idx] > 0:
+            ax4.plot(price_range[max_profit_idx], total_profit[max_profit_idx], 
+                    'ro', markersize=12, 
+                    label=f'Max Profit: ₹{total_profit[max_profit_idx]:.0f} at ₹{price_range[max_profit_idx]:.1f}')
+    
+    ax4.set_xlabel('Price per Cup (₹)')
+    ax4.set_ylabel('Daily Profit (₹)')
+    ax4.set_title('Profit Optimization: The Ultimate Goal')
+    ax4.legend()
+    ax4.grid(True, alpha=0.3)
+    ax4.set_xlim(8, 22)
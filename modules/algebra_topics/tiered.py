@@ -0,0 +1,66 @@
+import numpy as np
+
+# Tiered (piecewise-constant) business rules: delivery charges by distance,
+# cost per cup by volume, bulk pricing by order size.
+#
+# A TieredFunction evaluates whole NumPy arrays in one searchsorted pass
+# instead of an if/elif chain per element, and its cumulative form gives
+# the "first 50 at ₹15, next 50 at ₹13, ..." totals.
+
+
+class TieredFunction:
+    """Step function with inclusive upper thresholds.
+
+    values[i] applies for thresholds[i-1] < x <= thresholds[i]; the first
+    value covers everything up to thresholds[0] and the last value
+    everything above thresholds[-1]. So TieredFunction([2, 5], [10, 25, 50])
+    charges 10 up to 2 km, 25 up to 5 km and 50 beyond.
+    """
+
+    def __init__(self, thresholds, values):
+        self.thresholds = np.asarray(thresholds)
+        self.values = np.asarray(values)
+        if len(self.values) != len(self.thresholds) + 1:
+            raise ValueError("need exactly one more value than thresholds")
+        if np.any(np.diff(self.thresholds) < 0):
+            raise ValueError("thresholds must be increasing")
+
+        # Running total at the start of each tier, for the cumulative form
+        widths = np.diff(self.thresholds, prepend=0)
+        self._tier_start = np.concatenate([[0], self.thresholds])
+        self._tier_base = np.concatenate([[0], np.cumsum(widths * self.values[:-1])])
+
+    def tier(self, x):
+        """Index of the tier each x falls in"""
+        return np.searchsorted(self.thresholds, x, side='left')
+
+    def __call__(self, x):
+        result = self.values[self.tier(x)]
+        return result if np.ndim(x) else result.item()
+
+    def cumulative(self, x):
+        """Total when each unit is charged at the rate of the tier it falls in.
+
+        With values as marginal rates, TieredFunction([50, 100], [15, 13, 11])
+        .cumulative(150) is 50×15 + 50×13 + 50×11.
+        """
+        tier = self.tier(x)
+        result = self._tier_base[tier] + (np.asarray(x) - self._tier_start[tier]) * self.values[tier]
+        return result if np.ndim(x) else result.item()
+
+
+def smallest_at_least(fn, target, low, high):
+    """Smallest integer n in [low, high] with fn(n) >= target, or None.
+
+    fn must be non-decreasing on [low, high]; binary search needs
+    O(log(high - low)) calls instead of a scan.
+    """
+    if fn(high) < target:
+        return None
+    while low < high:
+        middle = (low + high) // 2
+        if fn(middle) >= target:
+            high = middle
+        else:
+            low = middle + 1
+    return low
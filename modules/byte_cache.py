@@ -0,0 +1,114 @@
+import threading
+from collections import OrderedDict
+
+# In-memory LRU caches shared by every session of the process.
+#
+# LRUCache holds values that are never mutated once cached (sympy
+# expressions, compiled kernels), so one process-wide cache can serve
+# every session; eviction is least-recently-used first. ByteCache is the
+# same cache for rendered output (dashboard images, study-guide PDFs),
+# bounded both by the number of entries and by their total size.
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe LRU cache with hit/miss counters"""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return _MISSING
+
+    def _full(self):
+        return len(self._data) > self.maxsize
+
+    def _added(self, value):
+        pass
+
+    def _removed(self, value):
+        pass
+
+    def put(self, key, value):
+        with self._lock:
+            if key in self._data:
+                self._removed(self._data[key])
+            self._data[key] = value
+            self._added(value)
+            self._data.move_to_end(key)
+            while len(self._data) > 1 and self._full():
+                _, evicted = self._data.popitem(last=False)
+                self._removed(evicted)
+
+    def get_or_compute(self, key, compute):
+        value = self._lookup(key)
+        if value is _MISSING:
+            # Compute outside the lock: two sessions may race on the same
+            # key, which only costs a duplicate computation
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def info(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else None,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+    def _reset(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+
+class ByteCache(LRUCache):
+    """Thread-safe LRU of bytes values, bounded by entries and total size"""
+
+    def __init__(self, maxsize=128, max_bytes=64 * 1024 * 1024):
+        super().__init__(maxsize)
+        self.max_bytes = max_bytes
+        self._bytes = 0
+
+    def _full(self):
+        return super()._full() or self._bytes > self.max_bytes
+
+    def _added(self, value):
+        self._bytes += len(value)
+
+    def _removed(self, value):
+        self._bytes -= len(value)
+
+    def get(self, key):
+        """Cached bytes for key (counted as a hit or miss), or None"""
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    def info(self):
+        info = super().info()
+        with self._lock:
+            info['megabytes'] = self._bytes / 1024 ** 2
+        return info
+
+    def _reset(self):
+        super()._reset()
+        self._bytes = 0
@@ -5,7 +5,8 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import sympy as sp
-from sympy import symbols, diff, solve, lambdify
+from sympy import symbols
+from modules.calculus_topics.symbolic import cached_diff, cached_solve, cached_lambdify, compile_expression
 
 def show_derivatives():
     # Header with navigation
@@ -102,6 +103,135 @@ def show_derivatives():
     It tells me not just where I am, but how fast I'm moving at each moment."*
     """)
     
+    # Interactive sections are st.fragment functions (defined below) so a
+    # slider only reruns its own section; sections sharing sliders stay together
+    _show_fund_rate_analysis()
+
+    # Section 5: Marginal Analysis in Business
+    st.markdown("---")
+    st.header("5️⃣ Marginal Analysis: Business Decision Making")
+    
+    st.markdown("""
+    **Priya's Advanced Application:** *"Now I understand rates! But how do I use this 
+    for business decisions like pricing, production, and investment levels?"*
+    """)
+    
+    _show_marginal_analysis()
+
+    # Section 6: Key Business Applications
+    st.markdown("---")
+    st.header("6️⃣ Priya's Business Applications Mastery")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **🎯 Investment Analysis**
+        - Portfolio growth rates
+        - Risk-return optimization  
+        - Performance trend analysis
+        - Optimal allocation timing
+        """)
+    
+    with col2:
+        st.markdown("""
+        **📈 Revenue Optimization**
+        - Price sensitivity analysis
+        - Demand curve analysis
+        - Profit maximization points
+        - Market timing decisions
+        """)
+    
+    with col3:
+        st.markdown("""
+        **💼 Cost Management**
+        - Marginal cost analysis
+        - Production optimization
+        - Efficiency improvements
+        - Break-even analysis
+        """)
+    
+    # Practice Exercise
+    st.markdown("---")
+    st.subheader("💪 Practice: Apply Derivative Analysis")
+    
+    with st.expander("📝 Exercise: Bond Price Sensitivity"):
+        st.markdown("""
+        **Scenario:** A bond's price varies with interest rate changes.
+        Price function: P(r) = 1000 × e^(-0.1r) where r is interest rate %
+        
+        **Tasks:**
+        1. Find the derivative P'(r) - this is called "duration" in finance
+        2. What's the price sensitivity when interest rate is 5%?
+        3. If rates increase by 0.1%, how much does bond price change?
+        4. At what rate is the price declining fastest?
+        """)
+        
+        if st.button("Show Solution", key="derivatives_exercise"):
+            st.markdown("---")
+            st.markdown("### 🔍 **Solution:**")
+            
+            # Bond price analysis
+            r = symbols('r')
+            bond_price = 1000 * sp.exp(-0.1 * r)
+            duration = cached_diff(bond_price, r)
+            
+            # Evaluate through compiled NumPy kernels rather than sympy .subs()
+            price_at = compile_expression(bond_price, (r,))
+            duration_at = compile_expression(duration, (r,))
+            
+            st.code(f"""
+Bond Price Function: P(r) = {bond_price}
+Duration (Price Sensitivity): P'(r) = {duration}
+
+At r = 5%:
+Price: P(5) = {float(price_at(5)):.2f}
+Duration: P'(5) = {float(duration_at(5)):.2f}
+
+For 0.1% rate increase:
+Price change ≈ P'(5) × 0.1 = {float(duration_at(5)) * 0.1:.2f}
+            """)
+            
+            st.success("""
+            **Business Interpretation:**
+            - Duration measures bond price sensitivity to interest rate changes
+            - Negative duration means prices fall when rates rise
+            - This helps in portfolio risk management and hedging decisions
+            """)
+    
+    # Navigation
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("← Previous: Calculus Overview"):
+            st.session_state.page = 'calculus'
+            st.rerun()
+    
+    with col2:
+        if st.button("Next: Integrals →"):
+            st.session_state.page = 'calculus_integrals'
+            st.rerun()
+    
+    st.markdown("---")
+    st.success("""
+    🎓 **Priya's Derivative Mastery Achieved!**
+    
+    Priya now understands how to:
+    ✅ **Measure rates of change** in financial data
+    ✅ **Find optimal points** for maximum profit and minimum cost  
+    ✅ **Analyze trends** and predict turning points
+    ✅ **Use marginal analysis** for business decisions
+    ✅ **Apply tangent lines** to understand local behavior
+    
+    **Next:** Learn how Priya uses integrals to calculate total accumulated values 
+    from these rates of change!
+    """)
+
+
+@st.fragment
+def _show_fund_rate_analysis():
+    """Sections 2-4: fund derivative, revenue optimization and tangent explorer"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -138,7 +268,7 @@ def show_derivatives():
         # Define symbolic variable
         t = symbols('t')
         fund_function = c + a*t - b*t**2
-        derivative_function = diff(fund_function, t)
+        derivative_function = cached_diff(fund_function, t)
         
         st.code(f"""
 Fund Function: f(t) = {fund_function}
@@ -152,8 +282,8 @@ Derivative: f'(t) = {derivative_function}
         t_vals = np.linspace(0, 12, 100)
         
         # Convert symbolic expressions to numerical functions
-        f_numeric = lambdify(t, fund_function, 'numpy')
-        f_prime_numeric = lambdify(t, derivative_function, 'numpy')
+        f_numeric = cached_lambdify(t, fund_function)
+        f_prime_numeric = cached_lambdify(t, derivative_function)
         
         # Calculate values
         fund_vals = f_numeric(t_vals)
@@ -193,7 +323,7 @@ Derivative: f'(t) = {derivative_function}
         st.plotly_chart(fig, use_container_width=True)
         
         # Find critical point
-        critical_points = solve(derivative_function, t)
+        critical_points = cached_solve(derivative_function, t)
         if critical_points:
             critical_day = float(critical_points[0])
             critical_value = float(f_numeric(critical_day))
@@ -240,8 +370,8 @@ Derivative: f'(t) = {derivative_function}
         p = symbols('p')
         base_demand = 1000
         revenue_func = p * (base_demand - demand_sensitivity * 100 * p)
-        revenue_derivative = diff(revenue_func, p)
-        revenue_second_derivative = diff(revenue_derivative, p)
+        revenue_derivative = cached_diff(revenue_func, p)
+        revenue_second_derivative = cached_diff(revenue_derivative, p)
         
         st.code(f"""
 Revenue Function: R(p) = {revenue_func}
@@ -250,7 +380,7 @@ Second Derivative: R''(p) = {revenue_second_derivative}
         """)
         
         # Find optimal price
-        optimal_price = solve(revenue_derivative, p)
+        optimal_price = cached_solve(revenue_derivative, p)
         if optimal_price:
             opt_price = float(optimal_price[0])
             opt_revenue = float(revenue_func.subs(p, opt_price))
@@ -270,7 +400,7 @@ Second Derivative: R''(p) = {revenue_second_derivative}
         p_vals = np.linspace(1, 15, 100)
         
         # Convert to numerical function
-        revenue_numeric = lambdify(p, revenue_func, 'numpy')
+        revenue_numeric = cached_lambdify(p, revenue_func)
         revenue_vals = revenue_numeric(p_vals)
         
         # Plot revenue curve
@@ -408,16 +538,11 @@ y = {derivative_at_point:.2f}(t - {selected_day}) + {fund_func_tangent:.2f}
         )
         
         st.plotly_chart(fig, use_container_width=True)
-    
-    # Section 5: Marginal Analysis in Business
-    st.markdown("---")
-    st.header("5️⃣ Marginal Analysis: Business Decision Making")
-    
-    st.markdown("""
-    **Priya's Advanced Application:** *"Now I understand rates! But how do I use this 
-    for business decisions like pricing, production, and investment levels?"*
-    """)
-    
+
+
+@st.fragment
+def _show_marginal_analysis():
+    """Section 5: marginal revenue vs marginal cost"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -442,12 +567,12 @@ y = {derivative_at_point:.2f}(t - {selected_day}) + {fund_func_tangent:.2f}
         profit_func = revenue_func - cost_func
         
         # Calculate marginals
-        marginal_cost = diff(cost_func, q)
-        marginal_revenue = diff(revenue_func, q)
-        marginal_profit = diff(profit_func, q)
+        marginal_cost = cached_diff(cost_func, q)
+        marginal_revenue = cached_diff(revenue_func, q)
+        marginal_profit = cached_diff(profit_func, q)
         
         # Find optimal quantity
-        optimal_q = solve(marginal_revenue - marginal_cost, q)
+        optimal_q = cached_solve(marginal_revenue - marginal_cost, q)
         
         if optimal_q and len(optimal_q) > 0:
             opt_q = float(optimal_q[0])
@@ -471,8 +596,8 @@ y = {derivative_at_point:.2f}(t - {selected_day}) + {fund_func_tangent:.2f}
         q_vals = np.linspace(1, 20, 100)
         
         # Convert to numerical functions
-        mc_numeric = lambdify(q, marginal_cost, 'numpy')
-        mr_numeric = lambdify(q, marginal_revenue, 'numpy')
+        mc_numeric = cached_lambdify(q, marginal_cost)
+        mr_numeric = cached_lambdify(q, marginal_revenue)
         
         mc_vals = mc_numeric(q_vals)
         mr_vals = mr_numeric(q_vals)
@@ -519,109 +644,3 @@ y = {derivative_at_point:.2f}(t - {selected_day}) + {fund_func_tangent:.2f}
         )
         
         st.plotly_chart(fig, use_container_width=True)
-    
-    # Section 6: Key Business Applications
-    st.markdown("---")
-    st.header("6️⃣ Priya's Business Applications Mastery")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **🎯 Investment Analysis**
-        - Portfolio growth rates
-        - Risk-return optimization  
-        - Performance trend analysis
-        - Optimal allocation timing
-        """)
-    
-    with col2:
-        st.markdown("""
-        **📈 Revenue Optimization**
-        - Price sensitivity analysis
-        - Demand curve analysis
-        - Profit maximization points
-        - Market timing decisions
-        """)
-    
-    with col3:
-        st.markdown("""
-        **💼 Cost Management**
-        - Marginal cost analysis
-        - Production optimization
-        - Efficiency improvements
-        - Break-even analysis
-        """)
-    
-    # Practice Exercise
-    st.markdown("---")
-    st.subheader("💪 Practice: Apply Derivative Analysis")
-    
-    with st.expander("📝 Exercise: Bond Price Sensitivity"):
-        st.markdown("""
-        **Scenario:** A bond's price varies with interest rate changes.
-        Price function: P(r) = 1000 × e^(-0.1r) where r is interest rate %
-        
-        **Tasks:**
-        1. Find the derivative P'(r) - this is called "duration" in finance
-        2. What's the price sensitivity when interest rate is 5%?
-        3. If rates increase by 0.1%, how much does bond price change?
-        4. At what rate is the price declining fastest?
-        """)
-        
-        if st.button("Show Solution", key="derivatives_exercise"):
-            st.markdown("---")
-            st.markdown("### 🔍 **Solution:**")
-            
-            # Bond price analysis
-            r = symbols('r')
-            bond_price = 1000 * sp.exp(-0.1 * r)
-            duration = diff(bond_price, r)
-            
-            st.code(f"""
-Bond Price Function: P(r) = {bond_price}
-Duration (Price Sensitivity): P'(r) = {duration}
-
-At r = 5%:
-Price: P(5) = {float(bond_price.subs(r, 5)):.2f}
-Duration: P'(5) = {float(duration.subs(r, 5)):.2f}
-
-For 0.1% rate increase:
-Price change ≈ P'(5) × 0.1 = {float(duration.subs(r, 5)) * 0.1:.2f}
-            """)
-            
-            st.success("""
-            **Business Interpretation:**
-            - Duration measures bond price sensitivity to interest rate changes
-            - Negative duration means prices fall when rates rise
-            - This helps in portfolio risk management and hedging decisions
-            """)
-    
-    # Navigation
-    st.markdown("---")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("← Previous: Calculus Overview"):
-            st.session_state.page = 'calculus'
-            st.rerun()
-    
-    with col2:
-        if st.button("Next: Integrals →"):
-            st.session_state.page = 'calculus_integrals'
-            st.rerun()
-    
-    st.markdown("---")
-    st.success("""
-    🎓 **Priya's Derivative Mastery Achieved!**
-    
-    Priya now understands how to:
-    ✅ **Measure rates of change** in financial data
-    ✅ **Find optimal points** for maximum profit and minimum cost  
-    ✅ **Analyze trends** and predict turning points
-    ✅ **Use marginal analysis** for business decisions
-    ✅ **Apply tangent lines** to understand local behavior
-    
-    **Next:** Learn how Priya uses integrals to calculate total accumulated values 
-    from these rates of change!
-    """)
\ No newline at end of file
@@ -5,8 +5,10 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import sympy as sp
-from sympy import symbols, integrate, diff, lambdify
+from sympy import symbols
 from scipy import integrate as scipy_integrate
+from modules.datasets import daily_cash_flows
+from modules.calculus_topics.symbolic import cached_integrate, cached_diff, cached_lambdify, compile_integral
 
 def show_integrals():
     # Header with navigation
@@ -109,6 +111,252 @@ def show_integrals():
     all the rates to give me the exact total accumulated value!"*
     """)
     
+    # Interactive sections are st.fragment functions (defined below) so a
+    # slider only reruns its own section; sections sharing sliders stay together
+    _show_profit_accumulation()
+
+    # Section 4: Area Under the Curve
+    st.markdown("---")
+    st.header("4️⃣ Area Under the Curve: Visual Understanding")
+    
+    st.markdown("""
+    **Priya's Visualization Breakthrough:** *"I finally see it! The area under any rate curve 
+    IS the total accumulated value. Integration is just a precise way to calculate irregular areas!"*
+    """)
+    
+    _show_area_explorer()
+
+    # Section 5: Numerical Integration
+    st.markdown("---")
+    st.header("5️⃣ Numerical Integration: Real-World Data Analysis")
+    
+    st.markdown("""
+    **Priya's Real-World Challenge:** *"Sometimes I don't have a nice mathematical formula - 
+    just daily data points from our accounting system. How do I still calculate total values?"*
+    """)
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.subheader("📊 Real Data Integration")
+        
+        st.markdown("""
+        **The Trapezoidal Rule:**
+        When you only have data points, approximate the area using trapezoids.
+        """)
+        
+        # Realistic irregular data: 15 days (cached, shared across sessions)
+        data_days, actual_data = daily_cash_flows()
+        
+        # Create data table
+        data_df = pd.DataFrame({
+            'Day': data_days,
+            'Daily Cash Flow (₹k)': actual_data.round(1)
+        })
+        
+        st.dataframe(data_df, use_container_width=True)
+        
+        # Numerical integration methods comparison
+        st.markdown("**Integration Methods Comparison:**")
+        
+        # Trapezoidal rule
+        trapz_result = np.trapz(actual_data, data_days)
+        
+        # Simpson's rule (if scipy available)
+        try:
+            simpson_result = scipy_integrate.simpson(actual_data, data_days)
+        except:
+            simpson_result = trapz_result
+        
+        # Simple rectangle rule (for comparison)
+        rectangle_result = np.sum(actual_data) * (data_days[1] - data_days[0])
+        
+        col1_inner, col2_inner = st.columns(2)
+        
+        with col1_inner:
+            st.metric("Rectangle Rule", f"₹{rectangle_result:.0f}k")
+            st.metric("Trapezoidal Rule", f"₹{trapz_result:.0f}k")
+        
+        with col2_inner:
+            st.metric("Simpson's Rule", f"₹{simpson_result:.0f}k")
+            st.write("**Most Accurate** ⭐")
+    
+    with col2:
+        st.subheader("📈 Numerical Integration Visualization")
+        
+        # Visualize different numerical methods
+        fig = go.Figure()
+        
+        # Original data points
+        fig.add_trace(go.Scatter(
+            x=data_days, y=actual_data,
+            mode='markers+lines',
+            name='Actual Data',
+            line=dict(color='blue', width=2),
+            marker=dict(size=8)
+        ))
+        
+        # Trapezoidal approximation
+        for i in range(len(data_days)-1):
+            fig.add_shape(
+                type="line",
+                x0=data_days[i], y0=0, x1=data_days[i], y1=actual_data[i],
+                line=dict(color="red", width=1, dash="dot")
+            )
+            fig.add_shape(
+                type="line", 
+                x0=data_days[i+1], y0=0, x1=data_days[i+1], y1=actual_data[i+1],
+                line=dict(color="red", width=1, dash="dot")
+            )
+            fig.add_shape(
+                type="line",
+                x0=data_days[i], y0=actual_data[i], 
+                x1=data_days[i+1], y1=actual_data[i+1],
+                line=dict(color="red", width=1, dash="dot")
+            )
+        
+        fig.update_layout(
+            title="Trapezoidal Rule Approximation",
+            xaxis_title="Day",
+            yaxis_title="Cash Flow (₹k)",
+            height=400
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.info(f"""
+        **Trapezoidal Rule Result:** ₹{trapz_result:.0f}k
+        
+        This method connects data points with straight lines 
+        and calculates the area of resulting trapezoids.
+        """)
+    
+    # Section 6: NPV and Financial Applications
+    st.markdown("---")
+    st.header("6️⃣ Advanced Application: NPV and Cash Flow Analysis")
+    
+    _show_npv_analysis()
+
+    # Section 7: Key Business Applications
+    st.markdown("---")
+    st.header("7️⃣ Priya's Integration Mastery Applications")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **💼 Financial Planning**
+        - NPV calculations
+        - Cash flow analysis
+        - Investment evaluation
+        - Retirement planning
+        """)
+    
+    with col2:
+        st.markdown("""
+        **📊 Business Analysis**
+        - Total revenue calculation
+        - Accumulated cost analysis
+        - Customer lifetime value
+        - Market size estimation
+        """)
+    
+    with col3:
+        st.markdown("""
+        **🎯 Risk Management**
+        - Portfolio value integration
+        - Risk exposure calculation
+        - Probability distributions
+        - Expected value analysis
+        """)
+    
+    # Practice Exercise
+    st.markdown("---")
+    st.subheader("💪 Practice: Apply Integration Analysis")
+    
+    with st.expander("📝 Exercise: Customer Lifetime Value"):
+        st.markdown("""
+        **Scenario:** A subscription business has monthly revenue rate from each customer:
+        R(t) = 100 × e^(-0.02t) (revenue decreases due to churn over time)
+        
+        **Tasks:**
+        1. Calculate total revenue from one customer over 24 months
+        2. What's the customer lifetime value (CLV)?
+        3. If acquisition cost is ₹1,200, is it profitable?
+        4. What's the payback period?
+        """)
+        
+        if st.button("Show Solution", key="integrals_exercise"):
+            st.markdown("---")
+            st.markdown("### 🔍 **Solution:**")
+            
+            # Customer lifetime value analysis
+            t_clv = symbols('t')
+            revenue_rate = 100 * sp.exp(-0.02 * t_clv)
+            
+            # Integrate over 24 months
+            clv_24_months = cached_integrate(revenue_rate, t_clv, 0, 24)
+            
+            # Find when cumulative revenue = acquisition cost
+            cumulative_revenue = cached_integrate(revenue_rate, t_clv, 0, t_clv)
+            
+            st.code(f"""
+Revenue Rate: R(t) = {revenue_rate}
+
+Customer Lifetime Value (24 months):
+CLV = ∫₀²⁴ R(t) dt = {float(clv_24_months):.0f}
+
+Cumulative Revenue Function:
+CR(t) = ∫₀ᵗ R(s) ds = {cumulative_revenue}
+
+Acquisition Cost: ₹1,200
+Profit = ₹{float(clv_24_months) - 1200:.0f}
+            """)
+            
+            if float(clv_24_months) > 1200:
+                st.success(f"""
+                ✅ **Customer Acquisition is Profitable!**
+                - CLV: ₹{float(clv_24_months):.0f}
+                - Profit: ₹{float(clv_24_months) - 1200:.0f}
+                - ROI: {((float(clv_24_months) - 1200)/1200)*100:.1f}%
+                """)
+            else:
+                st.error("❌ Customer acquisition is not profitable over 24 months")
+    
+    # Navigation
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("← Previous: Derivatives"):
+            st.session_state.page = 'calculus_derivatives'
+            st.rerun()
+    
+    with col2:
+        if st.button("🏠 Back to Calculus Overview"):
+            st.session_state.page = 'calculus'
+            st.rerun()
+    
+    st.markdown("---")
+    st.success("""
+    🎉 **Congratulations! Priya's Complete Calculus Journey is Complete!**
+    
+    Priya has mastered both sides of calculus:
+    ✅ **Derivatives** - Measuring rates and finding optimal points
+    ✅ **Integrals** - Calculating totals and accumulated values
+    ✅ **Business Applications** - NPV, optimization, and financial analysis
+    ✅ **Real-World Skills** - From theory to practical decision-making
+    
+    **The Power of Calculus:** Priya can now analyze any changing business data, 
+    find optimal decision points, and calculate accurate total values from rates!
+    """)
+    
+    st.markdown("---")
+
+
+@st.fragment
+def _show_profit_accumulation():
+    """Sections 2-3: profit rate integral, indefinite and definite integrals"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -139,7 +387,7 @@ def show_integrals():
         # Define symbolic variable
         t = symbols('t')
         rate_function = base_rate + growth_rate*t - decay_rate*t**2
-        total_function = integrate(rate_function, t)
+        total_function = cached_integrate(rate_function, t)
         
         st.code(f"""
 Profit Rate: P'(t) = {rate_function}
@@ -147,7 +395,7 @@ Total Profit: P(t) = ∫P'(t)dt = {total_function} + C
         """)
         
         # Verification
-        verification = diff(total_function, t)
+        verification = cached_diff(total_function, t)
         st.success(f"""
         **Verification:** 
         d/dt[{total_function}] = {verification} ✓
@@ -161,8 +409,8 @@ Total Profit: P(t) = ∫P'(t)dt = {total_function} + C
         t_vals = np.linspace(0, 20, 100)
         
         # Convert symbolic expressions to numerical functions
-        rate_numeric = lambdify(t, rate_function, 'numpy')
-        total_numeric = lambdify(t, total_function, 'numpy')
+        rate_numeric = cached_lambdify(t, rate_function)
+        total_numeric = cached_lambdify(t, total_function)
         
         # Calculate values
         rate_vals = rate_numeric(t_vals)
@@ -234,7 +482,7 @@ Total Profit: P(t) = ∫P'(t)dt = {total_function} + C
         
         # Calculate total profit with constant
         total_with_constant = total_function + starting_cash
-        total_with_constant_numeric = lambdify(t, total_with_constant, 'numpy')
+        total_with_constant_numeric = cached_lambdify(t, total_with_constant)
         
         st.code(f"""
 Complete Solution: P(t) = {total_with_constant}
@@ -267,7 +515,7 @@ At t=20 days: P(20) = {float(total_with_constant_numeric(20)):.1f}k
         end_day = st.slider("End Day", start_day+1, 30, 15, 1)
         
         # Calculate definite integral
-        definite_result = integrate(rate_function, (t, start_day, end_day))
+        definite_result = cached_integrate(rate_function, t, start_day, end_day)
         
         st.code(f"""
 Definite Integral: ∫_{start_day}^{end_day} P'(t)dt = {float(definite_result):.1f}k
@@ -307,16 +555,11 @@ Total profit from day {start_day} to day {end_day} = ₹{float(definite_result):
         )
         
         st.plotly_chart(fig, use_container_width=True)
-    
-    # Section 4: Area Under the Curve
-    st.markdown("---")
-    st.header("4️⃣ Area Under the Curve: Visual Understanding")
-    
-    st.markdown("""
-    **Priya's Visualization Breakthrough:** *"I finally see it! The area under any rate curve 
-    IS the total accumulated value. Integration is just a precise way to calculate irregular areas!"*
-    """)
-    
+
+
+@st.fragment
+def _show_area_explorer():
+    """Section 4: area under the curve for each business scenario"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -411,120 +654,11 @@ Total profit from day {start_day} to day {end_day} = ₹{float(definite_result):
         The green shaded area represents the total accumulated 
         value (₹{area_result:.0f}k) from the varying rate over time.
         """)
-    
-    # Section 5: Numerical Integration
-    st.markdown("---")
-    st.header("5️⃣ Numerical Integration: Real-World Data Analysis")
-    
-    st.markdown("""
-    **Priya's Real-World Challenge:** *"Sometimes I don't have a nice mathematical formula - 
-    just daily data points from our accounting system. How do I still calculate total values?"*
-    """)
-    
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        st.subheader("📊 Real Data Integration")
-        
-        st.markdown("""
-        **The Trapezoidal Rule:**
-        When you only have data points, approximate the area using trapezoids.
-        """)
-        
-        # Generate realistic irregular data
-        np.random.seed(42)
-        data_days = np.arange(1, 16)  # 15 days of data
-        base_trend = 40 + 2*data_days - 0.1*data_days**2
-        noise = np.random.normal(0, 3, len(data_days))
-        actual_data = base_trend + noise
-        
-        # Create data table
-        data_df = pd.DataFrame({
-            'Day': data_days,
-            'Daily Cash Flow (₹k)': actual_data.round(1)
-        })
-        
-        st.dataframe(data_df, use_container_width=True)
-        
-        # Numerical integration methods comparison
-        st.markdown("**Integration Methods Comparison:**")
-        
-        # Trapezoidal rule
-        trapz_result = np.trapz(actual_data, data_days)
-        
-        # Simpson's rule (if scipy available)
-        try:
-            simpson_result = scipy_integrate.simpson(actual_data, data_days)
-        except:
-            simpson_result = trapz_result
-        
-        # Simple rectangle rule (for comparison)
-        rectangle_result = np.sum(actual_data) * (data_days[1] - data_days[0])
-        
-        col1_inner, col2_inner = st.columns(2)
-        
-        with col1_inner:
-            st.metric("Rectangle Rule", f"₹{rectangle_result:.0f}k")
-            st.metric("Trapezoidal Rule", f"₹{trapz_result:.0f}k")
-        
-        with col2_inner:
-            st.metric("Simpson's Rule", f"₹{simpson_result:.0f}k")
-            st.write("**Most Accurate** ⭐")
-    
-    with col2:
-        st.subheader("📈 Numerical Integration Visualization")
-        
-        # Visualize different numerical methods
-        fig = go.Figure()
-        
-        # Original data points
-        fig.add_trace(go.Scatter(
-            x=data_days, y=actual_data,
-            mode='markers+lines',
-            name='Actual Data',
-            line=dict(color='blue', width=2),
-            marker=dict(size=8)
-        ))
-        
-        # Trapezoidal approximation
-        for i in range(len(data_days)-1):
-            fig.add_shape(
-                type="line",
-                x0=data_days[i], y0=0, x1=data_days[i], y1=actual_data[i],
-                line=dict(color="red", width=1, dash="dot")
-            )
-            fig.add_shape(
-                type="line", 
-                x0=data_days[i+1], y0=0, x1=data_days[i+1], y1=actual_data[i+1],
-                line=dict(color="red", width=1, dash="dot")
-            )
-            fig.add_shape(
-                type="line",
-                x0=data_days[i], y0=actual_data[i], 
-                x1=data_days[i+1], y1=actual_data[i+1],
-                line=dict(color="red", width=1, dash="dot")
-            )
-        
-        fig.update_layout(
-            title="Trapezoidal Rule Approximation",
-            xaxis_title="Day",
-            yaxis_title="Cash Flow (₹k)",
-            height=400
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        st.info(f"""
-        **Trapezoidal Rule Result:** ₹{trapz_result:.0f}k
-        
-        This method connects data points with straight lines 
-        and calculates the area of resulting trapezoids.
-        """)
-    
-    # Section 6: NPV and Financial Applications
-    st.markdown("---")
-    st.header("6️⃣ Advanced Application: NPV and Cash Flow Analysis")
-    
+
+
+@st.fragment
+def _show_npv_analysis():
+    """Section 6: NPV of a growing cash flow by integration"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -542,14 +676,16 @@ Total profit from day {start_day} to day {end_day} = ₹{float(definite_result):
         
         # Define cash flow function (increasing over time)
         t_npv = symbols('t')
+        r_npv, T_npv = symbols('r T', positive=True)
         annual_cash_flow = 100 + 20*t_npv  # Increasing cash flows
         
-        # Present value function
-        present_value_function = annual_cash_flow * sp.exp(-discount_rate * t_npv)
+        # Present value function, integrated once with the rate and duration left symbolic
+        present_value_function = annual_cash_flow * sp.exp(-r_npv * t_npv)
+        pv_kernel = compile_integral(present_value_function, t_npv, 0, T_npv, (r_npv, T_npv))
         
         # Calculate NPV using integration
-        pv_of_cash_flows = integrate(present_value_function, (t_npv, 0, project_duration))
-        npv = float(pv_of_cash_flows) - initial_investment
+        pv_of_cash_flows = float(pv_kernel(discount_rate, project_duration))
+        npv = pv_of_cash_flows - initial_investment
         
         st.code(f"""
 Cash Flow Function: CF(t) = {annual_cash_flow} lakhs/year
@@ -613,119 +749,15 @@ NPV = PV - Initial Investment
         The area under the present value curve (₹{float(pv_of_cash_flows):.0f} lakhs) 
         represents the total value of all future cash flows in today's money.
         """)
-    
-    # Section 7: Key Business Applications
-    st.markdown("---")
-    st.header("7️⃣ Priya's Integration Mastery Applications")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **💼 Financial Planning**
-        - NPV calculations
-        - Cash flow analysis
-        - Investment evaluation
-        - Retirement planning
-        """)
-    
-    with col2:
-        st.markdown("""
-        **📊 Business Analysis**
-        - Total revenue calculation
-        - Accumulated cost analysis
-        - Customer lifetime value
-        - Market size estimation
-        """)
-    
-    with col3:
-        st.markdown("""
-        **🎯 Risk Management**
-        - Portfolio value integration
-        - Risk exposure calculation
-        - Probability distributions
-        - Expected value analysis
-        """)
-    
-    # Practice Exercise
-    st.markdown("---")
-    st.subheader("💪 Practice: Apply Integration Analysis")
-    
-    with st.expander("📝 Exercise: Customer Lifetime Value"):
-        st.markdown("""
-        **Scenario:** A subscription business has monthly revenue rate from each customer:
-        R(t) = 100 × e^(-0.02t) (revenue decreases due to churn over time)
-        
-        **Tasks:**
-        1. Calculate total revenue from one customer over 24 months
-        2. What's the customer lifetime value (CLV)?
-        3. If acquisition cost is ₹1,200, is it profitable?
-        4. What's the payback period?
-        """)
         
-        if st.button("Show Solution", key="integrals_exercise"):
-            st.markdown("---")
-            st.markdown("### 🔍 **Solution:**")
-            
-            # Customer lifetime value analysis
-            t_clv = symbols('t')
-            revenue_rate = 100 * sp.exp(-0.02 * t_clv)
-            
-            # Integrate over 24 months
-            clv_24_months = integrate(revenue_rate, (t_clv, 0, 24))
-            
-            # Find when cumulative revenue = acquisition cost
-            cumulative_revenue = integrate(revenue_rate, (t_clv, 0, t_clv))
-            
-            st.code(f"""
-Revenue Rate: R(t) = {revenue_rate}
-
-Customer Lifetime Value (24 months):
-CLV = ∫₀²⁴ R(t) dt = {float(clv_24_months):.0f}
-
-Cumulative Revenue Function:
-CR(t) = ∫₀ᵗ R(s) ds = {cumulative_revenue}
-
-Acquisition Cost: ₹1,200
-Profit = ₹{float(clv_24_months) - 1200:.0f}
-            """)
-            
-            if float(clv_24_months) > 1200:
-                st.success(f"""
-                ✅ **Customer Acquisition is Profitable!**
-                - CLV: ₹{float(clv_24_months):.0f}
-                - Profit: ₹{float(clv_24_months) - 1200:.0f}
-                - ROI: {((float(clv_24_months) - 1200)/1200)*100:.1f}%
-                """)
-            else:
-                st.error("❌ Customer acquisition is not profitable over 24 months")
-    
-    # Navigation
-    st.markdown("---")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("← Previous: Derivatives"):
-            st.session_state.page = 'calculus_derivatives'
-            st.rerun()
-    
-    with col2:
-        if st.button("🏠 Back to Calculus Overview"):
-            st.session_state.page = 'calculus'
-            st.rerun()
-    
-    st.markdown("---")
-    st.success("""
-    🎉 **Congratulations! Priya's Complete Calculus Journey is Complete!**
-    
-    Priya has mastered both sides of calculus:
-    ✅ **Derivatives** - Measuring rates and finding optimal points
-    ✅ **Integrals** - Calculating totals and accumulated values
-    ✅ **Business Applications** - NPV, optimization, and financial analysis
-    ✅ **Real-World Skills** - From theory to practical decision-making
-    
-    **The Power of Calculus:** Priya can now analyze any changing business data, 
-    find optimal decision points, and calculate accurate total values from rates!
-    """)
-    
-    st.markdown("---")
\ No newline at end of file
+        # Sweep the whole discount-rate slider range in one kernel call
+        rate_grid = np.linspace(0.01, 0.15, 281)
+        npv_grid = pv_kernel(rate_grid, project_duration) - initial_investment
+        positive_rates = rate_grid[npv_grid > 0]
+        if len(positive_rates) == len(rate_grid):
+            st.caption("NPV stays positive for every discount rate from 1% to 15%.")
+        elif len(positive_rates) == 0:
+            st.caption("NPV is negative for every discount rate from 1% to 15%.")
+        else:
+            st.caption(f"Break-even discount rate ≈ {positive_rates.max()*100:.2f}% "
+                       f"(NPV turns negative above it).")
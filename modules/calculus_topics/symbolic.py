@@ -0,0 +1,102 @@
+import sympy as sp
+
+from modules.byte_cache import LRUCache
+
+# Process-wide cache for the symbolic work done by the calculus pages.
+#
+# Every slider move rebuilds the page's sympy expressions, but only a
+# handful of distinct parameter combinations are ever used. Results are
+# keyed by the operation, the structural form of the expression (sp.srepr,
+# which includes the numeric parameter values baked into it) and the
+# operation's arguments, and evicted least-recently-used first. Cached
+# values are sympy expressions (immutable) or lambdified NumPy callables,
+# so they are safe to share between sessions.
+
+
+_cache = LRUCache(maxsize=256)
+
+
+def _key(operation, expr, *args):
+    return (operation, sp.srepr(expr)) + tuple(sp.srepr(arg) for arg in args)
+
+
+def cached_diff(expr, var, order=1):
+    """diff(expr, var, order), computed once per distinct expression"""
+    return _cache.get_or_compute(
+        _key('diff', expr, var, order),
+        lambda: sp.diff(expr, var, order)
+    )
+
+
+def cached_integrate(expr, var, lower=None, upper=None):
+    """Antiderivative of expr, or the definite integral when both limits are given"""
+    if lower is None or upper is None:
+        return _cache.get_or_compute(
+            _key('integrate', expr, var),
+            lambda: sp.integrate(expr, var)
+        )
+    return _cache.get_or_compute(
+        _key('integrate', expr, var, lower, upper),
+        lambda: sp.integrate(expr, (var, lower, upper))
+    )
+
+
+def cached_solve(expr, var):
+    """Roots of expr = 0 in var, as a tuple"""
+    return _cache.get_or_compute(
+        _key('solve', expr, var),
+        lambda: tuple(sp.solve(expr, var))
+    )
+
+
+def cached_lambdify(var, expr):
+    """NumPy callable for expr in var"""
+    return _cache.get_or_compute(
+        _key('lambdify', expr, var),
+        lambda: sp.lambdify(var, expr, 'numpy')
+    )
+
+
+class ParametricKernel:
+    """Closed-form expression in symbolic parameters, evaluated with NumPy.
+
+    The symbolic work (integration, differentiation) happens once, with the
+    slider-controlled quantities left as symbols. Calling the kernel with
+    one value per parameter, in order, only evaluates the NumPy function.
+    Arrays broadcast, so a whole parameter sweep is a single call.
+    """
+
+    def __init__(self, expr, params):
+        self.expr = expr
+        self.params = tuple(params)
+        self._numeric = sp.lambdify(self.params, expr, 'numpy')
+
+    def __call__(self, *values):
+        return self._numeric(*values)
+
+
+def compile_expression(expr, params):
+    """ParametricKernel for expr as a function of params"""
+    params = tuple(params)
+    return _cache.get_or_compute(
+        _key('kernel', expr, *params),
+        lambda: ParametricKernel(expr, params)
+    )
+
+
+def compile_integral(expr, var, lower, upper, params):
+    """ParametricKernel for the definite integral of expr, with symbolic limits allowed"""
+    params = tuple(params)
+    return _cache.get_or_compute(
+        _key('kernel_integral', expr, var, lower, upper, *params),
+        lambda: ParametricKernel(sp.integrate(expr, (var, lower, upper)), params)
+    )
+
+
+def cache_info():
+    """Hit/miss counters and size of the process-wide symbolic cache"""
+    return _cache.info()
+
+
+def clear_cache():
+    _cache.clear()
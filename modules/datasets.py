@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Synthetic demo datasets shared by every session.
+#
+# Each dataset is built once per process with its own np.random.Generator,
+# so pages never reseed or consume the global NumPy RNG. st.cache_resource
+# hands back the cached object itself (no pickling, no copy), so arrays are
+# marked read-only and DataFrames are built on such arrays without a copy.
+
+SEED = 42
+
+
+def _read_only(*arrays):
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays if len(arrays) > 1 else arrays[0]
+
+
+@st.cache_resource(show_spinner=False)
+def pca_customer_data():
+    """100 customers x 8 correlated attributes for the PCA page"""
+    rng = np.random.default_rng(SEED)
+    n_customers = 100
+
+    # Create correlated customer data (realistic business scenario)
+    base_customer_level = rng.normal(0, 1, n_customers)
+    spending_style = rng.normal(0, 0.5, n_customers)
+
+    columns = {
+        'Age': 30 + base_customer_level * 10 + rng.normal(0, 3, n_customers),
+        'Income': 500 + base_customer_level * 200 + rng.normal(0, 50, n_customers),
+        'Spending': 100 + base_customer_level * 60 + spending_style * 30 + rng.normal(0, 20, n_customers),
+        'Online_Hours': 20 + base_customer_level * 10 + spending_style * 5 + rng.normal(0, 5, n_customers),
+        'Store_Visits': 8 + base_customer_level * 3 + rng.normal(0, 2, n_customers),
+        'Product_Categories': 5 + base_customer_level * 2 + spending_style * 1 + rng.normal(0, 1, n_customers),
+        'Loyalty_Score': 60 + base_customer_level * 20 + rng.normal(0, 10, n_customers),
+        'Review_Count': 10 + base_customer_level * 5 + spending_style * 3 + rng.normal(0, 3, n_customers)
+    }
+
+    # Ensure positive values
+    data = _read_only(np.maximum(np.column_stack(list(columns.values())), 0))
+    return pd.DataFrame(data, columns=list(columns), copy=False)
+
+
+@st.cache_resource(show_spinner=False)
+def sample_customer_matrix(max_customers=10):
+    """Age, income (₹k) and spending (₹k) rows for the vectors & matrices page.
+
+    Slice the first n rows for a smaller matrix; slicing returns a view.
+    """
+    rng = np.random.default_rng(SEED)
+    ages = rng.integers(25, 65, max_customers)
+    incomes = rng.integers(300, 1500, max_customers)
+    spendings = incomes * 0.15 + rng.integers(-50, 50, max_customers)
+
+    return _read_only(np.column_stack((ages, incomes, spendings)))
+
+
+@st.cache_resource(show_spinner=False)
+def daily_cash_flows():
+    """15 days of noisy cash flow data (₹k) for the numerical integration section"""
+    rng = np.random.default_rng(SEED)
+    data_days = np.arange(1, 16)
+    base_trend = 40 + 2*data_days - 0.1*data_days**2
+    actual_data = base_trend + rng.normal(0, 3, len(data_days))
+
+    return _read_only(data_days, actual_data)
+
+
+@st.cache_resource(show_spinner=False)
+def delivery_customer_distances():
+    """Customer distances (km, at most 10) for Maya's delivery pricing"""
+    rng = np.random.default_rng(SEED)
+    customer_distances = rng.exponential(2.5, 100)  # Most customers are nearby
+
+    return _read_only(customer_distances[customer_distances <= 10])
+
+
+@st.cache_resource(show_spinner=False)
+def noisy_daily_sales():
+    """30 days of linear sales plus noise for the statistics demo"""
+    rng = np.random.default_rng(SEED)
+    days = np.arange(1, 31)
+    true_sales = 1000 + 10 * days  # Perfect mathematical relationship
+    noisy_sales = true_sales + rng.normal(0, 50, len(days))  # Real-world data with noise
+
+    return _read_only(days, true_sales, noisy_sales)
+
+
+@st.cache_resource(show_spinner=False)
+def ml_customers():
+    """200 customers (age, income, spending) for the machine learning demo"""
+    rng = np.random.default_rng(SEED)
+    n_customers = 200
+
+    age = rng.normal(35, 10, n_customers)
+    income = age * 2000 + rng.normal(0, 10000, n_customers)
+    spending = 0.3 * income + 50 * age + rng.normal(0, 5000, n_customers)
+
+    return _read_only(age, income, spending)
+
+
+@st.cache_resource(show_spinner=False)
+def ml_customer_clusters():
+    """K-means (k=3) labels for ml_customers(); raises ImportError without scikit-learn"""
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.cluster import KMeans
+
+    data_scaled = StandardScaler().fit_transform(np.column_stack(ml_customers()))
+    kmeans = KMeans(n_clusters=3, random_state=SEED, n_init=10)
+
+    return _read_only(kmeans.fit_predict(data_scaled))
+
+
+@st.cache_resource(show_spinner=False)
+def treasury_return_scenarios(max_assets=40, n_scenarios=1000):
+    """Annual return scenarios (n_scenarios x max_assets) for the treasury frontier.
+
+    A three-factor model (equity market, interest rates, credit) over a mix
+    of equity funds, bond funds and deposits. Take the first n columns for
+    a smaller universe.
+    """
+    rng = np.random.default_rng(SEED)
+    kinds = np.resize(['Equity', 'Bond', 'Deposit'], max_assets)
+    names = [f"{kind} {i // 3 + 1}" for i, kind in enumerate(kinds)]
+
+    mean = {'Equity': (0.08, 0.16), 'Bond': (0.05, 0.08), 'Deposit': (0.04, 0.06)}
+    loadings = {'Equity': (1.0, -0.2, 0.3), 'Bond': (0.1, 0.8, 0.4), 'Deposit': (0.0, 0.1, 0.0)}
+    idiosyncratic = {'Equity': 0.12, 'Bond': 0.03, 'Deposit': 0.005}
+
+    expected = np.array([rng.uniform(*mean[kind]) for kind in kinds])
+    beta = np.array([loadings[kind] for kind in kinds]) * rng.uniform(0.6, 1.4, (max_assets, 3))
+    factors = rng.normal(0, [0.16, 0.05, 0.04], (n_scenarios, 3))
+    noise = rng.normal(0, [idiosyncratic[kind] for kind in kinds], (n_scenarios, max_assets))
+
+    scenarios = _read_only(expected + factors @ beta.T + noise)
+    return pd.DataFrame(scenarios, columns=names, copy=False)
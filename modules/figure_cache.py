@@ -0,0 +1,74 @@
+import io
+
+import streamlit as st
+
+from modules.byte_cache import ByteCache
+from modules.figures import managed_figure
+from modules.instrumentation import timed_chart
+
+# Rendered images of the algebra pages' 2x2 matplotlib dashboards.
+#
+# Building a 15x12 inch figure, running tight_layout and rasterising it is
+# the slowest step on those pages, yet the figure depends only on the
+# page's slider values. Each dashboard is drawn by a plain function of
+# those values; its PNG (or SVG) bytes are cached process-wide under
+# (drawing function, figure size, format, slider values), so every session
+# that lands on a combination already seen gets the image without touching
+# matplotlib. The figure is released as soon as it has been saved.
+
+# Same output st.pyplot produces by default
+SAVEFIG_OPTIONS = {'bbox_inches': 'tight', 'dpi': 200}
+DASHBOARD_SIZE = (15, 12)
+
+
+_cache = ByteCache()
+
+
+def _render(draw, params, fmt, figsize):
+    with managed_figure(figsize=figsize) as fig:
+        draw(fig, *params)
+        fig.tight_layout()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, **SAVEFIG_OPTIONS)
+        return buffer.getvalue()
+
+
+def _key(draw, params, fmt, figsize):
+    return (draw.__module__, draw.__qualname__, figsize, fmt, params)
+
+
+def render_figure(draw, *params, fmt='png', figsize=DASHBOARD_SIZE):
+    """Image bytes of draw(fig, *params), rendered once per distinct set of params.
+
+    draw gets a new figure of size figsize and must draw into it from its
+    arguments alone (hashable slider values), so equal arguments give
+    equal images.
+    """
+    return _cache.get_or_compute(
+        _key(draw, params, fmt, figsize), lambda: _render(draw, params, fmt, figsize)
+    )
+
+
+def show_figure(draw, *params, fmt='png', figsize=DASHBOARD_SIZE):
+    """st.pyplot replacement for a cached dashboard figure.
+
+    Under ?perf=1 the render (or cache hit) and display are recorded as
+    one 'figure' / 'figure (cached)' chart of the page profile.
+    """
+    key = _key(draw, params, fmt, figsize)
+    image = _cache.get(key)
+    with timed_chart('figure' if image is None else 'figure (cached)'):
+        if image is None:
+            image = _render(draw, params, fmt, figsize)
+            _cache.put(key, image)
+        if fmt == 'svg':
+            image = image.decode('utf-8')
+        st.image(image, use_container_width=True)
+
+
+def cache_info():
+    return _cache.info()
+
+
+def clear_cache():
+    _cache.clear()
@@ -0,0 +1,67 @@
+import contextlib
+import os
+import sys
+import weakref
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Matplotlib figures without pyplot.
+#
+# plt.subplots registers every figure with pyplot's global figure manager,
+# which keeps it alive until plt.close - across reruns and sessions of a
+# long-running server. Figures made here are plain Figure objects with
+# their own Agg canvas: nothing global holds on to them, release() frees
+# their artists straight away, and the live count below shows whether any
+# page forgets to.
+
+_live = weakref.WeakSet()
+
+
+def new_figure(**kwargs):
+    """Agg-backed Figure outside pyplot's figure manager (Figure kwargs, e.g. figsize)"""
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    _live.add(fig)
+    return fig
+
+
+def release(fig):
+    """Drop the figure's axes and artists; the Figure itself is then garbage"""
+    fig.clear()
+    _live.discard(fig)
+
+
+@contextlib.contextmanager
+def managed_figure(**kwargs):
+    """new_figure() that is released when the block exits, even on errors"""
+    fig = new_figure(**kwargs)
+    try:
+        yield fig
+    finally:
+        release(fig)
+
+
+def rss_megabytes():
+    """Resident memory of this process in MB, or None if it can't be read"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 ** 2
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def figure_stats():
+    """Figures still alive (managed and pyplot) and the process RSS"""
+    pyplot = sys.modules.get('matplotlib.pyplot')
+    return {
+        'live_figures': len(_live),
+        'pyplot_figures': len(pyplot.get_fignums()) if pyplot is not None else 0,
+        'rss_mb': rss_megabytes(),
+    }
@@ -0,0 +1,233 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+# Loan and cash-flow maths shared by the series & sequences pages.
+#
+# Loan rates follow the page sliders: annual rates in percent, compounded
+# monthly. NPV/IRR rates are fractions per period (0.1 = 10%). Everything
+# is closed-form NumPy, so a 360-month schedule, a batch of loan
+# configurations or a whole NPV profile costs one array expression
+# instead of a Python loop per month or per rate.
+
+
+def emi(principal, annual_rate, months):
+    """Equated monthly instalment P × r × (1+r)ⁿ / ((1+r)ⁿ - 1).
+
+    Accepts scalars or arrays (broadcast together). A 0% rate repays
+    the principal in equal parts.
+    """
+    principal = np.asarray(principal, dtype=float)
+    r = np.asarray(annual_rate, dtype=float) / 1200
+    months = np.asarray(months, dtype=float)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = (1 + r) ** months
+        payment = np.where(r > 0, principal * r * growth / (growth - 1), principal / months)
+    return payment if payment.ndim else float(payment)
+
+
+def balance_after(principal, annual_rate, months, elapsed):
+    """Outstanding balance after `elapsed` EMIs of a level-payment loan.
+
+    B_k = P(1+r)^k - EMI × ((1+r)^k - 1) / r, broadcast over every argument.
+    """
+    principal = np.asarray(principal, dtype=float)
+    r = np.asarray(annual_rate, dtype=float) / 1200
+    elapsed = np.asarray(elapsed, dtype=float)
+    payment = emi(principal, annual_rate, months)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = (1 + r) ** elapsed
+        balance = np.where(r > 0, principal * growth - payment * (growth - 1) / r,
+                           principal - payment * elapsed)
+    balance = np.maximum(balance, 0)
+    return balance if balance.ndim else float(balance)
+
+
+def months_to_repay(balance, annual_rate, payment):
+    """Whole months needed to clear `balance` with a fixed monthly payment"""
+    r = annual_rate / 1200
+    if balance <= 0:
+        return 0
+    if r == 0:
+        return math.ceil(balance / payment)
+    if payment <= balance * r:
+        raise ValueError("payment does not cover the monthly interest")
+    exact = -math.log(1 - balance * r / payment) / math.log(1 + r)
+    return math.ceil(exact - 1e-9)
+
+
+def _segment(balance, r, payment, length, pays_off):
+    """Closed-form rows for `length` months at a fixed rate and payment"""
+    k = np.arange(1, length + 1)
+    growth = (1 + r) ** k
+    if r > 0:
+        balances = balance * growth - payment * (growth - 1) / r
+    else:
+        balances = balance - payment * k
+    previous = np.concatenate([[balance], balances[:-1]])
+
+    payments = np.full(length, float(payment))
+    if pays_off:
+        # The last month of the term clears whatever is left
+        payments[-1] = previous[-1] * (1 + r)
+        balances[-1] = 0.0
+
+    interest = previous * r
+    return payments, interest, payments - interest, np.maximum(balances, 0)
+
+
+def amortization_schedule(principal, annual_rate, months, prepayments=None,
+                          rate_changes=None, keep_emi=False):
+    """Month-by-month schedule as a DataFrame.
+
+    prepayments: {month: amount} paid on top of that month's EMI.
+    rate_changes: {month: annual rate %} applied from that month onwards.
+    keep_emi: after a prepayment or rate change keep the EMI and change the
+        tenure; by default the tenure is kept and the EMI recomputed.
+
+    Columns: month, annual_rate, payment, interest, principal, prepayment,
+    balance. The schedule is evaluated in closed form between events, so
+    its cost grows with the number of events, not the number of months.
+    """
+    prepayments = dict(prepayments or {})
+    rate_changes = dict(rate_changes or {})
+
+    rate = annual_rate
+    if 1 in rate_changes:
+        rate = rate_changes[1]
+    payment = emi(principal, rate, months)
+    balance = float(principal)
+    month = 0
+    end = months
+    pieces = []
+
+    while balance > 0 and month < end:
+        if month > 0 and month + 1 in rate_changes:
+            rate = rate_changes[month + 1]
+            if keep_emi:
+                end = month + months_to_repay(balance, rate, payment)
+            else:
+                payment = emi(balance, rate, end - month)
+
+        # Run in closed form until the next event or the end of the term
+        stops = [end]
+        stops += [m - 1 for m in rate_changes if m - 1 > month]
+        stops += [m for m in prepayments if m > month]
+        segment_end = min(stops)
+
+        payments, interest, principal_part, balances = _segment(
+            balance, rate / 1200, payment, segment_end - month, segment_end == end
+        )
+        extra = np.zeros(len(payments))
+
+        if segment_end in prepayments and balances[-1] > 0:
+            extra[-1] = min(prepayments[segment_end], balances[-1])
+            balances[-1] -= extra[-1]
+
+        pieces.append(pd.DataFrame({
+            'month': np.arange(month + 1, segment_end + 1),
+            'annual_rate': rate,
+            'payment': payments,
+            'interest': interest,
+            'principal': principal_part,
+            'prepayment': extra,
+            'balance': balances,
+        }))
+
+        month = segment_end
+        balance = float(balances[-1])
+        if extra[-1] > 0 and balance > 0:
+            if keep_emi:
+                end = month + months_to_repay(balance, rate, payment)
+            else:
+                payment = emi(balance, rate, end - month)
+
+    return pd.concat(pieces, ignore_index=True)
+
+
+def amortization_batch(principal, annual_rate, months):
+    """Schedules for many level-payment loans at once.
+
+    Arguments broadcast to a 1-D batch of loan configurations. Returns a
+    dict of (n_loans, max_months) arrays - interest, principal and balance -
+    padded with NaN after each loan's tenure, plus the emi per loan.
+    """
+    principal, annual_rate, months = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(principal, dtype=float)),
+        np.atleast_1d(np.asarray(annual_rate, dtype=float)),
+        np.atleast_1d(np.asarray(months, dtype=int)),
+    )
+    payments = np.atleast_1d(emi(principal, annual_rate, months))
+
+    k = np.arange(0, months.max() + 1)[None, :]
+    balances = balance_after(principal[:, None], annual_rate[:, None], months[:, None], k)
+    balances = np.atleast_2d(balances)
+
+    previous = balances[:, :-1]
+    interest = previous * (annual_rate[:, None] / 1200)
+    principal_part = previous - balances[:, 1:]
+
+    beyond = k[:, 1:] > months[:, None]
+    for values in (interest, principal_part):
+        values[beyond] = np.nan
+    balance = balances[:, 1:].copy()
+    balance[beyond] = np.nan
+
+    return {
+        'emi': payments,
+        'interest': interest,
+        'principal': principal_part,
+        'balance': balance,
+    }
+
+
+def npv(rate, cash_flows):
+    """Net present value of cash_flows[t] received at the end of year t.
+
+    cash_flows[0] is today's flow (usually the negative investment). With
+    v = 1/(1+rate) the NPV is the polynomial Σ cf_t vᵗ, so a whole array of
+    rates is one vectorized np.polyval call.
+    """
+    flows = np.asarray(cash_flows, dtype=float)
+    v = 1 / (1 + np.asarray(rate, dtype=float))
+    value = np.polyval(flows[::-1], v)
+    return value if np.ndim(value) else float(value)
+
+
+def irr(cash_flows):
+    """Every real internal rate of return above -100%, ascending.
+
+    Roots of the NPV polynomial in v = 1/(1+r), polished with a few Newton
+    steps. Conventional flows (one sign change) have exactly one IRR;
+    non-conventional flows can have several or none, and all are returned.
+    """
+    flows = np.trim_zeros(np.asarray(cash_flows, dtype=float), 'b')
+    if len(flows) < 2:
+        return np.array([])
+
+    coefficients = flows[::-1]
+    derivative = np.polyder(coefficients)
+    roots = np.roots(coefficients)
+
+    real = roots[(np.abs(roots.imag) <= 1e-7 * np.maximum(1, np.abs(roots))) & (roots.real > 0)].real
+    for _ in range(3):
+        slope = np.polyval(derivative, real)
+        step = np.divide(np.polyval(coefficients, real), slope,
+                         out=np.zeros_like(real), where=slope != 0)
+        real = real - step
+
+    rates = np.sort(1 / real[real > 0] - 1)
+    # Repeated roots come back as near-duplicates
+    if len(rates) > 1:
+        rates = rates[np.concatenate([[True], np.diff(rates) > 1e-9])]
+    return rates
+
+
+def sign_changes(cash_flows):
+    """Number of sign changes in the cash flows (zeros ignored)"""
+    signs = np.sign(np.asarray(cash_flows, dtype=float))
+    signs = signs[signs != 0]
+    return int(np.count_nonzero(signs[1:] != signs[:-1]))
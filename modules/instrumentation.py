@@ -0,0 +1,295 @@
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+import streamlit as st
+
+# Opt-in render instrumentation for the show_* pages.
+#
+# Enable with ?perf=1 in the URL or MATHDASH_PERF=1 in the environment.
+# While a page renders, every st.header call starts a new section (the
+# numbered "1️⃣", "2️⃣", ... blocks), and every st.plotly_chart / st.pyplot
+# call (and every cached dashboard figure, via timed_chart) is timed on its
+# own. The profile is shown in a debug expander at the
+# bottom of the page and can be downloaded as JSON. Allocation numbers come
+# from tracemalloc. With MATHDASH_PERF=1 it stays on for the process; a
+# ?perf=1 run only traces while it (or another profiled run) is active, so
+# a visitor's URL flag never leaves tracing overhead on every session.
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+
+_tracing_lock = threading.Lock()
+_tracing_runs = 0  # profiled runs using tracemalloc started by this module
+
+# tracemalloc's peak is process-wide, so a section's peak is only its own
+# when no other profiled run overlaps it
+_profiling_lock = threading.Lock()
+_profiling = 0  # profiled runs in progress
+_profile_starts = 0  # profiled runs started so far
+
+
+def _perf_env():
+    return os.environ.get('MATHDASH_PERF') == '1'
+
+
+def perf_enabled():
+    if _perf_env():
+        return True
+    return st.query_params.get('perf') == '1'
+
+
+def _start_tracing():
+    """Start tracemalloc for a profiled run; returns True if _stop_tracing must follow"""
+    global _tracing_runs
+    with _tracing_lock:
+        if _perf_env():
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            return False
+        if _tracing_runs == 0 and tracemalloc.is_tracing():
+            return False  # started elsewhere (e.g. python -X tracemalloc); leave it alone
+        if _tracing_runs == 0:
+            tracemalloc.start()
+        _tracing_runs += 1
+        return True
+
+
+def _begin_profiling():
+    global _profiling, _profile_starts
+    with _profiling_lock:
+        _profiling += 1
+        _profile_starts += 1
+
+
+def _end_profiling():
+    global _profiling
+    with _profiling_lock:
+        _profiling -= 1
+
+
+def _profiling_state():
+    """(runs in progress, runs started so far)"""
+    with _profiling_lock:
+        return _profiling, _profile_starts
+
+
+def _stop_tracing():
+    global _tracing_runs
+    with _tracing_lock:
+        _tracing_runs -= 1
+        if _tracing_runs == 0:
+            tracemalloc.stop()
+
+
+class RenderProfile:
+    """Wall time, allocation and chart count per section of one page run"""
+
+    def __init__(self, page):
+        self.page = page
+        self.sections = []
+        self.charts = []
+        self._current = None
+        self._started = time.perf_counter()
+
+    def start_section(self, name):
+        self.end_section()
+        tracemalloc.reset_peak()
+        self._current = {
+            'section': name,
+            '_start': time.perf_counter(),
+            '_mem': tracemalloc.get_traced_memory()[0],
+            '_profiling': _profiling_state(),
+            'charts': 0,
+            'traces': 0,
+        }
+
+    def end_section(self):
+        if self._current is None:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        section = self._current
+        # Another profiled run during the section resets and shares the peak
+        running, started = section.pop('_profiling')
+        alone = running == 1 and _profiling_state() == (1, started)
+        self.sections.append({
+            'section': section['section'],
+            'seconds': time.perf_counter() - section.pop('_start'),
+            'alloc_kb': (current - section['_mem']) / 1024,
+            'peak_kb': (peak - section.pop('_mem')) / 1024 if alone else None,
+            'charts': section['charts'],
+            'traces': section['traces'],
+        })
+        self._current = None
+
+    def record_chart(self, kind, seconds, alloc_kb, traces):
+        section = self._current['section'] if self._current else None
+        self.charts.append({
+            'section': section,
+            'kind': kind,
+            'seconds': seconds,
+            'alloc_kb': alloc_kb,
+            'traces': traces,
+        })
+        if self._current is not None:
+            self._current['charts'] += 1
+            self._current['traces'] += traces
+
+    def finish(self):
+        self.end_section()
+        self.total_seconds = time.perf_counter() - self._started
+
+    def to_dict(self):
+        return {
+            'page': self.page,
+            'total_seconds': getattr(self, 'total_seconds', None),
+            'sections': self.sections,
+            'charts': self.charts,
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+
+
+def current_profile():
+    return getattr(_local, 'profile', None)
+
+
+def _wrap_header(original):
+    def header(body, *args, **kwargs):
+        profile = current_profile()
+        if profile is not None:
+            profile.start_section(str(body))
+        return original(body, *args, **kwargs)
+    header.__wrapped__ = original
+    return header
+
+
+@contextlib.contextmanager
+def timed_chart(kind, traces=1):
+    """Record the block as one chart of the active profile; a no-op without one"""
+    profile = current_profile()
+    if profile is None:
+        yield
+        return
+
+    mem_before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    yield
+    profile.record_chart(
+        kind,
+        time.perf_counter() - start,
+        (tracemalloc.get_traced_memory()[0] - mem_before) / 1024,
+        traces,
+    )
+
+
+def _wrap_chart(original, kind):
+    def chart(*args, **kwargs):
+        if current_profile() is None:
+            return original(*args, **kwargs)
+
+        figure = args[0] if args else kwargs.get('figure_or_data', kwargs.get('fig'))
+        traces = len(getattr(figure, 'data', ()) or ()) if kind == 'plotly_chart' else 1
+        with timed_chart(kind, traces):
+            return original(*args, **kwargs)
+    chart.__wrapped__ = original
+    return chart
+
+
+def install():
+    """Wrap st.header, st.plotly_chart and st.pyplot once per process.
+
+    The wrappers only record while a profile is active on the current
+    script thread, so other sessions are not affected.
+    """
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        st.header = _wrap_header(st.header)
+        st.plotly_chart = _wrap_chart(st.plotly_chart, 'plotly_chart')
+        st.pyplot = _wrap_chart(st.pyplot, 'pyplot')
+        _installed = True
+
+
+@contextlib.contextmanager
+def profile_page(page):
+    """Profile one page run when instrumentation is enabled, otherwise do nothing"""
+    if not perf_enabled():
+        yield None
+        return
+
+    install()
+    started_tracing = _start_tracing()
+    _begin_profiling()
+
+    profile = RenderProfile(page)
+    profile.start_section('Page header')
+    _local.profile = profile
+    try:
+        yield profile
+    finally:
+        _local.profile = None
+        profile.finish()
+        _end_profiling()
+        if started_tracing:
+            _stop_tracing()
+
+    st.session_state['_perf_profile'] = profile.to_dict()
+    show_debug_panel(profile)
+
+
+def show_debug_panel(profile):
+    """Hidden debug panel listing section and chart timings"""
+    import pandas as pd
+
+    with st.expander("🛠️ Render profile (debug)", expanded=False):
+        st.write(f"**Page:** `{profile.page}` — total {profile.total_seconds * 1000:.1f} ms")
+
+        if profile.sections:
+            sections_df = pd.DataFrame(profile.sections)
+            sections_df['ms'] = sections_df.pop('seconds') * 1000
+            st.dataframe(
+                sections_df.sort_values('ms', ascending=False).round(1),
+                use_container_width=True
+            )
+            st.caption(
+                "Memory is traced process-wide: peak_kb is left empty for sections "
+                "that overlapped another profiled session."
+            )
+
+        if profile.charts:
+            charts_df = pd.DataFrame(profile.charts)
+            charts_df['ms'] = charts_df.pop('seconds') * 1000
+            st.dataframe(charts_df.round(1), use_container_width=True)
+
+        # Process-wide caches, only reported once their page module is loaded
+        symbolic = sys.modules.get('modules.calculus_topics.symbolic')
+        if symbolic is not None:
+            st.write("**Symbolic cache:**", symbolic.cache_info())
+        figure_cache = sys.modules.get('modules.figure_cache')
+        if figure_cache is not None:
+            st.write("**Figure cache:**", figure_cache.cache_info())
+        pdfs = sys.modules.get('modules.pdf_cache')
+        if pdfs is not None:
+            st.write("**PDF cache:**", pdfs.cache_info())
+        lp_models = sys.modules.get('modules.optimization_engine.model')
+        if lp_models is not None:
+            st.write("**LP models:**", lp_models.solve_stats())
+        figures = sys.modules.get('modules.figures')
+        if figures is not None:
+            st.write("**Figures:**", figures.figure_stats())
+
+        st.download_button(
+            "📥 Download profile JSON",
+            profile.to_json(),
+            file_name=f"render_profile_{profile.page}.json",
+            mime="application/json",
+            key="perf_profile_download"
+        )
@@ -4,7 +4,7 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
+from modules.linear_algebra_topics.trajectories import normalized_trajectories, convergence
 
 def show_eigenvalues_eigenvectors():
     # Header with navigation
@@ -117,47 +117,8 @@ Market Matrix A = [[1.05, 0.02],
         """)
     
     with col2:
-        st.subheader("🧪 Portfolio Evolution Simulator")
-        
-        # Interactive portfolio transformation
-        initial_stocks = st.slider("Initial Stock %", 0, 100, 60, key="initial_stocks")
-        initial_bonds = 100 - initial_stocks
-        
-        # Simulate portfolio evolution
-        portfolio = np.array([initial_stocks/100, initial_bonds/100])
-        evolution = [portfolio.copy()]
-        
-        for month in range(12):
-            portfolio = A @ portfolio
-            # Normalize to ensure percentages add to 1
-            portfolio = portfolio / np.sum(portfolio)
-            evolution.append(portfolio.copy())
-        
-        # Display evolution
-        months_sim = list(range(13))
-        stock_evolution = [p[0]*100 for p in evolution]
-        bond_evolution = [p[1]*100 for p in evolution]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=months_sim, y=stock_evolution, mode='lines+markers',
-                                name='Stocks %', line=dict(color='red')))
-        fig.add_trace(go.Scatter(x=months_sim, y=bond_evolution, mode='lines+markers',
-                                name='Bonds %', line=dict(color='blue')))
-        
-        fig.update_layout(
-            title="Portfolio Evolution Over 12 Months",
-            xaxis_title="Month",
-            yaxis_title="Allocation %",
-            height=300
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        st.info(f"""
-        **Final Portfolio:** {stock_evolution[-1]:.1f}% stocks, {bond_evolution[-1]:.1f}% bonds
-        
-        **Arjun's Observation:** *"No matter where we start, portfolios drift toward similar ratios!"*
-        """)
+        # st.fragment: moving this slider reruns only the simulator
+        _show_portfolio_simulator(A)
     
     # Section 3: The Mathematical Discovery
     st.markdown("---")
@@ -242,19 +203,13 @@ Eigenvector 2: [{eigenvectors_norm[0,1]:.2f}, {eigenvectors_norm[1,1]:.2f}]
             marker=dict(size=10)
         ))
         
-        # Add some sample portfolio trajectories
-        for start in [[0.8, 0.2], [0.4, 0.6], [0.6, 0.4]]:
-            portfolio = np.array(start)
-            trajectory_x, trajectory_y = [portfolio[0]], [portfolio[1]]
-            
-            for _ in range(20):
-                portfolio = A @ portfolio
-                portfolio = portfolio / np.sum(portfolio)
-                trajectory_x.append(portfolio[0])
-                trajectory_y.append(portfolio[1])
-            
+        # Add sample portfolio trajectories (20 steps for every start in one call)
+        starting_stocks = np.linspace(0.1, 0.9, 9)
+        starts = np.column_stack([starting_stocks, 1 - starting_stocks])
+        
+        for trajectory in normalized_trajectories(A, starts, 20):
             fig.add_trace(go.Scatter(
-                x=trajectory_x, y=trajectory_y,
+                x=trajectory[:, 0], y=trajectory[:, 1],
                 mode='lines',
                 line=dict(color='lightblue', width=2, dash='dash'),
                 showlegend=False
@@ -323,67 +278,8 @@ Eigenvector 2: [{eigenvectors_norm[0,1]:.2f}, {eigenvectors_norm[1,1]:.2f}]
     
     st.subheader("🧪 Portfolio Stability Tester")
     
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        st.markdown("**Try Different Starting Portfolios:**")
-        
-        test_stocks = st.slider("Test Portfolio - Stock %", 0, 100, 70, key="test_stocks")
-        test_bonds = 100 - test_stocks
-        
-        # Test portfolio evolution
-        test_portfolio = np.array([test_stocks/100, test_bonds/100])
-        test_evolution = [test_portfolio.copy()]
-        
-        for month in range(60):  # 5 years
-            test_portfolio = A @ test_portfolio
-            test_portfolio = test_portfolio / np.sum(test_portfolio)
-            test_evolution.append(test_portfolio.copy())
-        
-        final_stocks = test_evolution[-1][0] * 100
-        final_bonds = test_evolution[-1][1] * 100
-        
-        st.write(f"**Starting:** {test_stocks}% stocks, {test_bonds}% bonds")
-        st.write(f"**After 5 years:** {final_stocks:.1f}% stocks, {final_bonds:.1f}% bonds")
-        
-        # Check which eigenvector it's closest to
-        final_portfolio = np.array([final_stocks/100, final_bonds/100])
-        
-        dist1 = np.linalg.norm(final_portfolio - eigenvectors_norm[:, 0])
-        dist2 = np.linalg.norm(final_portfolio - eigenvectors_norm[:, 1])
-        
-        if dist1 < dist2:
-            st.success("✅ Converged to **Wealth Builder** pattern!")
-        else:
-            st.info("✅ Converged to **Conservative** pattern!")
-    
-    with col2:
-        # Plot evolution
-        months_test = list(range(61))
-        stock_test_evolution = [p[0]*100 for p in test_evolution]
-        bond_test_evolution = [p[1]*100 for p in test_evolution]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=months_test, y=stock_test_evolution, 
-                                mode='lines', name='Stocks %', line=dict(color='red')))
-        fig.add_trace(go.Scatter(x=months_test, y=bond_test_evolution, 
-                                mode='lines', name='Bonds %', line=dict(color='blue')))
-        
-        # Add target lines
-        fig.add_hline(y=eigenvectors_norm[0,0]*100, line_dash="dash", line_color="green",
-                     annotation_text="Wealth Builder Target")
-        fig.add_hline(y=eigenvectors_norm[0,1]*100, line_dash="dash", line_color="orange",
-                     annotation_text="Conservative Target")
-        
-        fig.update_layout(
-            title="Your Portfolio Evolution (5 Years)",
-            xaxis_title="Month",
-            yaxis_title="Allocation %",
-            height=300
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-    
+    _show_portfolio_tester(A, eigenvectors_norm)
+
     # Section 6: Key Insights
     st.markdown("---")
     st.header("6️⃣ Arjun's Final Recommendation to Mr. Sharma")
@@ -529,4 +425,107 @@ Recommendation for ₹1 crore:
     Now that Arjun can find stable patterns in data, he'll learn to compress complex 
     multi-dimensional information into simple, powerful insights using 
     **Principal Component Analysis (PCA)**!
-    """)
\ No newline at end of file
+    """)
+
+
+@st.fragment
+def _show_portfolio_simulator(A):
+    """Section 2: 12-month evolution of the chosen starting portfolio"""
+    st.subheader("🧪 Portfolio Evolution Simulator")
+    
+    # Interactive portfolio transformation
+    initial_stocks = st.slider("Initial Stock %", 0, 100, 60, key="initial_stocks")
+    initial_bonds = 100 - initial_stocks
+    
+    # Simulate portfolio evolution (normalized so percentages add to 1)
+    evolution = normalized_trajectories(A, [initial_stocks/100, initial_bonds/100], 12)[0]
+    
+    # Display evolution
+    months_sim = list(range(13))
+    stock_evolution = evolution[:, 0] * 100
+    bond_evolution = evolution[:, 1] * 100
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=months_sim, y=stock_evolution, mode='lines+markers',
+                            name='Stocks %', line=dict(color='red')))
+    fig.add_trace(go.Scatter(x=months_sim, y=bond_evolution, mode='lines+markers',
+                            name='Bonds %', line=dict(color='blue')))
+    
+    fig.update_layout(
+        title="Portfolio Evolution Over 12 Months",
+        xaxis_title="Month",
+        yaxis_title="Allocation %",
+        height=300
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    st.info(f"""
+    **Final Portfolio:** {stock_evolution[-1]:.1f}% stocks, {bond_evolution[-1]:.1f}% bonds
+    
+    **Arjun's Observation:** *"No matter where we start, portfolios drift toward similar ratios!"*
+    """)
+
+
+@st.fragment
+def _show_portfolio_tester(A, eigenvectors_norm):
+    """Section 5: long-run evolution of a user-chosen starting portfolio"""
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown("**Try Different Starting Portfolios:**")
+        
+        test_stocks = st.slider("Test Portfolio - Stock %", 0, 100, 70, key="test_stocks")
+        test_bonds = 100 - test_stocks
+        
+        # Test portfolio evolution over 5 years
+        test_evolution = normalized_trajectories(A, [test_stocks/100, test_bonds/100], 60)[0]
+        
+        final_stocks = test_evolution[-1][0] * 100
+        final_bonds = test_evolution[-1][1] * 100
+        
+        st.write(f"**Starting:** {test_stocks}% stocks, {test_bonds}% bonds")
+        st.write(f"**After 5 years:** {final_stocks:.1f}% stocks, {final_bonds:.1f}% bonds")
+        
+        # Gap to the stable mix shrinks by |λ₂|/|λ₁| every month
+        speed = convergence(A, tolerance=1e-3)
+        st.write(f"**Convergence rate:** gap shrinks ×{speed['ratio']:.3f} per month "
+                 f"(99.9% closed in about {speed['steps']} months)")
+        
+        # Check which eigenvector it's closest to
+        final_portfolio = np.array([final_stocks/100, final_bonds/100])
+        
+        dist1 = np.linalg.norm(final_portfolio - eigenvectors_norm[:, 0])
+        dist2 = np.linalg.norm(final_portfolio - eigenvectors_norm[:, 1])
+        
+        if dist1 < dist2:
+            st.success("✅ Converged to **Wealth Builder** pattern!")
+        else:
+            st.info("✅ Converged to **Conservative** pattern!")
+    
+    with col2:
+        # Plot evolution
+        months_test = list(range(61))
+        stock_test_evolution = test_evolution[:, 0] * 100
+        bond_test_evolution = test_evolution[:, 1] * 100
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=months_test, y=stock_test_evolution, 
+                                mode='lines', name='Stocks %', line=dict(color='red')))
+        fig.add_trace(go.Scatter(x=months_test, y=bond_test_evolution, 
+                                mode='lines', name='Bonds %', line=dict(color='blue')))
+        
+        # Add target lines
+        fig.add_hline(y=eigenvectors_norm[0,0]*100, line_dash="dash", line_color="green",
+                     annotation_text="Wealth Builder Target")
+        fig.add_hline(y=eigenvectors_norm[0,1]*100, line_dash="dash", line_color="orange",
+                     annotation_text="Conservative Target")
+        
+        fig.update_layout(
+            title="Your Portfolio Evolution (5 Years)",
+            xaxis_title="Month",
+            yaxis_title="Allocation %",
+            height=300
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
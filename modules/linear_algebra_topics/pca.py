@@ -6,7 +6,8 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 from sklearn.decomposition import PCA
 from sklearn.preprocessing import StandardScaler
-import matplotlib.pyplot as plt
+from modules.datasets import pca_customer_data
+from modules.linear_algebra_topics.streaming_pca import cached_streaming_pca
 
 def show_pca():
     # Header with navigation
@@ -45,28 +46,8 @@ def show_pca():
     with col1:
         st.subheader("😵 Too Many Dimensions!")
         
-        # Generate sample customer data with many attributes
-        np.random.seed(42)
-        n_customers = 100
-        n_attributes = 8  # We'll show 8 attributes for demonstration
-        
-        # Create correlated customer data (realistic business scenario)
-        base_customer_level = np.random.normal(0, 1, n_customers)
-        spending_style = np.random.normal(0, 0.5, n_customers)
-        
-        customer_data = pd.DataFrame({
-            'Age': 30 + base_customer_level * 10 + np.random.normal(0, 3, n_customers),
-            'Income': 500 + base_customer_level * 200 + np.random.normal(0, 50, n_customers),
-            'Spending': 100 + base_customer_level * 60 + spending_style * 30 + np.random.normal(0, 20, n_customers),
-            'Online_Hours': 20 + base_customer_level * 10 + spending_style * 5 + np.random.normal(0, 5, n_customers),
-            'Store_Visits': 8 + base_customer_level * 3 + np.random.normal(0, 2, n_customers),
-            'Product_Categories': 5 + base_customer_level * 2 + spending_style * 1 + np.random.normal(0, 1, n_customers),
-            'Loyalty_Score': 60 + base_customer_level * 20 + np.random.normal(0, 10, n_customers),
-            'Review_Count': 10 + base_customer_level * 5 + spending_style * 3 + np.random.normal(0, 3, n_customers)
-        })
-        
-        # Ensure positive values
-        customer_data = customer_data.clip(lower=0)
+        # Sample customer data with many attributes (cached, shared across sessions)
+        customer_data = pca_customer_data()
         
         st.dataframe(customer_data.head(10), use_container_width=True)
         
@@ -432,60 +413,12 @@ def show_pca():
     
     st.subheader("🧪 Experiment with Different Numbers of Components")
     
-    n_components = st.slider("Number of Principal Components to Use", 1, 8, 2)
-    
-    # Perform PCA with selected number of components
-    pca_selected = PCA(n_components=n_components)
-    pca_selected_transformed = pca_selected.fit_transform(data_scaled)
-    
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        # Show information retention
-        total_variance_explained = np.sum(pca_selected.explained_variance_ratio_)
-        
-        st.metric(
-            "Information Retained", 
-            f"{total_variance_explained:.1%}",
-            delta=f"{total_variance_explained - 0.5:.1%} vs random"
-        )
-        
-        st.markdown("**🔍 What You're Keeping/Losing:**")
-        
-        for i in range(n_components):
-            st.write(f"**PC{i+1}:** {pca_selected.explained_variance_ratio_[i]:.1%} of information")
-        
-        information_lost = 1 - total_variance_explained
-        st.warning(f"**Information Lost:** {information_lost:.1%}")
-        
-        if total_variance_explained > 0.8:
-            st.success("✅ Excellent information retention!")
-        elif total_variance_explained > 0.6:
-            st.info("✅ Good information retention")
-        else:
-            st.warning("⚠️ Significant information loss")
-    
-    with col2:
-        # Show dimensionality reduction benefit
-        original_dimensions = len(customer_data.columns)
-        reduction_ratio = n_components / original_dimensions
-        
-        st.metric(
-            "Dimension Reduction",
-            f"{original_dimensions} → {n_components}",
-            delta=f"{(1-reduction_ratio)*100:.0f}% reduction"
-        )
-        
-        st.markdown("**💰 Business Benefits:**")
-        
-        analysis_time_saved = (1 - reduction_ratio) * 100
-        storage_saved = (1 - reduction_ratio) * 100
-        
-        st.write(f"**Analysis Time:** {analysis_time_saved:.0f}% faster")
-        st.write(f"**Storage Requirements:** {storage_saved:.0f}% less")
-        st.write(f"**Visualization:** Possible in {min(n_components, 3)}D")
-        st.write(f"**Model Training:** {analysis_time_saved:.0f}% faster")
+    # st.fragment: the component slider reruns only this explorer
+    _show_pca_explorer(customer_data, pca_full)
     
+    with st.expander("📂 Run PCA on Your Own Customer Table (CSV / Parquet)"):
+        _show_uploaded_pca()
+
     # Section 6: Business Implementation
     st.markdown("---")
     st.header("6️⃣ Mr. Patel's Business Implementation")
@@ -655,4 +588,131 @@ PC2 = "Price vs Premium Features" (cost vs luxury)
     
     **Next Steps:** Apply these concepts to your own business challenges and discover the hidden 
     patterns in your data!
-    """)
\ No newline at end of file
+    """)
+
+
+@st.fragment
+def _show_pca_explorer(customer_data, pca_full):
+    """Section 5: information retained for a chosen number of components"""
+    n_components = st.slider("Number of Principal Components to Use", 1, 8, 2)
+    
+    # The first n components of the full PCA are the n-component PCA: no refit needed
+    explained_variance_ratio = pca_full.explained_variance_ratio_[:n_components]
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        # Show information retention
+        total_variance_explained = np.sum(explained_variance_ratio)
+        
+        st.metric(
+            "Information Retained", 
+            f"{total_variance_explained:.1%}",
+            delta=f"{total_variance_explained - 0.5:.1%} vs random"
+        )
+        
+        st.markdown("**🔍 What You're Keeping/Losing:**")
+        
+        for i in range(n_components):
+            st.write(f"**PC{i+1}:** {explained_variance_ratio[i]:.1%} of information")
+        
+        information_lost = 1 - total_variance_explained
+        st.warning(f"**Information Lost:** {information_lost:.1%}")
+        
+        if total_variance_explained > 0.8:
+            st.success("✅ Excellent information retention!")
+        elif total_variance_explained > 0.6:
+            st.info("✅ Good information retention")
+        else:
+            st.warning("⚠️ Significant information loss")
+    
+    with col2:
+        # Show dimensionality reduction benefit
+        original_dimensions = len(customer_data.columns)
+        reduction_ratio = n_components / original_dimensions
+        
+        st.metric(
+            "Dimension Reduction",
+            f"{original_dimensions} → {n_components}",
+            delta=f"{(1-reduction_ratio)*100:.0f}% reduction"
+        )
+        
+        st.markdown("**💰 Business Benefits:**")
+        
+        analysis_time_saved = (1 - reduction_ratio) * 100
+        storage_saved = (1 - reduction_ratio) * 100
+        
+        st.write(f"**Analysis Time:** {analysis_time_saved:.0f}% faster")
+        st.write(f"**Storage Requirements:** {storage_saved:.0f}% less")
+        st.write(f"**Visualization:** Possible in {min(n_components, 3)}D")
+        st.write(f"**Model Training:** {analysis_time_saved:.0f}% faster")
+
+
+@st.fragment
+def _show_uploaded_pca():
+    """Section 5 add-on: streamed PCA of an uploaded table, fitted once per file"""
+    st.markdown("""
+    Upload a table with one row per customer. Numeric columns are standardized and 
+    analysed in chunks, so files with hundreds of thousands of rows work too.
+    """)
+    
+    uploaded = st.file_uploader("Customer table", type=['csv', 'parquet'], key="pca_upload")
+    if uploaded is None:
+        return
+    
+    try:
+        decomposition = cached_streaming_pca(uploaded.file_id, uploaded.name, uploaded.getvalue())
+    except ValueError as e:
+        st.error(f"Could not analyse this file: {e}")
+        return
+    
+    st.caption(
+        f"{decomposition.n_rows:,} rows × {len(decomposition.columns)} numeric columns, "
+        f"{decomposition.n_fitted} components fitted in {decomposition.seconds:.1f}s"
+    )
+    
+    n_components = st.slider("Components to keep", 1, decomposition.n_fitted,
+                             min(2, decomposition.n_fitted), key="pca_upload_components")
+    ratio = decomposition.explained_variance_ratio
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            x=[f'PC{i+1}' for i in range(len(ratio))], y=ratio * 100,
+            name='Individual Variance',
+            marker_color=['darkblue' if i < n_components else 'lightblue' for i in range(len(ratio))]
+        ))
+        fig.add_trace(go.Scatter(
+            x=[f'PC{i+1}' for i in range(len(ratio))], y=np.cumsum(ratio) * 100,
+            mode='lines+markers',
+            name='Cumulative Variance',
+            line=dict(color='red', width=3)
+        ))
+        fig.update_layout(title="Explained Variance", yaxis_title="Variance Explained (%)", height=350)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.metric("Information Retained", f"{ratio[:n_components].sum():.1%}",
+                  f"{len(decomposition.columns)} → {n_components} dimensions")
+    
+    with col2:
+        if decomposition.n_fitted >= 2:
+            scores = decomposition.sample_scores
+            fig = go.Figure(go.Scattergl(
+                x=scores[:, 0], y=scores[:, 1],
+                mode='markers',
+                marker=dict(size=4, opacity=0.5)
+            ))
+            fig.update_layout(
+                title=f"First {len(scores):,} Rows on PC1 vs PC2",
+                xaxis_title="PC1", yaxis_title="PC2", height=350
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Strongest contributors to each kept component
+        loadings = decomposition.loadings(min(n_components, 5))
+        st.dataframe(
+            loadings.reindex(loadings.abs().max(axis=1).sort_values(ascending=False).index).head(10).round(3),
+            use_container_width=True
+        )
@@ -0,0 +1,157 @@
+import io
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from sklearn.decomposition import IncrementalPCA
+
+# PCA for uploaded customer tables too large to fit in one go.
+#
+# The file is streamed twice in chunks: once for the per-column mean and
+# standard deviation (Chan's parallel update), once to feed standardised
+# chunks to IncrementalPCA. Up to MAX_COMPONENTS components are fitted a
+# single time; PCA components are nested, so every smaller n_components
+# view is a slice of the same decomposition. The fitted result is cached
+# per upload, so slider changes never refit.
+
+CHUNK_ROWS = 20_000
+MAX_COMPONENTS = 50
+SAMPLE_ROWS = 5_000
+
+
+class PCADecomposition:
+    """Fitted streaming PCA of an uploaded table.
+
+    components: (n_fitted, n_columns) principal axes in standardised space.
+    explained_variance_ratio: share of total variance per fitted component.
+    sample_scores: component scores of the first SAMPLE_ROWS rows, for plots.
+    """
+
+    def __init__(self, columns, n_rows, mean, scale, components,
+                 explained_variance_ratio, sample_scores, seconds):
+        self.columns = columns
+        self.n_rows = n_rows
+        self.mean = mean
+        self.scale = scale
+        self.components = components
+        self.explained_variance_ratio = explained_variance_ratio
+        self.sample_scores = sample_scores
+        self.seconds = seconds
+
+    @property
+    def n_fitted(self):
+        return len(self.components)
+
+    def loadings(self, n_components):
+        """Loadings of the first n_components as a DataFrame (columns x PCs)"""
+        return pd.DataFrame(
+            self.components[:n_components].T,
+            index=self.columns,
+            columns=[f'PC{i + 1}' for i in range(n_components)]
+        )
+
+    def transform(self, frame, n_components):
+        """Scores of new rows on the first n_components"""
+        values = frame[self.columns].to_numpy(dtype=float)
+        standardised = np.nan_to_num((values - self.mean) / self.scale)
+        return standardised @ self.components[:n_components].T
+
+
+def _chunks(data, name):
+    """Yield DataFrame chunks of an uploaded CSV or Parquet file"""
+    if name.lower().endswith('.parquet'):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ValueError("Reading Parquet files requires pyarrow") from exc
+        for batch in pq.ParquetFile(io.BytesIO(data)).iter_batches(batch_size=CHUNK_ROWS):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(io.BytesIO(data), chunksize=CHUNK_ROWS)
+
+
+def _numeric_chunks(data, name, columns):
+    for chunk in _chunks(data, name):
+        yield chunk[columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+
+def _batches(chunks, min_rows):
+    """Merge chunks so every batch has at least min_rows rows (if the data does)"""
+    pending = None
+    for chunk in chunks:
+        if pending is None:
+            pending = chunk
+        elif len(pending) >= min_rows and len(chunk) >= min_rows:
+            yield pending
+            pending = chunk
+        else:
+            pending = np.vstack([pending, chunk])
+    if pending is not None:
+        yield pending
+
+
+def fit_streaming_pca(data, name, max_components=MAX_COMPONENTS):
+    """Standardise and fit PCA on an uploaded CSV/Parquet file, chunk by chunk"""
+    start = time.perf_counter()
+
+    first = next(_chunks(data, name), None)
+    if first is None:
+        raise ValueError("The file is empty")
+    columns = list(first.select_dtypes(include='number').columns)
+    if len(columns) < 2:
+        raise ValueError("PCA needs at least two numeric columns")
+
+    # Pass 1: count, mean and sum of squared deviations per column
+    n_rows = 0
+    count = np.zeros(len(columns))
+    mean = np.zeros(len(columns))
+    m2 = np.zeros(len(columns))
+    for values in _numeric_chunks(data, name, columns):
+        n_rows += len(values)
+        present = ~np.isnan(values)
+        n_chunk = present.sum(axis=0)
+        if not n_chunk.any():
+            continue
+        with np.errstate(invalid='ignore', divide='ignore'):
+            chunk_mean = np.where(n_chunk > 0, np.nansum(values, axis=0) / n_chunk, 0)
+        chunk_m2 = np.nansum((values - chunk_mean) ** 2, axis=0)
+
+        total = count + n_chunk
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = chunk_mean - mean
+            mean = np.where(total > 0, mean + delta * n_chunk / total, 0)
+            m2 = m2 + chunk_m2 + np.where(total > 0, delta ** 2 * count * n_chunk / total, 0)
+        count = total
+
+    if n_rows < 2:
+        raise ValueError("PCA needs at least two rows")
+
+    scale = np.sqrt(np.divide(m2, count, out=np.zeros_like(m2), where=count > 0))
+    scale[scale == 0] = 1.0
+
+    # Pass 2: incremental PCA on standardised chunks (missing values -> column mean)
+    n_components = min(max_components, len(columns), n_rows)
+    pca = IncrementalPCA(n_components=n_components)
+    sample = []
+    sampled = 0
+    for values in _batches(_numeric_chunks(data, name, columns), n_components):
+        standardised = np.nan_to_num((values - mean) / scale)
+        pca.partial_fit(standardised)
+        if sampled < SAMPLE_ROWS:
+            sample.append(standardised[:SAMPLE_ROWS - sampled])
+            sampled += len(sample[-1])
+
+    sample_scores = np.vstack(sample) @ pca.components_.T
+
+    return PCADecomposition(
+        columns, n_rows, mean, scale, pca.components_,
+        pca.explained_variance_ratio_, sample_scores,
+        time.perf_counter() - start,
+    )
+
+
+@st.cache_resource(max_entries=4, show_spinner="Fitting PCA on the uploaded table...")
+def cached_streaming_pca(file_id, name, _data):
+    """fit_streaming_pca, computed once per uploaded file (keyed by its file_id)"""
+    return fit_streaming_pca(_data, name)
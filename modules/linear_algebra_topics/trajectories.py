@@ -0,0 +1,60 @@
+import numpy as np
+
+# Portfolio trajectories x_{k+1} = A x_k (renormalised to sum to 1) in
+# closed form.
+#
+# With A = V Λ V⁻¹, every step of every starting portfolio is
+# A^k x_0 = V (λ^k ⊙ V⁻¹ x_0), so all time steps for all starts come out of
+# one einsum instead of a Python loop per month and per start. Powers are
+# taken relative to the dominant eigenvalue; the renormalisation cancels
+# the common factor, so long horizons don't overflow.
+
+
+def _dominant_order(eigenvalues):
+    return np.argsort(-np.abs(eigenvalues), kind='stable')
+
+
+def normalized_trajectories(A, starts, steps):
+    """Normalised states for k = 0..steps, shape (n_starts, steps + 1, n).
+
+    starts is one starting vector or an (n_starts, n) array of them.
+    Falls back to batched repeated multiplication when A is not
+    diagonalisable.
+    """
+    A = np.asarray(A, dtype=float)
+    starts = np.atleast_2d(np.asarray(starts, dtype=float))
+    k = np.arange(steps + 1)
+
+    eigenvalues, V = np.linalg.eig(A)
+    if np.linalg.cond(V) < 1e8:
+        dominant = eigenvalues[_dominant_order(eigenvalues)[0]]
+        coefficients = np.linalg.solve(V, starts.T).T
+        powers = (eigenvalues / dominant)[None, :] ** k[:, None]
+        states = np.einsum('ij,kj,sj->ski', V, powers, coefficients).real
+    else:
+        states = np.empty((len(starts), steps + 1, A.shape[0]))
+        current = starts
+        for step in range(steps + 1):
+            states[:, step] = current
+            current = current @ A.T
+            current = current / current.sum(axis=1, keepdims=True)
+
+    return states / states.sum(axis=2, keepdims=True)
+
+
+def convergence(A, tolerance=1e-3):
+    """How fast trajectories settle on the dominant eigenvector.
+
+    The distance to the stable mix shrinks by ratio = |λ₂| / |λ₁| per step,
+    so it takes about log(tolerance) / log(ratio) steps to shrink by the
+    factor tolerance. Returns {'ratio', 'steps'} (steps is inf when the
+    two leading eigenvalues have equal magnitude).
+    """
+    eigenvalues = np.linalg.eigvals(np.asarray(A, dtype=float))
+    ordered = np.abs(eigenvalues[_dominant_order(eigenvalues)])
+    if len(ordered) < 2 or ordered[1] == 0:
+        return {'ratio': 0.0, 'steps': 1}
+
+    ratio = float(ordered[1] / ordered[0])
+    steps = int(np.ceil(np.log(tolerance) / np.log(ratio))) if ratio < 1 else float('inf')
+    return {'ratio': ratio, 'steps': steps}
@@ -4,6 +4,7 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+from modules.datasets import sample_customer_matrix
 
 def show_vectors_matrices():
     # Header with navigation
@@ -48,6 +49,157 @@ def show_vectors_matrices():
     # Interactive Customer Vector Example
     st.subheader("🧑‍💼 Build a Customer Vector")
     
+    # Interactive sections are st.fragment functions (defined below) so a
+    # widget only reruns its own section
+    _show_customer_vectors()
+
+    # Section 2: Matrices
+    st.markdown("---")
+    st.header("2️⃣ Matrices: The Complete Customer Database")
+    
+    st.markdown("""
+    **Arjun's Breakthrough:** Instead of dealing with customers one by one, he can organize 
+    ALL customers into a **matrix** - a table where each row is a customer vector!
+    
+    **Matrix = Collection of Vectors = Complete Database**
+    """)
+    _show_customer_matrix()
+
+    # Business Applications
+    st.markdown("---")
+    st.header("💼 Arjun's Business Applications")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **🎯 Customer Segmentation**
+        - Each customer = vector
+        - Group similar vectors  
+        - Identify customer types
+        - Targeted marketing
+        """)
+    
+    with col2:
+        st.markdown("""
+        **📊 Predictive Modeling**
+        - Multiple variables → outcome
+        - Systems of equations
+        - Forecasting behavior
+        - Risk assessment  
+        """)
+    
+    with col3:
+        st.markdown("""
+        **🔍 Pattern Recognition**
+        - Matrix operations
+        - Data relationships
+        - Hidden insights
+        - Strategic decisions
+        """)
+    
+    # Key Takeaways
+    st.markdown("---")
+    st.header("🎓 Arjun's Key Discoveries")
+    
+    st.success("""
+    **🔑 Mathematical Superpowers Unlocked:**
+    
+    ✅ **Vectors** → Represent complex entities (customers, products) as mathematical objects  
+    ✅ **Matrices** → Organize entire databases for systematic analysis  
+    ✅ **Vector Operations** → Compare, combine, and analyze relationships  
+    ✅ **Systems of Equations** → Solve multi-variable business prediction problems  
+    
+    **🚀 Business Impact:**
+    From overwhelming spreadsheets → Systematic, mathematical analysis of customer data!
+    """)
+    
+    # Practice Exercises
+    st.markdown("---")
+    st.subheader("💪 Practice: Apply Arjun's Methods")
+    
+    
+    with st.expander("📝 Exercise : Product Analysis"):
+        st.markdown("""
+        **Scenario:** Analyze 3 products with vectors `[price, sales, profit_margin]`
+        
+        - Product A: `[100, 500, 0.2]`
+        - Product B: `[150, 300, 0.3]`  
+        - Product C: `[80, 700, 0.15]`
+        
+        **Tasks:**
+        1. Which product has highest total performance? (hint: dot product with `[1,1,1]`)
+        2. Create the product matrix
+        3. Find average product profile (matrix column means)
+        """)
+        
+        # MOVE THESE DEFINITIONS OUTSIDE THE BUTTON BLOCK:
+        product_a = np.array([100, 500, 0.2])
+        product_b = np.array([150, 300, 0.3])
+        product_c = np.array([80, 700, 0.15])
+    
+        if st.button("Show Solutions", key="exercise1_solution"):
+            st.markdown("---")
+            st.markdown("### 🔍 **Solutions:**")
+            
+            # Solution 1: Total performance
+            st.markdown("**1. Total Performance Analysis:**")
+            performance_vector = np.array([1, 1, 1])
+            
+            perf_a = np.dot(product_a, performance_vector)
+            perf_b = np.dot(product_b, performance_vector) 
+            perf_c = np.dot(product_c, performance_vector)
+            
+            st.write(f"• Product A performance: {perf_a:.1f}")
+            st.write(f"• Product B performance: {perf_b:.1f}")
+            st.write(f"• Product C performance: {perf_c:.1f}")
+            
+            best_product = max([("A", perf_a), ("B", perf_b), ("C", perf_c)], key=lambda x: x[1])
+            st.success(f"🏆 **Winner:** Product {best_product[0]} with score {best_product[1]:.1f}")
+            
+            # Solution 2: Product matrix
+            st.markdown("**2. Product Matrix:**")
+            product_matrix = np.array([product_a, product_b, product_c])
+            df = pd.DataFrame(product_matrix, 
+                            columns=['Price (₹)', 'Sales (units)', 'Profit Margin'],
+                            index=['Product A', 'Product B', 'Product C'])
+            st.dataframe(df)
+            
+            # Solution 3: Average profile
+            st.markdown("**3. Average Product Profile:**")
+            avg_profile = np.mean(product_matrix, axis=0)
+            st.write(f"**Average:** `[{avg_profile[0]:.0f}, {avg_profile[1]:.0f}, {avg_profile[2]:.2f}]`")
+            st.write("**Interpretation:** Average price ₹110, 500 units sales, 22% profit margin")
+
+    
+    
+    
+    # Navigation
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("← Previous: Linear Algebra Overview"):
+            st.session_state.page = 'linear_algebra'
+            st.rerun()
+    
+    with col2:
+        if st.button("Next: Eigenvalues & Eigenvectors →"):
+            st.session_state.page = 'linear_algebra_eigen'
+            st.rerun()
+    
+    st.markdown("---")
+    st.info("""
+    🎯 **Next in Arjun's Journey:** 
+    Now that Arjun can organize and analyze multi-dimensional data, he'll discover hidden 
+    patterns that remain stable even when business conditions change - the power of 
+    **Eigenvalues and Eigenvectors**!
+    """)
+
+
+@st.fragment
+def _show_customer_vectors():
+    """Section 1: customer vector builder and two-customer vector operations"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -133,28 +285,15 @@ def show_vectors_matrices():
         dot_product = np.dot(vector_a, vector_b)
         st.write(f"**Dot Product:** `{dot_product:.0f}`")
         st.write("*Customer similarity measure*")
+
+
+@st.fragment
+def _show_customer_matrix():
+    """Sections 2-3: customer matrix and the spending prediction system"""
     
-    # Section 2: Matrices
-    st.markdown("---")
-    st.header("2️⃣ Matrices: The Complete Customer Database")
-    
-    st.markdown("""
-    **Arjun's Breakthrough:** Instead of dealing with customers one by one, he can organize 
-    ALL customers into a **matrix** - a table where each row is a customer vector!
-    
-    **Matrix = Collection of Vectors = Complete Database**
-    """)
-    
-    # Generate sample customer data
-    np.random.seed(42)
+    # Sample customer data (cached, shared across sessions)
     n_customers = st.slider("Number of Customers to Analyze", 3, 10, 5)
-    
-    # Generate realistic customer data
-    ages = np.random.randint(25, 65, n_customers)
-    incomes = np.random.randint(300, 1500, n_customers)
-    spendings = incomes * 0.15 + np.random.randint(-50, 50, n_customers)
-    
-    customer_matrix = np.column_stack((ages, incomes, spendings))
+    customer_matrix = sample_customer_matrix()[:n_customers]
     
     # Display matrix
     col1, col2 = st.columns([1, 1])
@@ -272,134 +411,3 @@ def show_vectors_matrices():
                 
             except np.linalg.LinAlgError:
                 st.error("System cannot be solved - customers might be too similar!")
-    
-    # Business Applications
-    st.markdown("---")
-    st.header("💼 Arjun's Business Applications")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **🎯 Customer Segmentation**
-        - Each customer = vector
-        - Group similar vectors  
-        - Identify customer types
-        - Targeted marketing
-        """)
-    
-    with col2:
-        st.markdown("""
-        **📊 Predictive Modeling**
-        - Multiple variables → outcome
-        - Systems of equations
-        - Forecasting behavior
-        - Risk assessment  
-        """)
-    
-    with col3:
-        st.markdown("""
-        **🔍 Pattern Recognition**
-        - Matrix operations
-        - Data relationships
-        - Hidden insights
-        - Strategic decisions
-        """)
-    
-    # Key Takeaways
-    st.markdown("---")
-    st.header("🎓 Arjun's Key Discoveries")
-    
-    st.success("""
-    **🔑 Mathematical Superpowers Unlocked:**
-    
-    ✅ **Vectors** → Represent complex entities (customers, products) as mathematical objects  
-    ✅ **Matrices** → Organize entire databases for systematic analysis  
-    ✅ **Vector Operations** → Compare, combine, and analyze relationships  
-    ✅ **Systems of Equations** → Solve multi-variable business prediction problems  
-    
-    **🚀 Business Impact:**
-    From overwhelming spreadsheets → Systematic, mathematical analysis of customer data!
-    """)
-    
-    # Practice Exercises
-    st.markdown("---")
-    st.subheader("💪 Practice: Apply Arjun's Methods")
-    
-    
-    with st.expander("📝 Exercise : Product Analysis"):
-        st.markdown("""
-        **Scenario:** Analyze 3 products with vectors `[price, sales, profit_margin]`
-        
-        - Product A: `[100, 500, 0.2]`
-        - Product B: `[150, 300, 0.3]`  
-        - Product C: `[80, 700, 0.15]`
-        
-        **Tasks:**
-        1. Which product has highest total performance? (hint: dot product with `[1,1,1]`)
-        2. Create the product matrix
-        3. Find average product profile (matrix column means)
-        """)
-        
-        # MOVE THESE DEFINITIONS OUTSIDE THE BUTTON BLOCK:
-        product_a = np.array([100, 500, 0.2])
-        product_b = np.array([150, 300, 0.3])
-        product_c = np.array([80, 700, 0.15])
-    
-        if st.button("Show Solutions", key="exercise1_solution"):
-            st.markdown("---")
-            st.markdown("### 🔍 **Solutions:**")
-            
-            # Solution 1: Total performance
-            st.markdown("**1. Total Performance Analysis:**")
-            performance_vector = np.array([1, 1, 1])
-            
-            perf_a = np.dot(product_a, performance_vector)
-            perf_b = np.dot(product_b, performance_vector) 
-            perf_c = np.dot(product_c, performance_vector)
-            
-            st.write(f"• Product A performance: {perf_a:.1f}")
-            st.write(f"• Product B performance: {perf_b:.1f}")
-            st.write(f"• Product C performance: {perf_c:.1f}")
-            
-            best_product = max([("A", perf_a), ("B", perf_b), ("C", perf_c)], key=lambda x: x[1])
-            st.success(f"🏆 **Winner:** Product {best_product[0]} with score {best_product[1]:.1f}")
-            
-            # Solution 2: Product matrix
-            st.markdown("**2. Product Matrix:**")
-            product_matrix = np.array([product_a, product_b, product_c])
-            df = pd.DataFrame(product_matrix, 
-                            columns=['Price (₹)', 'Sales (units)', 'Profit Margin'],
-                            index=['Product A', 'Product B', 'Product C'])
-            st.dataframe(df)
-            
-            # Solution 3: Average profile
-            st.markdown("**3. Average Product Profile:**")
-            avg_profile = np.mean(product_matrix, axis=0)
-            st.write(f"**Average:** `[{avg_profile[0]:.0f}, {avg_profile[1]:.0f}, {avg_profile[2]:.2f}]`")
-            st.write("**Interpretation:** Average price ₹110, 500 units sales, 22% profit margin")
-
-    
-    
-    
-    # Navigation
-    st.markdown("---")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("← Previous: Linear Algebra Overview"):
-            st.session_state.page = 'linear_algebra'
-            st.rerun()
-    
-    with col2:
-        if st.button("Next: Eigenvalues & Eigenvectors →"):
-            st.session_state.page = 'linear_algebra_eigen'
-            st.rerun()
-    
-    st.markdown("---")
-    st.info("""
-    🎯 **Next in Arjun's Journey:** 
-    Now that Arjun can organize and analyze multi-dimensional data, he'll discover hidden 
-    patterns that remain stable even when business conditions change - the power of 
-    **Eigenvalues and Eigenvectors**!
-    """)
\ No newline at end of file
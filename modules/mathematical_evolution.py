@@ -4,6 +4,7 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+from modules.datasets import noisy_daily_sales, ml_customers, ml_customer_clusters
 
 def show_mathematical_evolution():
     # Header with navigation
@@ -269,11 +270,8 @@ Statistics Asks:
     # Interactive Statistics Demo
     st.subheader("🧪 Statistics in Action: Handling Uncertainty")
     
-    # Generate sample business data with noise
-    np.random.seed(42)
-    days = np.arange(1, 31)
-    true_sales = 1000 + 10 * days  # Perfect mathematical relationship
-    noisy_sales = true_sales + np.random.normal(0, 50, len(days))  # Real-world data with noise
+    # Sample business data with noise (cached, shared across sessions)
+    days, true_sales, noisy_sales = noisy_daily_sales()
     
     col1, col2 = st.columns(2)
     
@@ -426,28 +424,13 @@ ML: Revenue = learned_function(Price, Quantity,
     # Interactive ML Concept Demo
     st.subheader("🧠 Machine Learning in Action: Pattern Discovery")
     
-    # Generate sample data for ML demo
-    np.random.seed(42)
-    n_customers = 200
-    
-    # Create synthetic customer data
-    age = np.random.normal(35, 10, n_customers)
-    income = age * 2000 + np.random.normal(0, 10000, n_customers)
-    spending = 0.3 * income + 50 * age + np.random.normal(0, 5000, n_customers)
-    
-    # Normalize for clustering
-    from sklearn.preprocessing import StandardScaler
-    from sklearn.cluster import KMeans
+    # Synthetic customer data for the ML demo (cached, shared across sessions)
+    age, income, spending = ml_customers()
+    n_customers = len(age)
     
     try:
-        # Simple clustering example
-        data = np.column_stack([age, income, spending])
-        scaler = StandardScaler()
-        data_scaled = scaler.fit_transform(data)
-        
-        # K-means clustering
-        kmeans = KMeans(n_clusters=3, random_state=42, n_init=10)
-        clusters = kmeans.fit_predict(data_scaled)
+        # Simple clustering example: K-means on standardized data, fitted once per process
+        clusters = ml_customer_clusters()
         
         col1, col2 = st.columns(2)
         
@@ -1,3 +1,6 @@
+import time
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
 import streamlit as st
 import numpy as np
 import pandas as pd
@@ -5,7 +8,12 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import scipy.optimize as opt
-from scipy.optimize import linprog
+from modules.datasets import treasury_return_scenarios
+from modules.optimization_engine.frontier import efficient_frontier
+from modules.optimization_engine.geometry import feasible_polygon
+from modules.optimization_engine.model import LPModel
+from modules.optimization_engine.model_files import read_model, solve_model_file
+from modules.process_pool import reset_executor, shared_executor
 
 def show_optimization():
     # Header with navigation
@@ -309,6 +317,118 @@ Subject to constraints:
     that constrain my production choices."*
     """)
     
+    # Sections 4-8 share the constraint sliders, so they rerun together as one
+    # st.fragment; the portfolio section below is a fragment of its own
+    _show_production_planning()
+
+    # Section 9: Portfolio Application Example
+    st.markdown("---")
+    st.header("9️⃣ Portfolio Optimization: Beyond Manufacturing")
+    
+    st.markdown("""
+    **Anand's Expanded Learning:** *"Now I understand optimization for production. 
+    But these same principles apply to investment portfolios too!"*
+    """)
+    
+    _show_portfolio_optimization()
+    _show_efficient_frontier()
+
+    # Section 10: Real planning models from files
+    st.markdown("---")
+    st.header("🔟 Your Own Models: Upload an MPS / LP File")
+    
+    st.markdown("""
+    **Anand's Planning Team:** *"Our real production plan has thousands of products, plants and
+    shipping lanes - far too many for sliders. Can the same solver handle it?"*
+    
+    Export the model from your modelling tool as **MPS** or **CPLEX-LP** (optionally gzipped)
+    and upload it here. It is solved with HiGHS in a background worker, within your time limit.
+    """)
+    
+    _show_model_upload()
+
+    # Key Takeaways and Summary
+    st.markdown("---")
+    st.header("🎓 Anand's Optimization Mastery Summary")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **🎯 Core Concepts Mastered**
+        
+        ✅ **Optimization Basics**
+        - Finding best from all choices
+        - Mathematical certainty vs guesswork
+        
+        ✅ **Linear Programming**
+        - Systematic approach to complex decisions
+        - Handles multiple variables & constraints
+        
+        ✅ **Constraints Understanding**
+        - Real business limitations
+        - Feasible region concept
+        """)
+    
+    with col2:
+        st.markdown("""
+        **🔢 Advanced Techniques**
+        
+        ✅ **Integer Programming**
+        - Whole unit requirements
+        - Practical implementability
+        
+        ✅ **Dual Problem Analysis**
+        - Resource shadow prices
+        - Bottleneck identification
+        
+        ✅ **Sensitivity Analysis**
+        - What-if scenario planning
+        - Risk management
+        """)
+    
+    with col3:
+        st.markdown("""
+        **💼 Business Applications**
+        
+        ✅ **Production Planning**
+        - Optimal product mix
+        - Resource allocation
+        
+        ✅ **Investment Decisions**
+        - Portfolio optimization
+        - Capital budgeting
+        
+        ✅ **Strategic Planning**
+        - Data-driven decisions
+        - Competitive advantage
+        """)
+    
+    # Final Success Message
+    st.success("""
+    🎉 **Anand's Complete Optimization Transformation!**
+    
+    **From:** Overwhelming choices and guesswork decisions
+    **To:** Mathematical certainty and optimal resource allocation
+    
+    **Optimization Superpowers Unlocked:**
+    ✅ **Systematic Decision Making** - No more guesswork, mathematical certainty
+    ✅ **Resource Optimization** - Maximum output from limited inputs  
+    ✅ **Constraint Management** - Turn limitations into strategic advantages
+    ✅ **Sensitivity Planning** - Robust decisions that handle uncertainty
+    ✅ **Multi-domain Application** - From production to portfolios to strategic planning
+    
+    **The Power of Optimization:** Anand can now tackle any resource allocation challenge
+    with mathematical confidence, ensuring his company always makes the most profitable
+    and efficient decisions possible!
+    """)
+    
+    st.markdown("---")
+
+
+@st.fragment
+def _show_production_planning():
+    """Sections 4-8: constraint builder, LP/IP solution, shadow prices and sensitivity"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -357,6 +477,13 @@ Anand's Constraints:
    x₁ ≥ 0, x₂ ≥ 0 (Cannot produce negative units!)
         """)
     
+    # One model for sections 4-8; its solve and analyses are shared and cached
+    model = _production_model(
+        phone_time, tablet_time, workers * worker_hours,
+        phone_material, tablet_material, material_budget * 100000,
+        phone_space, tablet_space, storage_space
+    )
+    
     with col2:
         st.subheader("📊 Constraint Visualization")
         
@@ -375,6 +502,13 @@ Anand's Constraints:
         material_line = (material_budget * 100000 - phone_material * x1_range) / tablet_material
         storage_line = (storage_space - phone_space * x1_range) / tablet_space
         
+        # Exact feasible region: the three resource limits plus x₁, x₂ ≥ 0
+        region = feasible_polygon(
+            np.vstack([model.A_ub, -np.eye(2)]),
+            np.concatenate([model.b_ub, [0, 0]]),
+            closed=True
+        )
+        
         fig = go.Figure()
         
         # Constraint lines
@@ -399,26 +533,14 @@ Anand's Constraints:
             line=dict(color='green', width=2)
         ))
         
-        # Feasible region (approximate)
-        feasible_x = []
-        feasible_y = []
-        for x in x1_range[::5]:  # Sample points
-            max_y = min(
-                max(0, (workers * worker_hours - phone_time * x) / tablet_time),
-                max(0, (material_budget * 100000 - phone_material * x) / tablet_material),
-                max(0, (storage_space - phone_space * x) / tablet_space)
-            )
-            if max_y >= 0:
-                feasible_x.extend([x, x])
-                feasible_y.extend([0, max_y])
-        
         # Shade feasible region
-        if feasible_x:
+        if len(region):
             fig.add_trace(go.Scatter(
-                x=feasible_x, y=feasible_y,
-                fill='tonext',
-                mode='none',
-                name='Feasible Region',
+                x=region[:, 0], y=region[:, 1],
+                fill='toself',
+                mode='lines',
+                line=dict(color='gray', width=1),
+                name=f'Feasible Region ({len(region) - 1} corners)',
                 fillcolor='rgba(128,128,128,0.3)'
             ))
         
@@ -460,35 +582,14 @@ Anand's Constraints:
         at a corner (vertex) of the feasible region.
         """)
         
-        # Solve the LP problem
+        # Solve the LP problem (maximise profit; solved once per constraint setup)
         try:
-            # Coefficients for objective function (we want to maximize, so negate)
-            c = [-8000, -12000]  # Negative because linprog minimizes
-            
-            # Inequality constraint matrix (Ax <= b)
-            A = [
-                [phone_time, tablet_time],  # Labor constraint
-                [phone_material, tablet_material],  # Material constraint  
-                [phone_space, tablet_space]  # Storage constraint
-            ]
-            
-            b = [
-                workers * worker_hours,  # Labor limit
-                material_budget * 100000,  # Material limit
-                storage_space  # Storage limit
-            ]
-            
-            # Bounds for variables (non-negative)
-            x1_bounds = (0, None)
-            x2_bounds = (0, None)
-            
-            # Solve the LP problem
-            result = linprog(c, A_ub=A, b_ub=b, bounds=[x1_bounds, x2_bounds], method='highs')
+            result = model.solve()
             
             if result.success:
                 optimal_phones = result.x[0]
                 optimal_tablets = result.x[1]
-                max_profit = -result.fun  # Negate back since we minimized
+                max_profit = result.objective
                 
                 st.code(f"""
 OPTIMAL SOLUTION FOUND! 🎉
@@ -545,6 +646,17 @@ Storage: {phone_space * optimal_phones + tablet_space * optimal_tablets:.1f}/{st
                 line=dict(color='green', width=2)
             ))
             
+            # Feasible region and its corner points
+            fig.add_trace(go.Scatter(
+                x=region[:, 0], y=region[:, 1],
+                fill='toself',
+                mode='lines+markers',
+                line=dict(color='gray', width=1),
+                marker=dict(color='gray', size=7),
+                name='Feasible Region',
+                fillcolor='rgba(128,128,128,0.2)'
+            ))
+            
             # Optimal point
             fig.add_trace(go.Scatter(
                 x=[optimal_phones], y=[optimal_tablets],
@@ -577,6 +689,7 @@ Storage: {phone_space * optimal_phones + tablet_space * optimal_tablets:.1f}/{st
             st.info(f"""
             **Solution Insights:**
             🌟 **Gold star** = Optimal production point
+            ⬛ **Gray dots** = Corner points of the feasible region
             📈 **Dashed lines** = Equal profit curves
             ✅ **Optimal point** lies where highest profit line touches feasible region
             """)
@@ -613,19 +726,13 @@ Storage: {phone_space * optimal_phones + tablet_space * optimal_tablets:.1f}/{st
         
         # Compare LP vs IP solutions
         if 'optimal_phones' in locals() and result.success:
-            # Integer solution (simple rounding for demo)
-            int_phones = round(optimal_phones)
-            int_tablets = round(optimal_tablets)
+            # Exact integer solution (branch-and-cut on the same model, not rounding)
+            int_result = model.solve_integer(time_limit=10)
             
-            # Check if rounded solution is feasible
-            labor_used = phone_time * int_phones + tablet_time * int_tablets
-            material_used = phone_material * int_phones + tablet_material * int_tablets
-            storage_used = phone_space * int_phones + tablet_space * int_tablets
-            
-            if (labor_used <= workers * worker_hours and 
-                material_used <= material_budget * 100000 and 
-                storage_used <= storage_space):
-                int_profit = 8000 * int_phones + 12000 * int_tablets
+            if int_result.x is not None:
+                int_phones = int(round(int_result.x[0]))
+                int_tablets = int(round(int_result.x[1]))
+                int_profit = int_result.objective
                 profit_loss = max_profit - int_profit
                 
                 st.code(f"""
@@ -641,19 +748,24 @@ IP Solution (Whole Units):
 📟 Tablets: {int_tablets} units  
 💰 Profit: ₹{int_profit:,.0f}
 
-Profit Loss: ₹{profit_loss:,.0f} ({profit_loss/max_profit*100:.1f}%)
+Profit Loss: ₹{profit_loss:,.0f} ({profit_loss/max_profit*100 if max_profit else 0:.1f}%)
 But solution is IMPLEMENTABLE! ✅
+
+Solver: {int_result.mip_node_count} branch-and-bound nodes, gap {(int_result.mip_gap or 0)*100:.2f}%, {int_result.solve_seconds*1000:.1f} ms
                 """)
+                
+                if not int_result.success:
+                    st.warning(f"Best whole-unit plan found so far: {int_result.message}")
             else:
-                st.warning("Simple rounding doesn't work - need sophisticated IP algorithms!")
+                st.warning(f"No whole-unit production plan found: {int_result.message}")
     
     with col2:
         st.subheader("📊 Integer vs Continuous Solutions")
         
-        if 'optimal_phones' in locals() and result.success:
+        if 'int_profit' in locals():
             # Create comparison chart
             categories = ['LP Solution\n(Fractional)', 'IP Solution\n(Integer)']
-            profits = [max_profit, int_profit if 'int_profit' in locals() else max_profit * 0.95]
+            profits = [max_profit, int_profit]
             colors = ['lightblue', 'darkblue']
             
             fig = go.Figure()
@@ -717,51 +829,30 @@ But solution is IMPLEMENTABLE! ✅
         - One more sq ft of storage?
         """)
         
-        # Calculate shadow prices from the LP solution
-        if 'result' in locals() and result.success and hasattr(result, 'slack'):
-            # Extract shadow prices (dual values)
-            try:
-                # Shadow prices are the negative of dual values in minimization
-                shadow_prices = []
-                
-                # Check which constraints are binding (active)
-                tolerance = 1e-6
-                
-                labor_used = phone_time * optimal_phones + tablet_time * optimal_tablets
-                material_used = phone_material * optimal_phones + tablet_material * optimal_tablets
-                storage_used = phone_space * optimal_phones + tablet_space * optimal_tablets
-                
-                labor_slack = workers * worker_hours - labor_used
-                material_slack = material_budget * 100000 - material_used
-                storage_slack = storage_space - storage_used
-                
-                st.code(f"""
-RESOURCE UTILIZATION ANALYSIS:
-
-Labor Constraint:
-Used: {labor_used:.1f} / {workers * worker_hours} hours
-Slack: {labor_slack:.1f} hours
-Status: {"BINDING (Fully Used)" if labor_slack < tolerance else "Not Binding"}
-
-Material Constraint:
-Used: ₹{material_used:,.0f} / ₹{material_budget * 100000:,}
-Slack: ₹{material_slack:,.0f}
-Status: {"BINDING (Fully Used)" if material_slack < tolerance else "Not Binding"}
-
-Storage Constraint:
-Used: {storage_used:.1f} / {storage_space} sq ft
-Slack: {storage_slack:.1f} sq ft
-Status: {"BINDING (Fully Used)" if storage_slack < tolerance else "Not Binding"}
-                """)
-                
-                st.success("""
-                **Shadow Price Insight:**
-                Resources with zero slack (fully used) have positive shadow prices.
-                Resources with slack (unused) have zero shadow prices.
-                """)
-                
-            except Exception as e:
-                st.info("Shadow prices calculation requires advanced optimization libraries.")
+        # Shadow prices, slacks and validity ranges from one HiGHS solve
+        if 'result' in locals() and result.success:
+            sensitivity = model.sensitivity()
+        
+        if 'sensitivity' in locals() and sensitivity is not None:
+            units = {'Labor': 'hours', 'Material': 'rupees', 'Storage': 'sq ft'}
+            per_unit = {'Labor': 'hour', 'Material': 'rupee', 'Storage': 'sq ft'}
+            lines = ["RESOURCE UTILIZATION ANALYSIS:"]
+            for name, row in sensitivity.constraints.iterrows():
+                lines.append(f"""
+{name} Constraint:
+Used: {row['activity']:,.1f} / {row['rhs']:,.0f} {units[name]}
+Slack: {row['slack']:,.1f} {units[name]}
+Status: {"BINDING (Fully Used)" if row['binding'] else "Not Binding"}
+Shadow Price: ₹{row['shadow_price']:,.2f} per extra {per_unit[name]}
+Valid while limit is within: {row['rhs_lower']:,.0f} to {row['rhs_upper']:,.0f}""")
+            
+            st.code("\n".join(lines))
+            
+            st.success("""
+            **Shadow Price Insight:**
+            Resources with zero slack (fully used) have positive shadow prices.
+            Resources with slack (unused) have zero shadow prices.
+            """)
     
     with col2:
         st.subheader("💰 Shadow Price Business Applications")
@@ -782,23 +873,43 @@ Status: {"BINDING (Fully Used)" if storage_slack < tolerance else "Not Binding"}
         **Business Decisions Using Shadow Prices:**
         """)
         
-        # Example shadow price analysis
-        example_shadow = pd.DataFrame({
-            'Resource': ['Labor Hours', 'Material Budget', 'Storage Space'],
-            'Shadow Price (₹)': ['₹450/hour', '₹0.8/rupee', '₹0/sq ft'],
-            'Business Meaning': [
-                'Each extra hour increases profit by ₹450',
-                'Each extra rupee budget increases profit by ₹0.80',
-                'Extra storage space has no value (excess available)'
-            ],
-            'Action': [
-                '🎯 Hire more workers or overtime',
-                '💰 Negotiate better material prices',
-                '❌ Don\'t expand storage yet'
-            ]
-        })
-        
-        st.dataframe(example_shadow, use_container_width=True)
+        # Shadow price table for the current production model
+        if 'sensitivity' in locals() and sensitivity is not None:
+            shadow_table = pd.DataFrame({
+                'Resource': ['Labor Hours', 'Material Budget', 'Storage Space'],
+                'Shadow Price (₹)': [
+                    f"₹{price:,.2f}/{unit}" for price, unit in
+                    zip(sensitivity.constraints['shadow_price'], ['hour', 'rupee', 'sq ft'])
+                ],
+                'Business Meaning': [
+                    f"Each extra {unit} increases profit by ₹{price:,.2f}" if price > 1e-9
+                    else f"Extra {resource.lower()} has no value (excess available)"
+                    for resource, price, unit in zip(
+                        ['Labor hours', 'Material budget', 'Storage space'],
+                        sensitivity.constraints['shadow_price'],
+                        ['hour', 'rupee of budget', 'sq ft']
+                    )
+                ],
+                'Action': [
+                    action if price > 1e-9 else f"❌ Don't expand {resource} yet"
+                    for action, resource, price in zip(
+                        ['🎯 Hire more workers or overtime',
+                         '💰 Negotiate better material prices',
+                         '📦 Rent more storage'],
+                        ['labor', 'material budget', 'storage'],
+                        sensitivity.constraints['shadow_price']
+                    )
+                ]
+            })
+            
+            st.dataframe(shadow_table, use_container_width=True)
+            
+            st.caption(
+                "Reduced costs: " + ", ".join(
+                    f"{name} ₹{cost:,.0f}/unit" for name, cost in
+                    sensitivity.variables['reduced_cost'].items()
+                ) + " (a non-zero value is the profit lost per unit forced into the plan)."
+            )
         
         st.info("""
         **Shadow Price Strategy:**
@@ -834,33 +945,19 @@ Status: {"BINDING (Fully Used)" if storage_slack < tolerance else "Not Binding"}
         profit_phone_change = st.slider("Phone Profit Change (%)", -20, 20, 0, 5)
         profit_tablet_change = st.slider("Tablet Profit Change (%)", -20, 20, 0, 5)
         
-        # Recalculate with changes
-        new_phone_material = phone_material * (1 + material_change/100)
-        new_tablet_material = tablet_material * (1 + material_change/100)
-        new_workers = workers + worker_change
-        new_phone_profit = 8000 * (1 + profit_phone_change/100)
-        new_tablet_profit = 12000 * (1 + profit_tablet_change/100)
-        
-        # Solve with new parameters
+        # Solve with new parameters (a clone of the base model with the changes applied)
         try:
-            c_new = [-new_phone_profit, -new_tablet_profit]
-            A_new = [
-                [phone_time, tablet_time],
-                [new_phone_material, new_tablet_material],
-                [phone_space, tablet_space]
-            ]
-            b_new = [
-                new_workers * worker_hours,
-                material_budget * 100000,
-                storage_space
-            ]
-            
-            result_new = linprog(c_new, A_ub=A_new, b_ub=b_new, bounds=[x1_bounds, x2_bounds], method='highs')
+            what_if = model.scaled(
+                costs={0: 1 + profit_phone_change/100, 1: 1 + profit_tablet_change/100},
+                rows={1: 1 + material_change/100},
+                rhs={0: (workers + worker_change) / workers}
+            )
+            result_new = what_if.solve()
             
             if result_new.success:
                 new_optimal_phones = result_new.x[0]
                 new_optimal_tablets = result_new.x[1]
-                new_max_profit = -result_new.fun
+                new_max_profit = result_new.objective
                 
                 # Compare solutions
                 phone_change_abs = new_optimal_phones - optimal_phones
@@ -918,6 +1015,39 @@ Tablet Profit: {profit_tablet_change:+}%
             
             st.plotly_chart(fig, use_container_width=True)
         
+        # Tornado: every parameter at both ends of its range, others at base
+        if 'result' in locals() and result.success:
+            tornado = model.tornado(_tornado_parameters(workers))
+            ranked = tornado.frame()
+            labels = ranked.index[::-1]
+            
+            fig = go.Figure()
+            fig.add_trace(go.Bar(
+                y=labels, x=ranked['low_change'][::-1], orientation='h',
+                name='Low end', marker_color='indianred',
+                customdata=ranked['low'][::-1],
+                hovertemplate="%{y}: ₹%{customdata:,.0f} (%{x:+,.0f})<extra>Low end</extra>"
+            ))
+            fig.add_trace(go.Bar(
+                y=labels, x=ranked['high_change'][::-1], orientation='h',
+                name='High end', marker_color='seagreen',
+                customdata=ranked['high'][::-1],
+                hovertemplate="%{y}: ₹%{customdata:,.0f} (%{x:+,.0f})<extra>High end</extra>"
+            ))
+            fig.add_vline(x=0, line=dict(color='black', width=1))
+            fig.update_layout(
+                title="Profit Tornado: Which Parameter Matters Most?",
+                xaxis_title="Change in Daily Profit (₹)",
+                barmode='overlay', height=350
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            st.caption(
+                f"Each parameter moved across its full slider range with the others at today's values: "
+                f"{2 * len(ranked)} what-if plans from {tornado.lp_solves} LP solves. "
+                f"Biggest lever: {ranked.index[0]} (₹{ranked['swing'].iloc[0]:,.0f} swing)."
+            )
+        
         st.markdown("""
         **Sensitivity Analysis Benefits:**
         
@@ -943,15 +1073,121 @@ Tablet Profit: {profit_tablet_change:+}%
         Robust solutions maintain good performance across scenarios.
         """)
     
-    # Section 9: Portfolio Application Example
-    st.markdown("---")
-    st.header("9️⃣ Portfolio Optimization: Beyond Manufacturing")
-    
-    st.markdown("""
-    **Anand's Expanded Learning:** *"Now I understand optimization for production. 
-    But these same principles apply to investment portfolios too!"*
-    """)
-    
+    # What-if landscape: sweep one or two resource limits at once
+    if 'result' in locals() and result.success:
+        st.subheader("🗺️ What-If Landscape: Profit Across Resource Levels")
+        
+        resource_labels = ['Labor Hours', 'Material Budget', 'Storage Space']
+        swept = st.multiselect(
+            "Resources to sweep (one or two)", resource_labels,
+            default=['Labor Hours', 'Storage Space'], max_selections=2
+        )
+        
+        if swept:
+            # Each limit runs from 25% to 200% of today's value
+            sweeps = [
+                (resource_labels.index(label), np.linspace(0.25, 2.0, 41) * model.b_ub[resource_labels.index(label)])
+                for label in swept
+            ]
+            landscape = model.sweep_rhs(sweeps)
+            
+            fig = go.Figure()
+            if len(sweeps) == 1:
+                fig.add_trace(go.Scatter(
+                    x=sweeps[0][1], y=landscape.objective,
+                    mode='lines',
+                    name='Optimal Profit',
+                    line=dict(color='green', width=3)
+                ))
+                for breakpoint in landscape.breakpoints():
+                    fig.add_vline(x=breakpoint, line=dict(color='orange', dash='dash'))
+                fig.update_layout(xaxis_title=swept[0], yaxis_title="Daily Profit (₹)")
+            else:
+                fig.add_trace(go.Heatmap(
+                    x=sweeps[0][1], y=sweeps[1][1], z=landscape.objective.T,
+                    colorscale='Viridis',
+                    colorbar=dict(title="Profit (₹)")
+                ))
+                boundary = landscape.breakpoints()
+                if boundary:
+                    fig.add_trace(go.Scatter(
+                        x=[point[0] for point in boundary], y=[point[1] for point in boundary],
+                        mode='markers',
+                        name='Bottleneck changes',
+                        marker=dict(color='white', size=4)
+                    ))
+                fig.update_layout(xaxis_title=swept[0], yaxis_title=swept[1])
+            
+            fig.update_layout(title="Optimal Profit Landscape", height=450)
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Which resources are the bottleneck in each region
+            regions = []
+            for basis_index in range(len(landscape.bases)):
+                binding = landscape.binding_constraints(basis_index)
+                regions.append(", ".join(resource_labels[i] for i in binding) or "none")
+            for binding in landscape.unresolved.values():
+                regions.append(", ".join(resource_labels[i] for i in binding) or "none")
+            
+            st.caption(
+                f"{landscape.objective.size} what-if plans from {landscape.lp_solves} LP solves. "
+                f"Dashed lines / white dots mark where the bottleneck changes. "
+                f"Bottlenecks found: {'; '.join(dict.fromkeys(regions))}."
+            )
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _production_model(phone_time, tablet_time, labor_hours, phone_material, tablet_material,
+                      material_limit, phone_space, tablet_space, storage_space):
+    """Anand's phone/tablet production LP, built once per constraint setup"""
+    return LPModel(
+        [8000, 12000],
+        A_ub=[
+            [phone_time, tablet_time],  # Labor constraint
+            [phone_material, tablet_material],  # Material constraint
+            [phone_space, tablet_space]  # Storage constraint
+        ],
+        b_ub=[labor_hours, material_limit, storage_space],
+        maximize=True,
+        variable_names=['Phones', 'Tablets'],
+        constraint_names=['Labor', 'Material', 'Storage']
+    )
+
+
+def _tornado_parameters(workers):
+    """Section 8 tornado parameters: the what-if sliders' ranges plus ±20% resources"""
+    return [
+        ('Material Cost (±30%)', 'row', 1, 0.7, 1.3),
+        ('Workers (-10 / +20)', 'rhs', 0, (workers - 10) / workers, (workers + 20) / workers),
+        ('Phone Profit (±20%)', 'cost', 0, 0.8, 1.2),
+        ('Tablet Profit (±20%)', 'cost', 1, 0.8, 1.2),
+        ('Material Budget (±20%)', 'rhs', 1, 0.8, 1.2),
+        ('Storage Space (±20%)', 'rhs', 2, 0.8, 1.2),
+    ]
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _portfolio_model(equity_return, bond_return, fd_return, max_equity, min_bonds, min_fd):
+    """Section 9 allocation LP (all figures in %), built once per slider setting"""
+    return LPModel(
+        [equity_return/100, bond_return/100, fd_return/100],
+        A_ub=[
+            [1, 0, 0],  # x1 <= max_equity
+            [0, -1, 0],  # -x2 <= -min_bonds (x2 >= min_bonds)
+            [0, 0, -1]  # -x3 <= -min_fd (x3 >= min_fd)
+        ],
+        b_ub=[max_equity/100, -min_bonds/100, -min_fd/100],
+        A_eq=[[1, 1, 1]],  # x1 + x2 + x3 = 1
+        b_eq=[1],
+        bounds=[(0, 1), (0, 1), (0, 1)],
+        maximize=True,
+        variable_names=['Equity', 'Bonds', 'Fixed Deposits']
+    )
+
+
+@st.fragment
+def _show_portfolio_optimization():
+    """Section 9: portfolio allocation LP"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -1008,33 +1244,15 @@ x₁, x₂, x₃ ≥ 0 (Non-negative)
         
         # Solve portfolio optimization
         try:
-            # Objective coefficients (negative for maximization)
-            c_portfolio = [-equity_return/100, -bond_return/100, -fd_return/100]
-            
-            # Equality constraint: x1 + x2 + x3 = 1
-            A_eq = [[1, 1, 1]]
-            b_eq = [1]
-            
-            # Inequality constraints
-            A_ub = [
-                [1, 0, 0],  # x1 <= max_equity
-                [-1, 0, 0],  # -x1 <= 0 (x1 >= 0)
-                [0, -1, 0],  # -x2 <= -min_bonds (x2 >= min_bonds)
-                [0, 0, -1]   # -x3 <= -min_fd (x3 >= min_fd)
-            ]
-            b_ub = [max_equity/100, 0, -min_bonds/100, -min_fd/100]
-            
-            # Bounds
-            bounds = [(0, 1), (0, 1), (0, 1)]
-            
-            result_portfolio = linprog(c_portfolio, A_ub=A_ub, b_ub=b_ub, 
-                                     A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
+            result_portfolio = _portfolio_model(
+                equity_return, bond_return, fd_return, max_equity, min_bonds, min_fd
+            ).solve()
             
             if result_portfolio.success:
                 opt_equity = result_portfolio.x[0]
                 opt_bonds = result_portfolio.x[1]
                 opt_fd = result_portfolio.x[2]
-                portfolio_return = -result_portfolio.fun * 100
+                portfolio_return = result_portfolio.objective * 100
                 
                 # Create portfolio pie chart
                 fig = go.Figure(data=[go.Pie(
@@ -1067,81 +1285,197 @@ Expected Annual Income: ₹{portfolio_return/100*portfolio_amount:,.0f}
         
         except Exception as e:
             st.error(f"Portfolio optimization error: {str(e)}")
-    
-    # Key Takeaways and Summary
-    st.markdown("---")
-    st.header("🎓 Anand's Optimization Mastery Summary")
-    
-    col1, col2, col3 = st.columns(3)
-    
+
+
+@st.cache_resource(max_entries=16, show_spinner="Solving the efficient frontier...")
+def _treasury_frontier(n_assets, risk_measure, max_weight, n_points, workers):
+    """Frontier over the first n_assets treasury funds, solved once per setting"""
+    scenarios = treasury_return_scenarios().iloc[:, :n_assets]
+    return efficient_frontier(
+        scenarios=scenarios.to_numpy(), risk_measure=risk_measure, n_points=n_points,
+        upper=max_weight, workers=workers, assets=list(scenarios.columns),
+    )
+
+
+@st.fragment
+def _show_efficient_frontier():
+    """Section 9 (continued): mean-variance / mean-CVaR frontier over N funds"""
+    st.subheader("📈 From One Portfolio to the Efficient Frontier")
+    st.markdown("""
+    **Anand's Treasury Question:** *"Maximising return alone puts everything in the riskiest
+    fund. What is the **least risky** way to earn each level of return across all our funds?"*
+
+    Each point below is a separate optimization: minimise risk subject to full investment,
+    a cap per fund and *expected return ≥ target*, over 1,000 simulated years of returns.
+    """)
+
+    col1, col2 = st.columns([1, 2])
+
     with col1:
-        st.markdown("""
-        **🎯 Core Concepts Mastered**
-        
-        ✅ **Optimization Basics**
-        - Finding best from all choices
-        - Mathematical certainty vs guesswork
-        
-        ✅ **Linear Programming**
-        - Systematic approach to complex decisions
-        - Handles multiple variables & constraints
-        
-        ✅ **Constraints Understanding**
-        - Real business limitations
-        - Feasible region concept
-        """)
-    
+        n_assets = st.slider("Number of funds", 5, 40, 15, 5, key="frontier_assets")
+        risk_label = st.radio(
+            "Risk measure", ["Volatility (mean-variance)", "CVaR 95% (mean-CVaR)"],
+            key="frontier_risk",
+        )
+        risk_measure = 'variance' if risk_label.startswith("Volatility") else 'cvar'
+        max_weight = st.slider("Max weight per fund (%)", 10, 100, 30, 5, key="frontier_cap") / 100
+        n_points = st.slider("Frontier points", 10, 50, 25, 5, key="frontier_points")
+        parallel = st.checkbox(
+            "Solve across worker processes", value=False, key="frontier_parallel",
+            help="Splits the grid of targets over a process pool; pays off for large grids",
+        )
+        risk_free = 0.04
+
+    if max_weight * n_assets < 1:
+        with col2:
+            st.warning(f"With at most {max_weight:.0%} per fund, {n_assets} funds cannot hold 100%. "
+                       "Raise the cap or add funds.")
+        return
+
+    frontier = _treasury_frontier(n_assets, risk_measure, max_weight, n_points, 4 if parallel else 1)
+    feasible = frontier.feasible
+    risk_name = "Volatility" if risk_measure == 'variance' else "CVaR 95% (loss)"
+    best = frontier.max_sharpe_index(risk_free)
+    safest = frontier.min_risk_index()
+
     with col2:
-        st.markdown("""
-        **🔢 Advanced Techniques**
-        
-        ✅ **Integer Programming**
-        - Whole unit requirements
-        - Practical implementability
-        
-        ✅ **Dual Problem Analysis**
-        - Resource shadow prices
-        - Bottleneck identification
-        
-        ✅ **Sensitivity Analysis**
-        - What-if scenario planning
-        - Risk management
-        """)
-    
-    with col3:
-        st.markdown("""
-        **💼 Business Applications**
-        
-        ✅ **Production Planning**
-        - Optimal product mix
-        - Resource allocation
-        
-        ✅ **Investment Decisions**
-        - Portfolio optimization
-        - Capital budgeting
-        
-        ✅ **Strategic Planning**
-        - Data-driven decisions
-        - Competitive advantage
-        """)
-    
-    # Final Success Message
-    st.success("""
-    🎉 **Anand's Complete Optimization Transformation!**
-    
-    **From:** Overwhelming choices and guesswork decisions
-    **To:** Mathematical certainty and optimal resource allocation
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=frontier.risk[feasible] * 100, y=frontier.returns[feasible] * 100,
+            mode='lines+markers', name='Efficient frontier', line=dict(color='blue', width=3),
+        ))
+        for index, name, color in [(safest, 'Minimum risk', 'green'), (best, 'Best return per risk', 'red')]:
+            fig.add_trace(go.Scatter(
+                x=[frontier.risk[index] * 100], y=[frontier.returns[index] * 100],
+                mode='markers', name=name, marker=dict(size=14, color=color, symbol='star'),
+            ))
+        fig.update_layout(
+            title=f"Efficient Frontier ({n_assets} funds)",
+            xaxis_title=f"{risk_name} (%)", yaxis_title="Expected Return (%)", height=400,
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    weights = frontier.weights_frame()
+    held = weights.columns[(weights > 1e-4).any()]
+    fig = go.Figure()
+    for asset in held:
+        fig.add_trace(go.Scatter(
+            x=weights.index * 100, y=weights[asset] * 100, name=asset,
+            mode='lines', stackgroup='weights',
+        ))
+    fig.update_layout(
+        title="Portfolio Weights Along the Frontier",
+        xaxis_title="Target Return (%)", yaxis_title="Weight (%)", height=400,
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.success(
+        f"✅ Best return per unit of risk: {frontier.returns[best]:.2%} expected return at "
+        f"{frontier.risk[best]:.2%} {risk_name.lower()}, using {(frontier.weights[best] > 1e-4).sum()} funds"
+    )
+    st.caption(
+        f"{feasible.sum()} of {len(frontier.targets)} frontier points solved "
+        f"({frontier.solves} optimizations, {frontier.workers} worker(s), {frontier.seconds:.2f}s). "
+        f"Best return per risk is measured against a {risk_free:.0%} risk-free deposit rate."
+    )
+
+
+@st.cache_resource(max_entries=4, show_spinner="Reading the model file...")
+def _uploaded_model(file_id, filename, _data):
+    """read_model, parsed once per uploaded file (keyed by its file_id)"""
+    return read_model(_data, filename)
+
+
+def _solve_in_background(model_file, time_limit):
+    """Solve in the shared process pool, reporting elapsed time against the limit"""
+    progress = st.progress(0.0, text="Starting the solver...")
+    start = time.perf_counter()
+    try:
+        future = shared_executor().submit(solve_model_file, model_file, time_limit)
+        while not wait([future], timeout=0.25).done:
+            elapsed = time.perf_counter() - start
+            progress.progress(
+                min(elapsed / time_limit, 1.0),
+                text=f"HiGHS is solving... {elapsed:.0f}s of the {time_limit}s limit"
+            )
+        result = future.result()
+    except (BrokenProcessPool, OSError):
+        reset_executor()
+        progress.progress(0.0, text="Worker unavailable - solving in this process...")
+        result = solve_model_file(model_file, time_limit)
+    progress.empty()
+    return result
+
+
+@st.fragment
+def _show_model_upload():
+    """Section 10: solve an uploaded MPS / LP model and summarise its solution and duals"""
+    upload = st.file_uploader(
+        "Model file (.mps, .lp, .mps.gz, .lp.gz)", type=['mps', 'lp', 'gz'], key="model_upload"
+    )
+    if upload is None:
+        st.info("📂 Upload a model to see its size, optimal objective, binding constraints and shadow prices.")
+        return
+    
+    try:
+        model_file = _uploaded_model(upload.file_id, upload.name, upload.getvalue())
+    except ValueError as e:
+        st.error(f"Could not read {upload.name}: {e}")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Variables", f"{model_file.n_vars:,}")
+    col2.metric("Constraints", f"{model_file.n_rows:,}")
+    col3.metric("Nonzeros", f"{model_file.nonzeros:,}")
+    col4.metric("Integer Variables", f"{model_file.n_integer:,}")
+    
+    time_limit = st.slider("Time limit (seconds)", 5, 300, 60, 5, key="model_time_limit")
+    key = (upload.file_id, time_limit)
+    
+    if st.button("🚀 Solve with HiGHS", key="model_solve"):
+        st.session_state['model_solution'] = (key, _solve_in_background(model_file, time_limit))
+    
+    solved = st.session_state.get('model_solution')
+    if solved is None or solved[0] != key:
+        return
+    result = solved[1]
+    
+    objective = model_file.objective(result)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Objective", "—" if objective is None else f"{objective:,.4g}")
+    col2.metric("Status", {0: "Optimal", 1: "Time limit", 2: "Infeasible", 3: "Unbounded"}.get(result.status, "Stopped"))
+    col3.metric("Solve Time", f"{result.solve_seconds:.2f}s")
+    st.caption(
+        f"{'Maximize' if model_file.model.maximize else 'Minimize'} {model_file.name} - HiGHS: {result.message}"
+        + (f" Gap {(result.mip_gap or 0):.2%}, {result.mip_node_count:,} branch-and-bound nodes."
+           if model_file.model.is_integer and result.mip_node_count is not None else "")
+    )
+    
+    if result.x is None:
+        st.warning("No solution to show - relax the model or raise the time limit.")
+        return
     
-    **Optimization Superpowers Unlocked:**
-    ✅ **Systematic Decision Making** - No more guesswork, mathematical certainty
-    ✅ **Resource Optimization** - Maximum output from limited inputs  
-    ✅ **Constraint Management** - Turn limitations into strategic advantages
-    ✅ **Sensitivity Planning** - Robust decisions that handle uncertainty
-    ✅ **Multi-domain Application** - From production to portfolios to strategic planning
+    col1, col2 = st.columns([1, 1])
     
-    **The Power of Optimization:** Anand can now tackle any resource allocation challenge
-    with mathematical confidence, ensuring his company always makes the most profitable
-    and efficient decisions possible!
-    """)
+    with col1:
+        st.subheader("🔒 Constraints")
+        constraints = model_file.constraint_summary(result, top=model_file.n_rows)
+        if model_file.model.is_integer:
+            st.caption("Integer models have no shadow prices; binding constraints are listed instead.")
+            constraints = constraints[constraints['binding']].drop(columns='dual')
+        else:
+            st.caption("Largest shadow prices first: the bottlenecks worth relaxing.")
+        st.dataframe(constraints.head(20), use_container_width=True)
+        st.caption(f"{int(constraints['binding'].sum()):,} of {model_file.n_rows:,} constraints binding.")
     
-    st.markdown("---")
\ No newline at end of file
+    with col2:
+        st.subheader("📦 Largest Variables")
+        st.dataframe(model_file.variable_summary(result), use_container_width=True)
+        solution = pd.DataFrame({'variable': model_file.model.variable_names, 'value': result.x})
+        st.download_button(
+            "📥 Download full solution (CSV)",
+            solution.to_csv(index=False),
+            file_name=f"{upload.name.split('.')[0]}_solution.csv",
+            mime="text/csv",
+            key="model_solution_download"
+        )
@@ -0,0 +1,221 @@
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.optimize import linprog, minimize
+
+from modules.process_pool import reset_executor, shared_executor
+
+# Efficient frontiers for N-asset treasury portfolios.
+#
+# A frontier is a family of portfolio problems that differ only in the
+# target return: minimise risk subject to full investment, per-asset
+# weight bounds and expected return >= target. Risk is either variance
+# (a QP, solved with SLSQP) or CVaR of the scenario losses (the
+# Rockafellar-Uryasev LP, solved with HiGHS). The target grid runs from
+# the minimum-risk portfolio's return to the highest attainable return.
+#
+# Neighbouring targets have neighbouring optima, so each QP starts from
+# the weights of the previous grid point. With workers > 1 the grid is
+# cut into contiguous chunks that are solved in the shared process pool,
+# each chunk still warm-starting along its own stretch of the curve.
+
+RISK_MEASURES = ('variance', 'cvar')
+
+
+class Frontier:
+    """Minimum-risk portfolios over a grid of target returns.
+
+    risk_measure: 'variance' or 'cvar'.
+    targets: target returns, one per grid point.
+    returns: expected return of each optimal portfolio (NaN if unsolved).
+    risk: its volatility (standard deviation) for 'variance', its CVaR at
+        level alpha (expected loss in the worst 1 - alpha of scenarios)
+        for 'cvar'.
+    weights: (n_points, n_assets) optimal weights, rows of NaN if unsolved.
+    solves: number of optimisation problems solved, grid and end points.
+    """
+
+    def __init__(self, assets, risk_measure, alpha, targets, returns, risk, weights,
+                 solves, workers, seconds):
+        self.assets = assets
+        self.risk_measure = risk_measure
+        self.alpha = alpha
+        self.targets = targets
+        self.returns = returns
+        self.risk = risk
+        self.weights = weights
+        self.solves = solves
+        self.workers = workers
+        self.seconds = seconds
+
+    @property
+    def feasible(self):
+        return ~np.isnan(self.returns)
+
+    def min_risk_index(self):
+        return int(np.nanargmin(self.risk))
+
+    def max_sharpe_index(self, risk_free=0.0):
+        """Grid point with the best excess return per unit of risk"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = (self.returns - risk_free) / self.risk
+        ratio[~np.isfinite(ratio)] = np.nan
+        return int(np.nanargmax(ratio))
+
+    def weights_frame(self):
+        """Weights as a DataFrame (target return x asset), unsolved rows dropped"""
+        frame = pd.DataFrame(self.weights, index=self.targets, columns=self.assets)
+        frame.index.name = 'target_return'
+        return frame[self.feasible]
+
+
+def _variance_portfolio(cov, mu, bounds, target, x0):
+    """Minimum-variance weights with mu @ w >= target (None for no target)"""
+    constraints = [{'type': 'eq', 'fun': lambda w: w.sum() - 1, 'jac': lambda w: np.ones_like(w)}]
+    if target is not None:
+        constraints.append({'type': 'ineq', 'fun': lambda w: mu @ w - target, 'jac': lambda w: mu})
+    result = minimize(
+        lambda w: w @ cov @ w, x0, jac=lambda w: 2 * cov @ w, method='SLSQP',
+        bounds=bounds, constraints=constraints, options={'ftol': 1e-12, 'maxiter': 500},
+    )
+    if not result.success:
+        return None
+    return result.x
+
+
+def _cvar_portfolio(scenarios, mu, bounds, alpha, target):
+    """Minimum-CVaR weights via the Rockafellar-Uryasev LP.
+
+    Variables are [w, z, u]: z is the value-at-risk and u_s the loss in
+    scenario s beyond it, so CVaR = z + sum(u) / ((1 - alpha) S).
+    """
+    S, n = scenarios.shape
+    c = np.concatenate([np.zeros(n), [1.0], np.full(S, 1 / ((1 - alpha) * S))])
+
+    # -r_s @ w - z - u_s <= 0
+    A_ub = sparse.hstack([
+        sparse.csr_matrix(-scenarios), sparse.csr_matrix(-np.ones((S, 1))), -sparse.identity(S),
+    ], format='csr')
+    b_ub = np.zeros(S)
+    if target is not None:
+        row = sparse.csr_matrix(np.concatenate([-mu, np.zeros(1 + S)]))
+        A_ub = sparse.vstack([A_ub, row], format='csr')
+        b_ub = np.append(b_ub, -target)
+
+    A_eq = sparse.csr_matrix(np.concatenate([np.ones(n), np.zeros(1 + S)]))
+    all_bounds = list(bounds) + [(None, None)] + [(0, None)] * S
+    result = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=[1.0],
+                     bounds=all_bounds, method='highs')
+    if not result.success:
+        return None
+    return result.x[:n]
+
+
+def _solve_chunk(risk_measure, mu, risk_data, bounds, alpha, targets, x0):
+    """Optimal weights for consecutive targets, each QP warm-started from the last"""
+    weights = np.full((len(targets), len(mu)), np.nan)
+    for i, target in enumerate(targets):
+        if risk_measure == 'variance':
+            w = _variance_portfolio(risk_data, mu, bounds, target, x0)
+        else:
+            w = _cvar_portfolio(risk_data, mu, bounds, alpha, target)
+        if w is not None:
+            weights[i] = w
+            x0 = w
+    return weights
+
+
+def _risk(risk_measure, risk_data, alpha, weights):
+    """Volatility or CVaR of each row of weights"""
+    if risk_measure == 'variance':
+        variance = np.einsum('ij,jk,ik->i', weights, risk_data, weights)
+        return np.sqrt(np.maximum(variance, 0))
+    losses = -(risk_data @ weights.T)  # scenarios x portfolios
+    tail = max(1, int(np.ceil((1 - alpha) * len(risk_data))))
+    return np.sort(losses, axis=0)[-tail:].mean(axis=0)
+
+
+def efficient_frontier(mu=None, cov=None, scenarios=None, risk_measure='variance', n_points=25,
+                       lower=0.0, upper=1.0, alpha=0.95, workers=1, assets=None):
+    """Solve the mean-variance or mean-CVaR frontier on n_points target returns.
+
+    Give expected returns mu and the covariance cov, or a (scenarios x
+    assets) array of scenario returns from which whichever is missing is
+    estimated; 'cvar' always needs scenarios. lower and upper bound every
+    weight. workers > 1 spreads the grid over the shared process pool.
+    """
+    if risk_measure not in RISK_MEASURES:
+        raise ValueError(f"risk_measure must be one of {RISK_MEASURES}")
+    start = time.perf_counter()
+
+    if scenarios is not None:
+        scenarios = np.asarray(scenarios, dtype=float)
+        if mu is None:
+            mu = scenarios.mean(axis=0)
+        if cov is None and risk_measure == 'variance':
+            cov = np.cov(scenarios, rowvar=False)
+    if mu is None:
+        raise ValueError("efficient_frontier needs mu or scenarios")
+    if risk_measure == 'variance' and cov is None:
+        raise ValueError("Mean-variance frontiers need cov or scenarios")
+    if risk_measure == 'cvar' and scenarios is None:
+        raise ValueError("Mean-CVaR frontiers need scenarios")
+
+    mu = np.asarray(mu, dtype=float)
+    n = len(mu)
+    if not lower * n <= 1 <= upper * n:
+        raise ValueError(f"Weights between {lower:g} and {upper:g} cannot sum to 1 over {n} assets")
+    bounds = [(lower, upper)] * n
+    risk_data = np.asarray(cov, dtype=float) if risk_measure == 'variance' else scenarios
+    if assets is None:
+        assets = [f'Asset {i + 1}' for i in range(n)]
+
+    # End points: the minimum-risk portfolio and the maximum-return LP
+    x0 = np.full(n, 1 / n)
+    if risk_measure == 'variance':
+        min_risk = _variance_portfolio(risk_data, mu, bounds, None, x0)
+    else:
+        min_risk = _cvar_portfolio(risk_data, mu, bounds, alpha, None)
+    if min_risk is None:
+        raise ValueError("Could not find the minimum-risk portfolio")
+    max_return = linprog(-mu, A_eq=np.ones((1, n)), b_eq=[1.0], bounds=bounds, method='highs').x
+
+    targets = np.linspace(mu @ min_risk, mu @ max_return, n_points)
+    solves = 2 + n_points
+
+    # Contiguous chunks; each starts from the straight line between the end points
+    n_chunks = max(1, min(workers, n_points))
+    chunks = np.array_split(np.arange(n_points), n_chunks)
+    span = mu @ max_return - mu @ min_risk
+    starts = []
+    for chunk in chunks:
+        share = (targets[chunk[0]] - targets[0]) / span if span > 0 else 0.0
+        starts.append((1 - share) * min_risk + share * max_return)
+    tasks = [(risk_measure, mu, risk_data, bounds, alpha, targets[chunk], warm)
+             for chunk, warm in zip(chunks, starts)]
+
+    results = None
+    if n_chunks > 1:
+        try:
+            pool = shared_executor()
+            results = list(pool.map(_solve_chunk, *zip(*tasks)))
+        except (BrokenProcessPool, OSError):
+            reset_executor()
+            n_chunks = 1
+    if results is None:
+        results = [_solve_chunk(*task) for task in tasks]
+    weights = np.vstack(results)
+
+    returns = weights @ mu
+    risk = np.full(n_points, np.nan)
+    solved = ~np.isnan(returns)
+    if solved.any():
+        risk[solved] = _risk(risk_measure, risk_data, alpha, weights[solved])
+
+    return Frontier(
+        list(assets), risk_measure, alpha, targets, returns, risk, weights,
+        solves, n_chunks, time.perf_counter() - start,
+    )
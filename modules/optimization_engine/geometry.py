@@ -0,0 +1,111 @@
+from collections import deque
+
+import numpy as np
+
+# Exact feasible regions of two-variable LPs.
+#
+# The region {x : A @ x <= b} is intersected half-plane by half-plane: sort
+# the boundary lines by angle, sweep them once with a deque, and read the
+# vertices off consecutive survivors (O(m log m) for m constraints). The
+# result is the polygon itself, not a sampled approximation, so a single
+# filled trace draws it at any zoom and adding constraints costs almost
+# nothing. Unbounded regions are clipped to a bounding box.
+
+TOLERANCE = 1e-9
+
+
+def _cross(u, v):
+    return u[0] * v[1] - u[1] * v[0]
+
+
+def _intersection(p1, d1, p2, d2):
+    """Point where the lines p1 + t d1 and p2 + s d2 meet"""
+    t = _cross(d2, p1 - p2) / _cross(d1, d2)
+    return p1 + t * d1
+
+
+def _outside(p, d, point, scale):
+    """True if point lies strictly to the right of the directed line p + t d"""
+    return _cross(d, point - p) < -TOLERANCE * scale
+
+
+def default_box(A, b):
+    """(x_min, x_max, y_min, y_max) comfortably containing every axis intercept"""
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        intercepts = np.abs(b[:, None] / A)
+    finite = intercepts[np.isfinite(intercepts)]
+    extent = max(2 * finite.max(), 1.0) if finite.size else 1.0
+    return (-extent, extent, -extent, extent)
+
+
+def feasible_polygon(A, b, box=None, closed=False):
+    """Vertices of {x in R^2 : A @ x <= b}, counter-clockwise, shape (k, 2).
+
+    Add rows for non-negativity (-x <= 0) like any other constraint. The
+    region is clipped to box = (x_min, x_max, y_min, y_max), which defaults
+    to default_box(A, b); it only matters when the region is unbounded.
+    Returns an empty (0, 2) array when the region is empty. With
+    closed=True the first vertex is repeated at the end, ready for a
+    fill='toself' trace.
+    """
+    A = np.asarray(A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).ravel()
+    if box is None:
+        box = default_box(A, b)
+    x_min, x_max, y_min, y_max = box
+    A = np.vstack([A, [[-1, 0], [1, 0], [0, -1], [0, 1]]])
+    b = np.concatenate([b, [-x_min, x_max, -y_min, y_max]])
+
+    norms = np.hypot(A[:, 0], A[:, 1])
+    degenerate = norms <= TOLERANCE
+    if np.any(b[degenerate] < 0):
+        return np.empty((0, 2))
+    A = A[~degenerate] / norms[~degenerate, None]
+    b = b[~degenerate] / norms[~degenerate]
+    scale = max(1.0, float(np.abs(b).max()))
+
+    # Boundary a @ x = b as a directed line with the feasible side on its left
+    points = A * b[:, None]
+    # + 0.0 turns -0.0 into 0.0, or arctan2 puts (-1, -0.0) at -pi instead of pi
+    directions = np.column_stack([-A[:, 1], A[:, 0]]) + 0.0
+    order = np.argsort(np.arctan2(directions[:, 1], directions[:, 0]), kind='stable')
+    lines = [(points[i], directions[i]) for i in order]
+
+    survivors = deque()
+    for p, d in lines:
+        while len(survivors) > 1 and _outside(p, d, _intersection(*survivors[-1], *survivors[-2]), scale):
+            survivors.pop()
+        while len(survivors) > 1 and _outside(p, d, _intersection(*survivors[0], *survivors[1]), scale):
+            survivors.popleft()
+        if survivors and abs(_cross(d, survivors[-1][1])) <= TOLERANCE:
+            if np.dot(d, survivors[-1][1]) < 0:
+                # Opposite parallel lines left adjacent: the region is empty
+                return np.empty((0, 2))
+            # Same direction: keep only the tighter of the two
+            if not _outside(p, d, survivors[-1][0], scale):
+                continue
+            survivors.pop()
+        survivors.append((p, d))
+
+    while len(survivors) > 2 and _outside(*survivors[0], _intersection(*survivors[-1], *survivors[-2]), scale):
+        survivors.pop()
+    while len(survivors) > 2 and _outside(*survivors[-1], _intersection(*survivors[0], *survivors[1]), scale):
+        survivors.popleft()
+    if len(survivors) < 3:
+        return np.empty((0, 2))
+
+    vertices = np.array([
+        _intersection(*survivors[i], *survivors[(i + 1) % len(survivors)]) for i in range(len(survivors))
+    ])
+
+    # Several constraints through one corner give repeated vertices
+    distinct = np.linalg.norm(vertices - np.roll(vertices, 1, axis=0), axis=1) > TOLERANCE * scale
+    if not distinct.any():
+        vertices = vertices[:1]
+    else:
+        vertices = vertices[distinct]
+    if closed and len(vertices):
+        vertices = np.vstack([vertices, vertices[:1]])
+    return vertices
@@ -0,0 +1,68 @@
+import time
+
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+# Exact integer programming for the production-mix models.
+#
+# Takes the same minimisation form as scipy.optimize.linprog (c, A_ub, b_ub,
+# A_eq, b_eq, bounds) so an LP can be switched to whole units by changing
+# the call, and solves it with HiGHS branch-and-cut through
+# scipy.optimize.milp instead of rounding the LP answer.
+
+
+def _to_bounds(bounds, n_vars):
+    """linprog-style bounds ((low, high) or a list of them, None = unbounded) -> Bounds"""
+    if bounds is None:
+        bounds = (0, None)
+    if isinstance(bounds, np.ndarray) and bounds.ndim == 2:
+        return Bounds(bounds[:, 0], bounds[:, 1])  # (n_vars, 2) array, +-inf = unbounded
+    if len(bounds) == 2 and not isinstance(bounds[0], (tuple, list)):
+        bounds = [bounds] * n_vars
+
+    lower = np.array([-np.inf if low is None else low for low, _ in bounds], dtype=float)
+    upper = np.array([np.inf if high is None else high for _, high in bounds], dtype=float)
+    return Bounds(lower, upper)
+
+
+def solve_integer(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                  integrality=None, time_limit=None, mip_rel_gap=None):
+    """Minimise c @ x subject to A_ub @ x <= b_ub and A_eq @ x == b_eq, x integer.
+
+    integrality follows milp: 1 for an integer variable, 0 for a continuous
+    one (default: every variable integer). Returns scipy's OptimizeResult
+    with x, fun, success, status and message as for linprog, plus
+    mip_gap, mip_node_count, mip_dual_bound and solve_seconds.
+    """
+    c = np.asarray(c, dtype=float)
+    n_vars = len(c)
+
+    constraints = []
+    if A_ub is not None:
+        constraints.append(LinearConstraint(A_ub, -np.inf, b_ub))
+    if A_eq is not None:
+        constraints.append(LinearConstraint(A_eq, b_eq, b_eq))
+
+    if integrality is None:
+        integrality = np.ones(n_vars)
+
+    options = {}
+    if time_limit is not None:
+        options['time_limit'] = time_limit
+    if mip_rel_gap is not None:
+        options['mip_rel_gap'] = mip_rel_gap
+
+    start = time.perf_counter()
+    result = milp(
+        c,
+        constraints=constraints,
+        integrality=integrality,
+        bounds=_to_bounds(bounds, n_vars),
+        options=options,
+    )
+    result.solve_seconds = time.perf_counter() - start
+
+    # milp leaves these out when no integer point was found
+    for field in ('mip_gap', 'mip_node_count', 'mip_dual_bound'):
+        result.setdefault(field, None)
+    return result
@@ -0,0 +1,237 @@
+import threading
+import time
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linprog
+
+from modules.optimization_engine.integer import solve_integer
+from modules.optimization_engine.sensitivity import lp_sensitivity
+from modules.optimization_engine.sweep import sweep_rhs
+from modules.optimization_engine.tornado import lp_tornado
+
+# One LP model object for every optimization section.
+#
+# The model holds its objective and constraint blocks as NumPy arrays (or
+# scipy.sparse matrices for large models) and is built once per parameter
+# set. Everything derived from it - the LP solution, the whole-unit plan,
+# shadow prices, RHS sweeps, tornados - is computed on first request and
+# kept on the model, so sections and reruns that need the same answer
+# share one solve. Clones with modified coefficients share every array
+# they do not change.
+
+_stats_lock = threading.Lock()
+_stats = {'models': 0, 'computations': 0, 'reuses': 0, 'lp_solves': 0, 'seconds': 0.0}
+
+
+def _array(values):
+    if values is None or sparse.issparse(values):
+        return values
+    return np.asarray(values, dtype=float)
+
+
+def _dense(matrix):
+    return matrix.toarray() if sparse.issparse(matrix) else matrix
+
+
+def _nonnegative_bounds(bounds):
+    """True when bounds (linprog form: pair, list of pairs or (n, 2) array) are x >= 0"""
+    if bounds is None:
+        return True
+    bounds = np.array(bounds, dtype=float).reshape(-1, 2)  # None becomes NaN
+    lower, upper = bounds[:, 0], bounds[:, 1]
+    return bool(np.all(lower == 0) and np.all(np.isnan(upper) | (upper == np.inf)))
+
+
+def _hashable(value):
+    """Memo key part for parameters, sweeps and similar nested arguments"""
+    if isinstance(value, np.ndarray):
+        return tuple(value.tolist())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+class LPModel:
+    """Optimise c @ x subject to A_ub @ x <= b_ub, A_eq @ x == b_eq and bounds.
+
+    The objective keeps the sense given by maximize; results carry an
+    extra objective attribute in that sense (fun stays linprog's
+    minimisation value). bounds follow linprog and default to x >= 0;
+    integrality follows milp and is used by solve_integer (default: every
+    variable integer).
+
+    stats: computations (distinct results computed), reuses (results
+    served from the model), lp_solves (HiGHS calls) and seconds.
+    """
+
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                 maximize=False, variable_names=None, constraint_names=None, integrality=None):
+        self.c = _array(c)
+        self.A_ub = _array(A_ub)
+        self.b_ub = _array(b_ub)
+        self.A_eq = _array(A_eq)
+        self.b_eq = _array(b_eq)
+        self.bounds = bounds
+        self.maximize = maximize
+        self.variable_names = variable_names
+        self.constraint_names = constraint_names
+        self.integrality = None if integrality is None else np.asarray(integrality)
+        self.stats = {'computations': 0, 'reuses': 0, 'lp_solves': 0, 'seconds': 0.0}
+        self._results = {}
+        self._lock = threading.Lock()
+        with _stats_lock:
+            _stats['models'] += 1
+
+    def __getstate__(self):
+        # Picklable for process-pool workers: arrays only, no lock or results
+        state = self.__dict__.copy()
+        del state['_lock'], state['_results']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._results = {}
+        self._lock = threading.Lock()
+
+    @property
+    def n_vars(self):
+        return len(self.c)
+
+    @property
+    def n_constraints(self):
+        return (0 if self.A_ub is None else self.A_ub.shape[0]) + (0 if self.A_eq is None else self.A_eq.shape[0])
+
+    @property
+    def is_integer(self):
+        return self.integrality is not None and bool(np.any(self.integrality))
+
+    @property
+    def sign(self):
+        return -1.0 if self.maximize else 1.0
+
+    def clone(self, **changes):
+        """Copy of the model with some attributes replaced (e.g. b_ub=...)"""
+        fields = ('c', 'A_ub', 'b_ub', 'A_eq', 'b_eq', 'bounds', 'maximize',
+                  'variable_names', 'constraint_names', 'integrality')
+        unknown = set(changes) - set(fields)
+        if unknown:
+            raise TypeError(f"LPModel has no field(s) {sorted(unknown)}")
+        return LPModel(**{field: changes.get(field, getattr(self, field)) for field in fields})
+
+    def scaled(self, costs=None, rhs=None, rows=None):
+        """Clone with c[j], b_ub[i] or whole rows A_ub[i] multiplied by factors ({index: factor})"""
+        changes = {}
+        if costs:
+            c = self.c.copy()
+            for j, factor in costs.items():
+                c[j] *= factor
+            changes['c'] = c
+        if rhs:
+            b = self.b_ub.copy()
+            for i, factor in rhs.items():
+                b[i] *= factor
+            changes['b_ub'] = b
+        if rows:
+            scale = np.ones(self.A_ub.shape[0])
+            for i, factor in rows.items():
+                scale[i] = factor
+            A = sparse.diags(scale) @ self.A_ub
+            changes['A_ub'] = A.tocsr() if sparse.issparse(self.A_ub) else A
+        return self.clone(**changes)
+
+    def _computed(self, key, compute, lp_solves):
+        """Result for key, computed once; lp_solves(result) counts its HiGHS calls"""
+        with self._lock:
+            if key in self._results:
+                self.stats['reuses'] += 1
+                with _stats_lock:
+                    _stats['reuses'] += 1
+                return self._results[key]
+
+        start = time.perf_counter()
+        result = compute()
+        seconds = time.perf_counter() - start
+        solves = lp_solves(result)
+
+        with self._lock:
+            self._results.setdefault(key, result)
+            self.stats['computations'] += 1
+            self.stats['lp_solves'] += solves
+            self.stats['seconds'] += seconds
+        with _stats_lock:
+            _stats['computations'] += 1
+            _stats['lp_solves'] += solves
+            _stats['seconds'] += seconds
+        return result
+
+    def _require_inequality_form(self, what):
+        if self.A_eq is not None or not _nonnegative_bounds(self.bounds):
+            raise ValueError(f"{what} needs a model with only A_ub @ x <= b_ub and x >= 0")
+
+    def solve(self, time_limit=None):
+        """linprog (HiGHS) result of the model, integrality ignored"""
+        def compute():
+            start = time.perf_counter()
+            result = linprog(
+                self.sign * self.c, A_ub=self.A_ub, b_ub=self.b_ub, A_eq=self.A_eq, b_eq=self.b_eq,
+                bounds=self.bounds if self.bounds is not None else (0, None), method='highs',
+                options={} if time_limit is None else {'time_limit': time_limit},
+            )
+            result.solve_seconds = time.perf_counter() - start
+            result.objective = self.sign * result.fun if result.x is not None and result.fun is not None else None
+            return result
+        return self._computed(('solve', time_limit), compute, lambda result: 1)
+
+    def solve_integer(self, time_limit=None):
+        """solve_integer result with the model's integrality (default: all integer)"""
+        def compute():
+            result = solve_integer(
+                self.sign * self.c, A_ub=self.A_ub, b_ub=self.b_ub, A_eq=self.A_eq, b_eq=self.b_eq,
+                bounds=self.bounds, integrality=self.integrality, time_limit=time_limit,
+            )
+            result.objective = self.sign * result.fun if result.x is not None else None
+            return result
+        return self._computed(('integer', time_limit), compute, lambda result: 1)
+
+    def sensitivity(self):
+        """lp_sensitivity of the model (None if it has no optimal solution), built on solve()"""
+        self._require_inequality_form("Sensitivity analysis")
+        result = self.solve()
+        return self._computed(
+            ('sensitivity',),
+            lambda: lp_sensitivity(
+                self.c, _dense(self.A_ub), self.b_ub, maximize=self.maximize,
+                constraint_names=self.constraint_names, variable_names=self.variable_names,
+                result=result,
+            ),
+            lambda sensitivity: 0,
+        )
+
+    def sweep_rhs(self, sweeps):
+        """sweep_rhs over one or two right-hand sides of the model, starting from solve()"""
+        self._require_inequality_form("RHS sweeps")
+        result = self.solve()
+        return self._computed(
+            ('sweep', _hashable(sweeps)),
+            lambda: sweep_rhs(self.c, _dense(self.A_ub), self.b_ub, sweeps, maximize=self.maximize, result=result),
+            lambda result: result.lp_solves,
+        )
+
+    def tornado(self, parameters):
+        """lp_tornado of the model for (name, kind, index, low, high) parameters, built on solve()"""
+        self._require_inequality_form("Tornado analysis")
+        result = self.solve()
+        return self._computed(
+            ('tornado', _hashable(parameters)),
+            lambda: lp_tornado(
+                self.c, _dense(self.A_ub), self.b_ub, parameters, maximize=self.maximize, result=result,
+            ),
+            lambda tornado: tornado.lp_solves if tornado is not None else 0,
+        )
+
+
+def solve_stats():
+    """Models built and results computed / reused across the process"""
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,610 @@
+import gzip
+import io
+import re
+from array import array
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from modules.optimization_engine.model import LPModel
+
+# Reading planners' LP/MILP models from MPS and CPLEX-LP files.
+#
+# Both readers stream the file line by line and append every nonzero to
+# typed arrays (row index, column index, value), so a model with hundreds
+# of thousands of coefficients costs a few bytes per coefficient instead of
+# a Python object each; names are the only per-row / per-column objects.
+# The arrays become one CSR matrix, which is split into the A_ub / A_eq
+# blocks of an LPModel: <= rows as they are, >= rows negated, ranged rows
+# as both, = rows in A_eq. ModelFile keeps the mapping back to the rows as
+# written so duals can be reported per original constraint.
+
+ROW_TYPES = {'L': 0, 'G': 1, 'E': 2}
+
+
+class ModelFile:
+    """An LP/MILP model read from an MPS or LP file.
+
+    model: LPModel with sparse A_ub / A_eq, bounds as an (n, 2) array,
+        integrality (1 for integer columns) and one constraint name per
+        A_ub row.
+    A, row_names, row_lower, row_upper: the constraints as written in the
+        file, lower <= A @ x <= upper (+-inf where a side is open).
+    ub_rows / ub_signs: original row of each A_ub row, and +1 for its
+        upper limit or -1 for its (negated) lower limit.
+    eq_rows: original row of each A_eq row.
+    objective_offset: constant term of the objective.
+    """
+
+    def __init__(self, name, model, A, row_names, row_lower, row_upper,
+                 ub_rows, ub_signs, eq_rows, objective_offset):
+        self.name = name
+        self.model = model
+        self.A = A
+        self.row_names = row_names
+        self.row_lower = row_lower
+        self.row_upper = row_upper
+        self.ub_rows = ub_rows
+        self.ub_signs = ub_signs
+        self.eq_rows = eq_rows
+        self.objective_offset = objective_offset
+
+    @property
+    def n_vars(self):
+        return self.A.shape[1]
+
+    @property
+    def n_rows(self):
+        return self.A.shape[0]
+
+    @property
+    def nonzeros(self):
+        return self.A.nnz
+
+    @property
+    def n_integer(self):
+        return 0 if self.model.integrality is None else int(np.count_nonzero(self.model.integrality))
+
+    def solve(self, time_limit=None):
+        """HiGHS result: milp if any column is integer, linprog otherwise"""
+        if self.model.is_integer:
+            return self.model.solve_integer(time_limit=time_limit)
+        return self.model.solve(time_limit=time_limit)
+
+    def objective(self, result):
+        """Objective value in the file's sense, constant included (None if no solution)"""
+        if result.objective is None:
+            return None
+        return result.objective + self.objective_offset
+
+    def row_duals(self, result):
+        """Dual value per original row in the objective's sense (NaN without LP duals)"""
+        duals = np.full(self.n_rows, np.nan)
+        ineqlin = result.get('ineqlin')
+        eqlin = result.get('eqlin')
+        if result.x is None or ineqlin is None or eqlin is None:
+            return duals
+        duals[:] = 0.0
+        np.add.at(duals, self.ub_rows, self.model.sign * self.ub_signs * ineqlin.marginals)
+        np.add.at(duals, self.eq_rows, self.model.sign * eqlin.marginals)
+        return duals
+
+    def constraint_summary(self, result, top=20):
+        """Rows with the largest |dual| (binding constraints first) as a DataFrame"""
+        activity = self.A @ result.x
+        duals = self.row_duals(result)
+        frame = pd.DataFrame({
+            'lower': self.row_lower,
+            'activity': activity,
+            'upper': self.row_upper,
+            'dual': duals,
+        }, index=pd.Index(self.row_names, name='constraint'))
+        frame['binding'] = (
+            np.isclose(activity, self.row_lower, rtol=1e-7, atol=1e-7)
+            | np.isclose(activity, self.row_upper, rtol=1e-7, atol=1e-7)
+        )
+        order = np.argsort(-np.nan_to_num(np.abs(duals)), kind='stable')
+        return frame.iloc[order[:top]]
+
+    def variable_summary(self, result, top=20):
+        """Columns with the largest |value| as a DataFrame, with reduced costs for LPs"""
+        x = result.x
+        bounds = self.model.bounds
+        frame = pd.DataFrame({
+            'value': x,
+            'lower': bounds[:, 0],
+            'upper': bounds[:, 1],
+            'cost': self.model.c,
+        }, index=pd.Index(self.model.variable_names, name='variable'))
+        lower = result.get('lower')
+        if lower is not None and result.get('upper') is not None:
+            frame['reduced_cost'] = self.model.sign * (lower.marginals + result.upper.marginals)
+        order = np.argsort(-np.abs(x), kind='stable')
+        return frame.iloc[order[:top]]
+
+
+def solve_model_file(model_file, time_limit=None):
+    """model_file.solve(time_limit); a module-level function for process-pool workers"""
+    return model_file.solve(time_limit=time_limit)
+
+
+class _Builder:
+    """Rows, columns and nonzeros of a model being read, in typed arrays"""
+
+    def __init__(self, name):
+        self.name = name
+        self.maximize = False
+        self.objective_offset = 0.0
+
+        self.row_index = {}
+        self.row_names = []
+        self.row_types = array('b')
+        self.rhs = array('d')
+        self.ranges = array('d')
+
+        self.col_index = {}
+        self.col_names = []
+        self.cost = array('d')
+        self.col_lower = array('d')
+        self.col_upper = array('d')
+        self.integer = array('b')
+
+        self.entry_rows = array('i')
+        self.entry_cols = array('i')
+        self.entry_values = array('d')
+
+    def add_row(self, name, row_type):
+        if name in self.row_index:
+            raise ValueError(f"Constraint {name} is defined twice")
+        self.row_index[name] = len(self.row_names)
+        self.row_names.append(name)
+        self.row_types.append(ROW_TYPES[row_type])
+        self.rhs.append(0.0)
+        self.ranges.append(np.nan)
+        return self.row_index[name]
+
+    def column(self, name, integer=False):
+        """Index of column name, created with bounds [0, inf) on first use"""
+        index = self.col_index.get(name)
+        if index is None:
+            index = self.col_index[name] = len(self.col_names)
+            self.col_names.append(name)
+            self.cost.append(0.0)
+            self.col_lower.append(0.0)
+            self.col_upper.append(np.inf)
+            self.integer.append(1 if integer else 0)
+        return index
+
+    def add_entry(self, row, col, value):
+        self.entry_rows.append(row)
+        self.entry_cols.append(col)
+        self.entry_values.append(value)
+
+    def build(self):
+        m, n = len(self.row_names), len(self.col_names)
+        if n == 0:
+            raise ValueError("The model has no variables")
+        A = sparse.csr_matrix(
+            (np.frombuffer(self.entry_values, dtype=float),
+             (np.frombuffer(self.entry_rows, dtype=np.int32), np.frombuffer(self.entry_cols, dtype=np.int32))),
+            shape=(m, n),
+        )
+
+        # Row limits from type, rhs and range (MPS RANGES semantics)
+        types = np.frombuffer(self.row_types, dtype=np.int8)
+        rhs = np.frombuffer(self.rhs, dtype=float)
+        ranges = np.frombuffer(self.ranges, dtype=float)
+        lower = np.where(types == ROW_TYPES['L'], -np.inf, rhs)
+        upper = np.where(types == ROW_TYPES['G'], np.inf, rhs)
+        ranged = ~np.isnan(ranges)
+        span = np.abs(np.nan_to_num(ranges))
+        lower = np.where(ranged & (types == ROW_TYPES['L']), rhs - span, lower)
+        upper = np.where(ranged & (types == ROW_TYPES['G']), rhs + span, upper)
+        upper = np.where(ranged & (types == ROW_TYPES['E']) & (ranges > 0), rhs + span, upper)
+        lower = np.where(ranged & (types == ROW_TYPES['E']) & (ranges < 0), rhs - span, lower)
+
+        equal = lower == upper
+        has_upper = np.flatnonzero(np.isfinite(upper) & ~equal)
+        has_lower = np.flatnonzero(np.isfinite(lower) & ~equal)
+        eq_rows = np.flatnonzero(equal)
+        ub_rows = np.concatenate([has_upper, has_lower])
+        ub_signs = np.concatenate([np.ones(len(has_upper)), -np.ones(len(has_lower))])
+
+        A_ub = sparse.vstack([A[has_upper], -A[has_lower]], format='csr') if len(ub_rows) else None
+        b_ub = np.concatenate([upper[has_upper], -lower[has_lower]]) if len(ub_rows) else None
+        A_eq = A[eq_rows] if len(eq_rows) else None
+        b_eq = lower[eq_rows] if len(eq_rows) else None
+        # Names follow the A_ub rows; a ranged row's lower limit is a second row
+        ub_names = [self.row_names[i] for i in has_upper] + [
+            self.row_names[i] + (' (lower)' if np.isfinite(upper[i]) else '') for i in has_lower
+        ]
+
+        integer = np.frombuffer(self.integer, dtype=np.int8).astype(np.uint8)
+        model = LPModel(
+            np.frombuffer(self.cost, dtype=float).copy(),
+            A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+            bounds=np.column_stack([np.frombuffer(self.col_lower), np.frombuffer(self.col_upper)]),
+            maximize=self.maximize,
+            variable_names=self.col_names,
+            constraint_names=ub_names,
+            integrality=integer if integer.any() else None,
+        )
+        return ModelFile(
+            self.name, model, A, self.row_names, lower, upper,
+            ub_rows, ub_signs, eq_rows, self.objective_offset,
+        )
+
+
+def _number(text):
+    return float(text)
+
+
+def read_mps(lines, name='model'):
+    """Read a fixed or free MPS model from an iterable of lines.
+
+    Supports ROWS, COLUMNS (with integer MARKER blocks), RHS, RANGES,
+    BOUNDS (UP LO FX FR MI PL BV LI UI) and OBJSENSE. Names must not
+    contain spaces.
+    """
+    builder = _Builder(name)
+    section = None
+    objective = None
+    free_rows = set()
+    integer_block = False
+
+    for number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if not line.strip() or line.startswith('*'):
+            continue
+        fields = line.split()
+        try:
+            if not line[0].isspace():
+                keyword = fields[0].upper()
+                if keyword == 'ENDATA':
+                    break
+                if keyword == 'NAME':
+                    builder.name = ' '.join(fields[1:]) or name
+                    section = None
+                elif keyword == 'OBJSENSE':
+                    section = 'OBJSENSE'
+                    if len(fields) > 1:
+                        builder.maximize = fields[1].upper() in ('MAX', 'MAXIMIZE')
+                elif keyword in ('ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS'):
+                    section = keyword
+                else:
+                    raise ValueError(f"unsupported section {keyword}")
+                continue
+
+            if section == 'OBJSENSE':
+                builder.maximize = fields[0].upper() in ('MAX', 'MAXIMIZE')
+
+            elif section == 'ROWS':
+                row_type, row = fields[0].upper(), fields[1]
+                if row_type == 'N':
+                    if objective is None:
+                        objective = row
+                    else:
+                        free_rows.add(row)
+                else:
+                    builder.add_row(row, row_type)
+
+            elif section == 'COLUMNS':
+                if len(fields) >= 3 and fields[1].strip("'").upper() == 'MARKER':
+                    integer_block = fields[2].strip("'").upper() == 'INTORG'
+                    continue
+                col = builder.column(fields[0], integer=integer_block)
+                for row, value in zip(fields[1::2], fields[2::2]):
+                    if row == objective:
+                        builder.cost[col] = _number(value)
+                    elif row not in free_rows:
+                        builder.add_entry(builder.row_index[row], col, _number(value))
+
+            elif section in ('RHS', 'RANGES'):
+                pairs = fields[1:] if len(fields) % 2 else fields  # optional set name
+                for row, value in zip(pairs[0::2], pairs[1::2]):
+                    if row == objective:
+                        if section == 'RHS':
+                            builder.objective_offset = -_number(value)
+                    elif row not in free_rows:
+                        target = builder.rhs if section == 'RHS' else builder.ranges
+                        target[builder.row_index[row]] = _number(value)
+
+            elif section == 'BOUNDS':
+                bound_type = fields[0].upper()
+                rest = fields[1:]
+                if bound_type in ('FR', 'MI', 'PL', 'BV'):
+                    col_name, value = rest[-1], None
+                else:
+                    col_name, value = rest[-2], _number(rest[-1])
+                col = builder.column(col_name)
+                if bound_type in ('UP', 'UI'):
+                    if value < 0 and builder.col_lower[col] == 0:
+                        builder.col_lower[col] = -np.inf
+                    builder.col_upper[col] = value
+                elif bound_type in ('LO', 'LI'):
+                    builder.col_lower[col] = value
+                elif bound_type == 'FX':
+                    builder.col_lower[col] = builder.col_upper[col] = value
+                elif bound_type == 'FR':
+                    builder.col_lower[col], builder.col_upper[col] = -np.inf, np.inf
+                elif bound_type == 'MI':
+                    builder.col_lower[col] = -np.inf
+                elif bound_type == 'PL':
+                    builder.col_upper[col] = np.inf
+                elif bound_type == 'BV':
+                    builder.col_lower[col], builder.col_upper[col] = 0.0, 1.0
+                else:
+                    raise ValueError(f"unsupported bound type {bound_type}")
+                if bound_type in ('UI', 'LI', 'BV'):
+                    builder.integer[col] = 1
+
+            else:
+                raise ValueError("data outside a section")
+        except (ValueError, IndexError, KeyError) as exc:
+            raise ValueError(f"MPS line {number}: {exc} ({line.strip()[:60]!r})") from None
+
+    if objective is None and not builder.col_names:
+        raise ValueError("No ROWS / COLUMNS found - is this an MPS file?")
+    return builder.build()
+
+
+# CPLEX LP format
+
+_LP_SECTIONS = [
+    (re.compile(r'(maximi[sz]e|maximum|max)(?=\s|$)(?!\s*:)', re.I), 'max'),
+    (re.compile(r'(minimi[sz]e|minimum|min)(?=\s|$)(?!\s*:)', re.I), 'min'),
+    (re.compile(r'(subject\s+to|such\s+that|s\.t\.|st)(?=\s|$)(?!\s*:)', re.I), 'constraints'),
+    (re.compile(r'(bounds?)(?=\s|$)(?!\s*:)', re.I), 'bounds'),
+    (re.compile(r'(generals?|gen|integers?)(?=\s|$)(?!\s*:)', re.I), 'general'),
+    (re.compile(r'(binary|binaries|bin)(?=\s|$)(?!\s*:)', re.I), 'binary'),
+    (re.compile(r'(semi-continuous|semis?|sos[12]?)(?=\s|$)(?!\s*:)', re.I), 'unsupported'),
+    (re.compile(r'(end)(?=\s|$)', re.I), 'end'),
+]
+
+_LP_TOKEN = re.compile(r"""
+    (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<op><=|=<|>=|=>|<|>|=)
+  | (?P<sign>[+-])
+  | (?P<colon>:)
+  | (?P<name>[A-Za-z_!"\#$%&()/,;?@`'{}|~][A-Za-z0-9_!"\#$%&()/,.;?@`'{}|~]*)
+  | (?P<other>\S)
+""", re.X)
+
+_INFINITY = ('inf', 'infinity')
+
+
+class _Tokens:
+    """(kind, text) tokens of an LP section with lookahead"""
+
+    def __init__(self, text):
+        self._matches = _LP_TOKEN.finditer(text)
+        self._buffer = deque()
+
+    def peek(self, offset=0):
+        while len(self._buffer) <= offset:
+            match = next(self._matches, None)
+            if match is None:
+                return (None, None)
+            kind = match.lastgroup
+            if kind == 'name' and match.group().lower() in _INFINITY:
+                kind = 'number'
+            elif kind == 'other':
+                raise ValueError(f"unexpected {match.group()!r} (quadratic terms are not supported)")
+            self._buffer.append((kind, match.group()))
+        return self._buffer[offset]
+
+    def next(self):
+        token = self.peek()
+        if token[0] is not None:
+            self._buffer.popleft()
+        return token
+
+
+def _lp_value(tokens):
+    """Signed number (or +-inf) at the head of tokens"""
+    sign = 1.0
+    while tokens.peek()[0] == 'sign':
+        sign *= -1.0 if tokens.next()[1] == '-' else 1.0
+    kind, text = tokens.next()
+    if kind != 'number':
+        raise ValueError(f"expected a number, found {text!r}")
+    return sign * (np.inf if text.lower() in _INFINITY else float(text))
+
+
+def _lp_expression(tokens):
+    """Linear terms up to the next operator / label: ([(name, coefficient)], constant)"""
+    terms, constant = [], 0.0
+    while True:
+        kind, text = tokens.peek()
+        if kind is None or kind == 'op' or (kind == 'name' and tokens.peek(1)[0] == 'colon'):
+            return terms, constant
+        sign = 1.0
+        while tokens.peek()[0] == 'sign':
+            sign *= -1.0 if tokens.next()[1] == '-' else 1.0
+        coefficient = None
+        if tokens.peek()[0] == 'number':
+            coefficient = float(tokens.next()[1])
+        if tokens.peek()[0] == 'name' and tokens.peek(1)[0] != 'colon':
+            terms.append((tokens.next()[1], sign * (1.0 if coefficient is None else coefficient)))
+        elif coefficient is not None:
+            constant += sign * coefficient
+        else:
+            raise ValueError(f"unexpected {tokens.peek()[1]!r}")
+
+
+def _label(tokens):
+    if tokens.peek()[0] == 'name' and tokens.peek(1)[0] == 'colon':
+        label = tokens.next()[1]
+        tokens.next()
+        return label
+    return None
+
+
+def _lp_objective(builder, text):
+    tokens = _Tokens(text)
+    _label(tokens)
+    terms, constant = _lp_expression(tokens)
+    if tokens.peek()[0] is not None:
+        raise ValueError(f"unexpected {tokens.peek()[1]!r} in the objective")
+    builder.objective_offset += constant
+    for name, coefficient in terms:
+        builder.cost[builder.column(name)] += coefficient
+
+
+def _lp_constraints(builder, text):
+    tokens = _Tokens(text)
+    unlabeled = []
+    while tokens.peek()[0] is not None:
+        row_name = label = _label(tokens)
+        if label is None:
+            # Placeholder (LP names have no spaces); named once every label is known
+            label = f"R{len(builder.row_names) + 1}"
+            row_name = f" row {len(builder.row_names)}"
+            unlabeled.append(len(builder.row_names))
+
+        # Optional left-hand limit of a ranged row: lo <= expression <= hi
+        left = None
+        start = 1 if tokens.peek()[0] == 'sign' else 0
+        if tokens.peek(start)[0] == 'number' and tokens.peek(start + 1)[0] == 'op':
+            left = (_lp_value(tokens), tokens.next()[1][0])
+
+        terms, constant = _lp_expression(tokens)
+        kind, op = tokens.next()
+        if kind != 'op':
+            raise ValueError(f"constraint {label} has no <=, >= or =")
+        rhs = _lp_value(tokens) - constant
+        op = op[0]
+
+        if left is None:
+            row = builder.add_row(row_name, {'<': 'L', '>': 'G', '=': 'E'}[op])
+            builder.rhs[row] = rhs
+        else:
+            value, left_op = left
+            value -= constant
+            if left_op != op or op == '=':
+                raise ValueError(f"ranged constraint {label} needs matching <= or >= on both sides")
+            low, high = (value, rhs) if op == '<' else (rhs, value)
+            row = builder.add_row(row_name, 'G')
+            builder.rhs[row] = low
+            builder.ranges[row] = high - low
+        for name, coefficient in terms:
+            builder.add_entry(row, builder.column(name), coefficient)
+
+    # Default names R1, R2, ... by row number, skipping names used explicitly
+    for row in unlabeled:
+        name = f"R{row + 1}"
+        suffix = 1
+        while name in builder.row_index:
+            name = f"R{row + 1}_{suffix}"
+            suffix += 1
+        del builder.row_index[builder.row_names[row]]
+        builder.row_index[name] = row
+        builder.row_names[row] = name
+
+
+def _set_bound(builder, name, op, value, variable_on_left):
+    col = builder.column(name)
+    if op == '=':
+        builder.col_lower[col] = builder.col_upper[col] = value
+    elif (op == '<') == variable_on_left:
+        builder.col_upper[col] = value
+    else:
+        builder.col_lower[col] = value
+
+
+def _lp_bounds(builder, lines):
+    for line in lines:
+        tokens = _Tokens(line)
+        if tokens.peek()[0] is None:
+            continue
+        if tokens.peek()[0] == 'name' and (tokens.peek(1)[1] or '').lower() == 'free':
+            col = builder.column(tokens.next()[1])
+            builder.col_lower[col], builder.col_upper[col] = -np.inf, np.inf
+            continue
+        if tokens.peek()[0] == 'name':
+            name = tokens.next()[1]
+            op = tokens.next()[1][0]
+            _set_bound(builder, name, op, _lp_value(tokens), variable_on_left=True)
+        else:
+            value = _lp_value(tokens)
+            op = tokens.next()[1][0]
+            kind, name = tokens.next()
+            if kind != 'name':
+                raise ValueError(f"expected a variable, found {name!r}")
+            _set_bound(builder, name, op, value, variable_on_left=False)
+            if tokens.peek()[0] == 'op':
+                op = tokens.next()[1][0]
+                _set_bound(builder, name, op, _lp_value(tokens), variable_on_left=True)
+        if tokens.peek()[0] is not None:
+            raise ValueError(f"unexpected {tokens.peek()[1]!r}")
+
+
+def read_lp(lines, name='model'):
+    """Read a CPLEX-LP model (objective, constraints, bounds, general, binary)"""
+    builder = _Builder(name)
+    sections = {'objective': [], 'constraints': [], 'bounds': [], 'general': [], 'binary': []}
+    current = None
+
+    for line in lines:
+        line = line.split('\\', 1)[0].strip()
+        if not line:
+            continue
+        for pattern, section in _LP_SECTIONS:
+            match = pattern.match(line)
+            if match:
+                break
+        else:
+            section = None
+        if section == 'end':
+            break
+        if section == 'unsupported':
+            raise ValueError(f"LP section {match.group(1)!r} is not supported")
+        if section is not None:
+            if section in ('max', 'min'):
+                builder.maximize = section == 'max'
+                section = 'objective'
+            current = section
+            line = line[match.end():].strip()
+            if not line:
+                continue
+        if current is None:
+            raise ValueError(f"text before the objective section: {line[:60]!r}")
+        sections[current].append(line)
+
+    if not sections['objective'] and not sections['constraints']:
+        raise ValueError("No objective or constraints found - is this an LP file?")
+
+    for section, parse in (('objective', _lp_objective), ('constraints', _lp_constraints)):
+        try:
+            parse(builder, '\n'.join(sections[section]))
+        except (ValueError, KeyError) as exc:
+            raise ValueError(f"LP {section}: {exc}") from None
+    try:
+        _lp_bounds(builder, sections['bounds'])
+    except (ValueError, KeyError) as exc:
+        raise ValueError(f"LP bounds: {exc}") from None
+
+    for name in ' '.join(sections['general']).split():
+        builder.integer[builder.column(name)] = 1
+    for name in ' '.join(sections['binary']).split():
+        col = builder.column(name)
+        builder.integer[col] = 1
+        builder.col_lower[col], builder.col_upper[col] = 0.0, 1.0
+    return builder.build()
+
+
+def read_model(data, filename):
+    """ModelFile from uploaded bytes; .mps / .lp by extension (optionally .gz)"""
+    name = filename.lower()
+    if name.endswith('.gz'):
+        data = gzip.decompress(data)
+        name = name[:-3]
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='replace')
+    label = filename.rsplit('/', 1)[-1]
+    if name.endswith('.lp'):
+        return read_lp(lines, label)
+    if name.endswith(('.mps', '.fmps', '.freemps')):
+        return read_mps(lines, label)
+    raise ValueError("Upload an .mps or .lp file (optionally gzipped)")
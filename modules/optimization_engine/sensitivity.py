@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+from scipy.optimize import linprog
+
+# LP sensitivity analysis from a single HiGHS solve.
+#
+# Shadow prices come straight from the constraint marginals HiGHS returns
+# (result.ineqlin.marginals), reduced costs from the bound marginals, and
+# ranging intervals from the optimal basis - no extra LP per resource.
+# Models are in the form of the production-mix page: maximise or minimise
+# c @ x subject to A_ub @ x <= b_ub and x >= 0.
+
+TOLERANCE = 1e-9
+
+
+class LPSensitivity:
+    """Optimal solution of one LP with its duals, reduced costs and ranges.
+
+    All prices are in the sense of the objective as given: with
+    maximize=True a shadow price is the profit gained per extra unit of
+    the resource.
+
+    constraints: DataFrame indexed by constraint name with rhs, activity,
+        slack, binding, shadow_price and the rhs_lower / rhs_upper interval
+        over which the shadow price stays valid.
+    variables: DataFrame indexed by variable name with value, cost,
+        reduced_cost and the cost_lower / cost_upper interval over which
+        the current solution stays optimal.
+    """
+
+    def __init__(self, result, objective, constraints, variables):
+        self.result = result
+        self.objective = objective
+        self.constraints = constraints
+        self.variables = variables
+
+    @property
+    def x(self):
+        return self.variables['value'].to_numpy()
+
+    def shadow_price(self, constraint):
+        return self.constraints.loc[constraint, 'shadow_price']
+
+
+def _optimal_basis(A, c, x, slack, reduced_costs, marginals):
+    """Indices of a basis (columns of [A I]) consistent with the solution and its duals.
+
+    c is the minimisation objective HiGHS solved; reduced_costs and
+    marginals are its bound and constraint marginals. At a degenerate
+    vertex several bases share x, and only those reproducing the HiGHS
+    duals give valid ranges, so the basis is checked against them. Returns
+    an incomplete basis (len < m) when no consistent one was found.
+    """
+    m, n = A.shape
+    full = np.hstack([A, np.eye(m)])
+    values = np.concatenate([x, slack])
+    # Nonbasic columns must have zero reduced cost to enter a degenerate basis;
+    # a slack's reduced cost is minus its constraint's marginal
+    zero_cost = np.concatenate([np.abs(reduced_costs) <= 1e-7, np.abs(marginals) <= 1e-7])
+
+    basis = [j for j in range(n + m) if values[j] > TOLERANCE]
+    candidates = [j for j in range(n + m) if j not in basis and zero_cost[j]]
+    for j in candidates[::-1]:  # slacks first
+        if len(basis) == m:
+            break
+        if np.linalg.matrix_rank(full[:, basis + [j]]) == len(basis) + 1:
+            basis.append(j)
+    basis = sorted(basis)
+    if len(basis) != m:
+        return full, basis
+
+    # The basis must reproduce the HiGHS duals: B^-T c_B == marginals
+    c_full = np.concatenate([c, np.zeros(m)])
+    try:
+        duals = np.linalg.solve(full[:, basis].T, c_full[basis])
+    except np.linalg.LinAlgError:
+        return full, []
+    scale = max(1.0, float(np.abs(c).max(initial=0.0)))
+    if not np.allclose(duals, marginals, rtol=1e-6, atol=1e-7 * scale):
+        return full, []
+    return full, basis
+
+
+def _ranging(A, b, c, x, slack, reduced_costs, marginals):
+    """RHS ranges per constraint and cost ranges per variable (minimisation form).
+
+    Ranges are NaN (undetermined) when no basis consistent with the duals
+    is found.
+    """
+    m, n = A.shape
+    rhs_range = np.full((m, 2), np.nan)
+    cost_range = np.full((n, 2), np.nan)
+
+    full, basis = _optimal_basis(A, c, x, slack, reduced_costs, marginals)
+    if len(basis) != m:
+        return rhs_range, cost_range
+
+    B_inv = np.linalg.inv(full[:, basis])
+    x_B = B_inv @ b
+
+    # RHS ranging: keep B^-1 (b + delta e_i) >= 0
+    for i in range(m):
+        direction = B_inv[:, i]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = -x_B / direction
+        lower = ratios[direction > TOLERANCE]
+        upper = ratios[direction < -TOLERANCE]
+        rhs_range[i] = (
+            b[i] + (lower.max() if len(lower) else -np.inf),
+            b[i] + (upper.min() if len(upper) else np.inf),
+        )
+
+    # Cost ranging: keep every nonbasic reduced cost >= 0
+    c_full = np.concatenate([c, np.zeros(m)])
+    nonbasic = [j for j in range(n + m) if j not in basis]
+    tableau = B_inv @ full[:, nonbasic]
+    d_N = c_full[nonbasic] - c_full[basis] @ tableau
+
+    for j in range(n):
+        if j in nonbasic:
+            d_j = d_N[nonbasic.index(j)]
+            cost_range[j] = (c[j] - d_j, np.inf)
+            continue
+        row = tableau[basis.index(j)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = d_N / row
+        upper = ratios[row > TOLERANCE]
+        lower = ratios[row < -TOLERANCE]
+        cost_range[j] = (
+            c[j] + (lower.max() if len(lower) else -np.inf),
+            c[j] + (upper.min() if len(upper) else np.inf),
+        )
+
+    return rhs_range, cost_range
+
+
+def lp_sensitivity(c, A_ub, b_ub, maximize=False, constraint_names=None, variable_names=None,
+                   result=None):
+    """Solve the LP once with HiGHS and return its LPSensitivity.
+
+    result is an existing linprog (HiGHS) result for this same LP, used
+    instead of solving it again. Returns None when the LP has no optimal
+    solution.
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A_ub, dtype=float)
+    b = np.asarray(b_ub, dtype=float)
+    m, n = A.shape
+    sign = -1.0 if maximize else 1.0
+
+    if result is None:
+        result = linprog(sign * c, A_ub=A, b_ub=b, bounds=(0, None), method='highs')
+    if not result.success:
+        return None
+
+    # HiGHS marginals are d(objective)/d(rhs) for the minimisation it solved
+    duals = sign * result.ineqlin.marginals
+    reduced_costs = result.lower.marginals
+    rhs_range, cost_range = _ranging(
+        A, b, sign * c, result.x, result.slack, reduced_costs, result.ineqlin.marginals
+    )
+    if maximize:
+        cost_range = -cost_range[:, ::-1]
+
+    constraints = pd.DataFrame({
+        'rhs': b,
+        'activity': A @ result.x,
+        'slack': result.slack,
+        'binding': result.slack <= 1e-7 * np.maximum(1.0, np.abs(b)),
+        'shadow_price': duals,
+        'rhs_lower': rhs_range[:, 0],
+        'rhs_upper': rhs_range[:, 1],
+    }, index=constraint_names or [f'c{i + 1}' for i in range(m)])
+
+    variables = pd.DataFrame({
+        'value': result.x,
+        'cost': c,
+        'reduced_cost': sign * reduced_costs + 0.0,
+        'cost_lower': cost_range[:, 0],
+        'cost_upper': cost_range[:, 1],
+    }, index=variable_names or [f'x{j + 1}' for j in range(n)])
+
+    return LPSensitivity(result, sign * result.fun, constraints, variables)
@@ -0,0 +1,175 @@
+import numpy as np
+from scipy.optimize import linprog
+
+from modules.optimization_engine.sensitivity import TOLERANCE, _optimal_basis
+
+# Parametric right-hand-side sweeps for the production-mix LP.
+#
+# Changing b never affects dual feasibility, so an optimal basis stays
+# optimal for every grid point where B^-1 b >= 0. The sweep solves one LP,
+# evaluates its basis over the whole remaining grid in a single matrix
+# product, and only calls HiGHS again for the points that basis cannot
+# cover. A 41 x 41 grid typically needs a handful of solves.
+
+# basis_id of a grid point whose optimal basis could not be identified
+NO_BASIS = -2
+
+
+class RHSSweep:
+    """Optimal objective over a 1-D or 2-D grid of right-hand-side values.
+
+    axes: list of (constraint index, grid values), one per swept constraint.
+    objective: optimal objective per grid point (NaN where infeasible),
+        shaped like the grid.
+    x: optimal variable values, grid shape + (n_vars,).
+    basis_id: index into bases for every grid point, -1 where infeasible
+        and NO_BASIS where HiGHS solved the point but no basis consistent
+        with its duals was found.
+    bases: optimal bases found, each a tuple of column indices into [A I].
+    unresolved: binding constraint indices (zero slack) of each NO_BASIS
+        point, keyed by its grid index.
+    lp_solves: number of LPs HiGHS actually solved.
+    """
+
+    def __init__(self, axes, objective, x, basis_id, bases, unresolved, n_vars, n_constraints, lp_solves):
+        self.axes = axes
+        self.objective = objective
+        self.x = x
+        self.basis_id = basis_id
+        self.bases = bases
+        self.unresolved = unresolved
+        self.n_vars = n_vars
+        self.n_constraints = n_constraints
+        self.lp_solves = lp_solves
+
+    def binding_constraints(self, basis_index):
+        """Indices of the constraints whose slack is nonbasic (fully used)"""
+        basis = self.bases[basis_index]
+        return [i for i in range(self.n_constraints) if self.n_vars + i not in basis]
+
+    def breakpoints(self):
+        """Grid cells next to a basis change.
+
+        1-D sweeps return the midpoints between neighbouring grid values
+        whose optimal basis differs. 2-D sweeps return (value_0, value_1)
+        pairs for every cell whose right or upper neighbour differs.
+        NO_BASIS points are skipped: in 1-D the comparison runs between
+        the known points either side, in 2-D they mark no change.
+        """
+        ids = self.basis_id
+        if ids.ndim == 1:
+            known = np.flatnonzero(ids != NO_BASIS)
+            values = self.axes[0][1][known]
+            change = ids[known][1:] != ids[known][:-1]
+            return [float(v) for v in (values[1:][change] + values[:-1][change]) / 2]
+
+        values_0, values_1 = self.axes[0][1], self.axes[1][1]
+        known = ids != NO_BASIS
+        change = np.zeros(ids.shape, dtype=bool)
+        change[:-1, :] |= (ids[1:, :] != ids[:-1, :]) & known[1:, :] & known[:-1, :]
+        change[:, :-1] |= (ids[:, 1:] != ids[:, :-1]) & known[:, 1:] & known[:, :-1]
+        return [(float(values_0[i]), float(values_1[j])) for i, j in zip(*np.nonzero(change))]
+
+
+def sweep_rhs(c, A_ub, b_ub, sweeps, maximize=False, result=None):
+    """Solve max/min c @ x, A_ub @ x <= b, x >= 0 over a grid of b values.
+
+    sweeps is a list of one or two (constraint index, values) pairs; the
+    other right-hand sides stay at b_ub. result is an existing linprog
+    (HiGHS) result for the model at b_ub; its optimal basis is tried on
+    the whole grid before HiGHS is called.
+    """
+    if len(sweeps) not in (1, 2):
+        raise ValueError("sweep_rhs sweeps one or two right-hand sides")
+
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A_ub, dtype=float)
+    b = np.asarray(b_ub, dtype=float)
+    m, n = A.shape
+    sign = -1.0 if maximize else 1.0
+
+    axes = [(index, np.asarray(values, dtype=float)) for index, values in sweeps]
+    grid_shape = tuple(len(values) for _, values in axes)
+    mesh = np.meshgrid(*[values for _, values in axes], indexing='ij')
+
+    rhs = np.tile(b, (int(np.prod(grid_shape)), 1))
+    for (index, _), values in zip(axes, mesh):
+        rhs[:, index] = values.ravel()
+
+    n_points = len(rhs)
+    objective = np.full(n_points, np.nan)
+    x = np.full((n_points, n), np.nan)
+    basis_id = np.full(n_points, -1)
+    bases = []
+    unresolved = {}
+    lp_solves = 0
+
+    full = np.hstack([A, np.eye(m)])
+    scale = np.maximum(1.0, np.abs(rhs).max(axis=0))
+    pending = np.arange(n_points)
+
+    def cover(basis, solved=None):
+        """Assign basis to every pending point where it is feasible (always to solved)"""
+        B_inv = np.linalg.inv(full[:, basis])
+        x_B = rhs[pending] @ B_inv.T
+        covered = (x_B >= -TOLERANCE * scale.max()).all(axis=1)
+        if solved is not None:
+            covered[pending == solved] = True
+        if not covered.any():
+            return pending
+
+        values = np.zeros((covered.sum(), n + m))
+        values[:, basis] = np.maximum(x_B[covered], 0)
+        points = pending[covered]
+        x[points] = values[:, :n]
+        objective[points] = values[:, :n] @ c
+        basis_id[points] = len(bases)
+        bases.append(tuple(basis))
+        return pending[~covered]
+
+    if result is not None and result.success:
+        # The base model's basis, evaluated on the whole grid without a solve
+        _, basis = _optimal_basis(
+            A, sign * c, result.x, result.slack, result.lower.marginals, result.ineqlin.marginals
+        )
+        if len(basis) == m:
+            pending = cover(basis)
+
+    while pending.size:
+        point = pending[0]
+        result = linprog(sign * c, A_ub=A, b_ub=rhs[point], bounds=(0, None), method='highs')
+        lp_solves += 1
+
+        if not result.success:
+            pending = pending[1:]
+            continue
+
+        _, basis = _optimal_basis(
+            A, sign * c, result.x, result.slack, result.lower.marginals, result.ineqlin.marginals
+        )
+        if len(basis) != m:
+            # No usable basis: keep the solver's answer for this point only,
+            # with its binding set read from the slacks
+            x[point] = result.x
+            objective[point] = c @ result.x
+            basis_id[point] = NO_BASIS
+            binding = np.flatnonzero(result.slack <= 1e-7 * np.maximum(1.0, np.abs(rhs[point])))
+            grid_index = tuple(int(i) for i in np.unravel_index(point, grid_shape))
+            unresolved[grid_index] = tuple(int(i) for i in binding)
+            pending = pending[1:]
+            continue
+
+        # Evaluate the basis on every pending point at once
+        pending = cover(basis, solved=point)
+
+    return RHSSweep(
+        axes,
+        objective.reshape(grid_shape),
+        x.reshape(grid_shape + (n,)),
+        basis_id.reshape(grid_shape),
+        bases,
+        unresolved,
+        n,
+        m,
+        lp_solves,
+    )
@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+from scipy.optimize import linprog
+
+from modules.optimization_engine.sensitivity import TOLERANCE, _optimal_basis
+
+# One-at-a-time sensitivity (tornado) for LPs of the production-mix form.
+#
+# Every parameter is moved to its low and its high value with the others
+# at base, giving 2k variants of one model. The variants are stacked as
+# arrays derived from the base c, A and b, and the base optimal basis is
+# tested on all of them in one batched linear solve: wherever it is still
+# primal and dual feasible it gives the variant's optimum directly. HiGHS
+# is only called for the variants whose optimal basis changes.
+
+PARAMETER_KINDS = ('cost', 'rhs', 'row')
+
+
+class Tornado:
+    """Optimal objective with each parameter at its low and high value.
+
+    parameters: (name, kind, index, low, high) as passed to lp_tornado.
+    base: optimal objective of the unperturbed model.
+    low / high: optimal objective per parameter at its low / high value
+        (NaN where that variant is infeasible).
+    x_low / x_high: the matching optimal solutions, (k, n_vars).
+    lp_solves: number of LPs HiGHS actually solved, base model included
+        unless its result was passed in.
+    """
+
+    def __init__(self, parameters, base, x_base, low, high, x_low, x_high, lp_solves):
+        self.parameters = parameters
+        self.base = base
+        self.x_base = x_base
+        self.low = low
+        self.high = high
+        self.x_low = x_low
+        self.x_high = x_high
+        self.lp_solves = lp_solves
+
+    def frame(self):
+        """DataFrame per parameter with low / high objective and swing, widest swing first"""
+        frame = pd.DataFrame({
+            'low_value': [p[3] for p in self.parameters],
+            'high_value': [p[4] for p in self.parameters],
+            'low': self.low,
+            'high': self.high,
+            'low_change': self.low - self.base,
+            'high_change': self.high - self.base,
+            'swing': np.abs(self.high - self.low),
+        }, index=[p[0] for p in self.parameters])
+        return frame.sort_values('swing', ascending=False, na_position='first')
+
+
+def _variants(c, A, b, parameters):
+    """Stack the 2k perturbed models: (2k, n) costs, (2k, m, n) matrices, (2k, m) rhs"""
+    k = len(parameters)
+    costs = np.tile(c, (2 * k, 1))
+    matrices = np.tile(A, (2 * k, 1, 1))
+    rhs = np.tile(b, (2 * k, 1))
+    for p, (name, kind, index, low, high) in enumerate(parameters):
+        for v, factor in ((2 * p, low), (2 * p + 1, high)):
+            if kind == 'cost':
+                costs[v, index] *= factor
+            elif kind == 'rhs':
+                rhs[v, index] *= factor
+            elif kind == 'row':
+                matrices[v, index] *= factor
+            else:
+                raise ValueError(f"Unknown parameter kind {kind!r} for {name}; use one of {PARAMETER_KINDS}")
+    return costs, matrices, rhs
+
+
+def lp_tornado(c, A_ub, b_ub, parameters, maximize=False, result=None):
+    """Solve max/min c @ x, A_ub @ x <= b, x >= 0 with each parameter at its extremes.
+
+    parameters is a list of (name, kind, index, low, high): low and high
+    multiply the cost coefficient c[index] (kind 'cost'), the right-hand
+    side b[index] ('rhs') or the whole constraint row A[index] ('row').
+    result is an existing linprog (HiGHS) result for the base model, used
+    instead of solving it again. Returns None when the base model has no
+    optimal solution.
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A_ub, dtype=float)
+    b = np.asarray(b_ub, dtype=float)
+    m, n = A.shape
+    sign = -1.0 if maximize else 1.0
+
+    lp_solves = 0
+    if result is None:
+        result = linprog(sign * c, A_ub=A, b_ub=b, bounds=(0, None), method='highs')
+        lp_solves = 1
+    if not result.success:
+        return None
+    _, basis = _optimal_basis(
+        A, sign * c, result.x, result.slack, result.lower.marginals, result.ineqlin.marginals
+    )
+
+    costs, matrices, rhs = _variants(c, A, b, parameters)
+    n_variants = len(costs)
+    x = np.full((n_variants, n), np.nan)
+    covered = np.zeros(n_variants, dtype=bool)
+
+    if len(basis) == m:
+        # Base basis on every variant at once: x_B = B^-1 b, y = B^-T c_B
+        full = np.concatenate([matrices, np.tile(np.eye(m), (n_variants, 1, 1))], axis=2)
+        c_full = np.hstack([sign * costs, np.zeros((n_variants, m))])
+        B = full[:, :, basis]
+        usable = np.abs(np.linalg.det(B)) > TOLERANCE
+        if usable.any():
+            x_B = np.linalg.solve(B[usable], rhs[usable][..., None])[..., 0]
+            y = np.linalg.solve(np.transpose(B[usable], (0, 2, 1)), c_full[usable][:, basis][..., None])[..., 0]
+            reduced = c_full[usable] - np.einsum('vm,vmj->vj', y, full[usable])
+            scale = np.maximum(1.0, np.abs(rhs[usable]).max(axis=1, keepdims=True))
+            optimal = (x_B >= -TOLERANCE * scale).all(axis=1) & (reduced >= -1e-7).all(axis=1)
+
+            values = np.zeros((usable.sum(), n + m))
+            values[:, basis] = np.maximum(x_B, 0)
+            rows = np.flatnonzero(usable)[optimal]
+            x[rows] = values[optimal, :n]
+            covered[rows] = True
+
+    for v in np.flatnonzero(~covered):
+        variant = linprog(sign * costs[v], A_ub=matrices[v], b_ub=rhs[v], bounds=(0, None), method='highs')
+        lp_solves += 1
+        if variant.success:
+            x[v] = variant.x
+
+    objective = np.einsum('vn,vn->v', costs, x)
+    return Tornado(
+        list(parameters), c @ result.x, result.x,
+        objective[0::2], objective[1::2], x[0::2], x[1::2], lp_solves,
+    )
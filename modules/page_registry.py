@@ -0,0 +1,92 @@
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+# Page registry: maps every st.session_state.page key to the module and
+# function that renders it. Modules are only imported on first navigation,
+# so the homepage never pays for sympy, sklearn, scipy or matplotlib.
+PAGES = {
+    'home': ('modules.homepage', 'show_homepage'),
+    'algebra': ('modules.algebra_overview', 'show_algebra_overview'),
+
+    # Individual algebra topics
+    'algebra_linear': ('modules.algebra_topics.linear_functions', 'show_linear_functions'),
+    'algebra_quadratic': ('modules.algebra_topics.quadratic_functions', 'show_quadratic_functions'),
+    'algebra_exponential': ('modules.algebra_topics.exponential_functions', 'show_exponential_functions'),
+    'algebra_logarithmic': ('modules.algebra_topics.logarithmic_functions', 'show_logarithmic_functions'),
+    'algebra_piecewise': ('modules.algebra_topics.piecewise_functions', 'show_piecewise_functions'),
+    'algebra_inverse': ('modules.algebra_topics.inverse_functions', 'show_inverse_functions'),
+    'algebra_systems': ('modules.algebra_topics.systems_equations', 'show_systems_equations'),
+
+    # Linear algebra
+    'linear_algebra': ('modules.linear_algebra_overview', 'show_linear_algebra_overview'),
+    'linear_algebra_vectors': ('modules.linear_algebra_topics.vector_matrices', 'show_vectors_matrices'),
+    'linear_algebra_eigen': ('modules.linear_algebra_topics.eigenvalues_eigenvectors', 'show_eigenvalues_eigenvectors'),
+    'linear_algebra_pca': ('modules.linear_algebra_topics.pca', 'show_pca'),
+
+    # Calculus
+    'calculus': ('modules.calculus_overview', 'show_calculus_overview'),
+    'calculus_derivatives': ('modules.calculus_topics.derivatives', 'show_derivatives'),
+    'calculus_integrals': ('modules.calculus_topics.integrals', 'show_integrals'),
+
+    'series_sequences': ('modules.series_sequences', 'show_series_sequences'),
+    'optimization': ('modules.optimization', 'show_optimization'),
+    'mathematical_evolution': ('modules.mathematical_evolution', 'show_mathematical_evolution'),
+}
+
+DEFAULT_PAGE = 'home'
+
+# Seconds spent importing each page module in this process (first navigation only)
+_import_times = {}
+
+
+def load_page(page_key):
+    """Return the show_* function for a page key, importing its module on first use"""
+    module_path, function_name = PAGES[page_key]
+
+    if module_path not in sys.modules:
+        start = time.perf_counter()
+        module = importlib.import_module(module_path)
+        _import_times.setdefault(page_key, time.perf_counter() - start)
+    else:
+        module = sys.modules[module_path]
+
+    return getattr(module, function_name)
+
+
+def import_cost_report():
+    """Import time of every page loaded so far in this process, slowest first.
+
+    Numbers are warm-process costs: libraries already pulled in by an earlier
+    page are not counted again. Use cold_import_cost() for isolated numbers.
+    """
+    report = [
+        {'page': page_key, 'module': PAGES[page_key][0], 'seconds': seconds}
+        for page_key, seconds in _import_times.items()
+    ]
+    return sorted(report, key=lambda row: row['seconds'], reverse=True)
+
+
+def cold_import_cost(page_key):
+    """Import a page module in a fresh interpreter and return the seconds it took"""
+    module_path = PAGES[page_key][0]
+    code = (
+        "import time, importlib\n"
+        "start = time.perf_counter()\n"
+        f"importlib.import_module({module_path!r})\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    # python -m modules.page_registry  ->  cold import cost of every page
+    for page_key in PAGES:
+        print(f"{page_key:<28} {cold_import_cost(page_key) * 1000:8.1f} ms")
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+
+from modules.byte_cache import ByteCache
+
+# Content-addressed cache for generated study-guide PDFs.
+#
+# A guide is identified by the SHA-256 of its topic, its parameters in
+# canonical form (sorted keys, 15.0 == 15) and the template version, so the
+# same request from any session or rerun maps to the same bytes. Bump
+# TEMPLATE_VERSION whenever a generator's layout or text changes.
+#
+# Two tiers: a size-bounded in-memory LRU, and - when a directory is set in
+# MATHDASH_PDF_CACHE_DIR - a size-bounded directory of <digest>.pdf files
+# that survives restarts and is shared by every server process. With the
+# disk tier on, default-parameter guides are generated once and from then
+# on served like static files.
+
+TEMPLATE_VERSION = 1
+MEMORY_BYTES = 32 * 1024 * 1024
+DISK_BYTES = 256 * 1024 * 1024
+
+
+def _canonical(value):
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if hasattr(value, 'item'):
+        value = value.item()  # NumPy scalars from sliders or calculations
+    if isinstance(value, float):
+        if math.isfinite(value) and value.is_integer():
+            return int(value)
+        return repr(value) if not math.isfinite(value) else round(value, 10)
+    return value
+
+
+def cache_key(topic, params):
+    """Digest of topic + canonical params + template version"""
+    payload = json.dumps(
+        {'topic': topic, 'params': _canonical(params or {}), 'template': TEMPLATE_VERSION},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class DiskTier:
+    """Directory of <key>.pdf files, oldest-accessed removed beyond max_bytes"""
+
+    def __init__(self, directory, max_bytes=DISK_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def put(self, key, data):
+        # Write-then-rename so readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self._evict()
+
+    def _evict(self):
+        # get() touches the file, so mtime is the last access
+        try:
+            files = sorted(
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(self.directory)
+                if entry.is_file() and entry.name.endswith('.pdf')
+            )
+        except OSError:
+            return
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files[:-1]:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def info(self):
+        try:
+            sizes = [e.stat().st_size for e in os.scandir(self.directory)
+                     if e.is_file() and e.name.endswith('.pdf')]
+        except OSError:
+            sizes = []
+        return {
+            'directory': self.directory,
+            'files': len(sizes),
+            'megabytes': sum(sizes) / 1024 ** 2,
+        }
+
+
+class PDFCache:
+    """Memory LRU in front of an optional DiskTier, with per-tier hit counts"""
+
+    def __init__(self, memory_bytes=MEMORY_BYTES, disk=None):
+        self.memory = ByteCache(maxsize=1024, max_bytes=memory_bytes)
+        self.disk = disk
+        self.disk_hits = 0
+        self.generated = 0
+        self._lock = threading.Lock()
+
+    def get(self, topic, params):
+        key = cache_key(topic, params)
+        data = self.memory.get(key)
+        if data is None and self.disk is not None:
+            data = self.disk.get(key)
+            if data is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                self.memory.put(key, data)
+        return data
+
+    def put(self, topic, params, data):
+        key = cache_key(topic, params)
+        with self._lock:
+            self.generated += 1
+        self.memory.put(key, data)
+        if self.disk is not None:
+            self.disk.put(key, data)
+
+    def get_or_generate(self, topic, params, generate):
+        """Cached PDF bytes, calling generate() only when neither tier has them"""
+        data = self.get(topic, params)
+        if data is None:
+            data = generate()
+            self.put(topic, params, data)
+        return data
+
+    def info(self):
+        memory = self.memory.info()
+        with self._lock:
+            lookups = memory['hits'] + memory['misses']
+            served = memory['hits'] + self.disk_hits
+            info = {
+                'requests': lookups,
+                'memory_hits': memory['hits'],
+                'disk_hits': self.disk_hits,
+                'generated': self.generated,
+                'hit_rate': served / lookups if lookups else None,
+                'memory_entries': memory['size'],
+                'memory_megabytes': memory['megabytes'],
+            }
+        if self.disk is not None:
+            info['disk'] = self.disk.info()
+        return info
+
+
+def _from_environment():
+    directory = os.environ.get('MATHDASH_PDF_CACHE_DIR')
+    disk = None
+    if directory:
+        try:
+            disk = DiskTier(directory)
+        except OSError:
+            disk = None
+    return PDFCache(disk=disk)
+
+
+_cache = _from_environment()
+
+
+def cached_pdf(topic, params, generate):
+    """PDF bytes for topic + params from the process-wide cache"""
+    return _cache.get_or_generate(topic, params, generate)
+
+
+def lookup(topic, params):
+    return _cache.get(topic, params)
+
+
+def store(topic, params, data):
+    _cache.put(topic, params, data)
+
+
+def cache_info():
+    return _cache.info()
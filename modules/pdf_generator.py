@@ -1,12 +1,24 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 from fpdf import FPDF
-import base64
 import io
+import zipfile
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 import numpy as np
+from modules import pdf_cache
+from modules.process_pool import reset_executor, shared_executor
 from math import sqrt
 
+def _latin1(text):
+    """Drop characters the core PDF fonts can't encode (emoji icons)"""
+    return text.encode('latin-1', 'ignore').decode('latin-1').strip()
+
+def _pdf_bytes(pdf):
+    """Document bytes from fpdf (str output) or fpdf2 (bytearray output)"""
+    output = pdf.output(dest='S')
+    return output.encode('latin-1') if isinstance(output, str) else bytes(output)
+
 class MathsPDF(FPDF):
     def __init__(self, topic_title, topic_icon):
         super().__init__()
@@ -15,7 +27,7 @@ class MathsPDF(FPDF):
         
     def header(self):
         self.set_font('Arial', 'B', 16)
-        self.cell(0, 15, f'{self.topic_icon} {self.topic_title}', 0, 1, 'C')
+        self.cell(0, 15, _latin1(f'{self.topic_icon} {self.topic_title}'), 0, 1, 'C')
         self.set_font('Arial', 'I', 10)
         self.cell(0, 5, 'Mathematics Learning Dashboard - Business Applications', 0, 1, 'C')
         self.ln(10)
@@ -31,7 +43,7 @@ class MathsPDF(FPDF):
         self.ln(5)
         self.set_font('Arial', 'B', 14)
         self.set_fill_color(230, 240, 250)
-        self.cell(0, 10, f'{icon} {title}', 0, 1, 'L', True)
+        self.cell(0, 10, _latin1(f'{icon} {title}'), 0, 1, 'L', True)
         self.ln(5)
     
     def add_business_story(self, story_text):
@@ -133,7 +145,7 @@ Where Q = Number of pizzas sold"""
 - Break-even: {params['break_even_point']:.0f} pizzas"""
     pdf.add_insight_box(analysis, "Key Metrics")
     
-    return pdf.output(dest='S').encode('latin-1')
+    return _pdf_bytes(pdf)
 
 def create_quadratic_functions_pdf(params=None):
     """Create PDF for Quadratic Functions topic"""
@@ -169,7 +181,7 @@ Where:
 - (P - {params['optimal_price']})² = Accelerating loss factor"""
     pdf.add_equation_box(equation_text)
     
-    return pdf.output(dest='S').encode('latin-1')
+    return _pdf_bytes(pdf)
 
 def create_exponential_functions_pdf(params=None):
     """Create PDF for Exponential Functions topic"""
@@ -206,7 +218,7 @@ Where:
 - t = Time ({params['years']} years)"""
     pdf.add_equation_box(equation_text)
     
-    return pdf.output(dest='S').encode('latin-1')
+    return _pdf_bytes(pdf)
 
 def create_logarithmic_functions_pdf(params=None):
     """Create PDF for Logarithmic Functions topic"""
@@ -243,7 +255,7 @@ Where:
 - {params['baseline']} = Baseline response"""
     pdf.add_equation_box(equation_text)
     
-    return pdf.output(dest='S').encode('latin-1')
+    return _pdf_bytes(pdf)
 
 def create_piecewise_functions_pdf(params=None):
     """Create PDF for Piecewise Functions topic"""
@@ -281,7 +293,7 @@ Cost(w) = {{
 Where w = package weight in pounds"""
     pdf.add_equation_box(equation_text)
     
-    return pdf.output(dest='S').encode('latin-1')
+    return _pdf_bytes(pdf)
 
 def create_inverse_functions_pdf(params=None):
     """Create PDF for Inverse Functions topic"""
@@ -316,15 +328,124 @@ Example with current parameters:
 - Target Revenue: Rs.{params['target_revenue']}k"""
     pdf.add_equation_box(equation_text)
     
-    return pdf.output(dest='S').encode('latin-1')
-
-def create_download_link(pdf_bytes, filename, button_text):
-    """Create download link for PDF"""
-    b64_pdf = base64.b64encode(pdf_bytes).decode()
-    href = f'<a href="data:application/pdf;base64,{b64_pdf}" download="{filename}" style="text-decoration: none;">' \
-           f'<button style="background-color: #4CAF50; color: white; padding: 12px 24px; border: none; ' \
-           f'border-radius: 8px; cursor: pointer; font-size: 16px; margin: 5px;">{button_text}</button></a>'
-    return href
+    return _pdf_bytes(pdf)
+
+# Study guides offered by the download center, keyed by topic label
+STUDY_GUIDES = {
+    "📈 Linear Functions": {
+        "description": "Maya's Tea Stall - Profit analysis and break-even calculations",
+        "generator": create_linear_functions_pdf,
+        "filename": "Linear_Functions_Study_Guide.pdf"
+    },
+    "📊 Quadratic Functions": {
+        "description": "Maya's Pricing Experiment - Finding the sweet spot",
+        "generator": create_quadratic_functions_pdf,
+        "filename": "Quadratic_Functions_Study_Guide.pdf"
+    },
+    "🌱 Exponential Functions": {
+        "description": "Investment Growth - Compound interest and exponential growth",
+        "generator": create_exponential_functions_pdf,
+        "filename": "Exponential_Functions_Study_Guide.pdf"
+    },
+    "📉 Logarithmic Functions": {
+        "description": "Marketing Analytics - Diminishing returns and optimization",
+        "generator": create_logarithmic_functions_pdf,
+        "filename": "Logarithmic_Functions_Study_Guide.pdf"
+    },
+    "🔗 Piecewise Functions": {
+        "description": "Shipping Logistics - Tiered pricing strategies",
+        "generator": create_piecewise_functions_pdf,
+        "filename": "Piecewise_Functions_Study_Guide.pdf"
+    },
+    "🔄 Inverse Functions": {
+        "description": "Revenue Planning - Working backward from goals",
+        "generator": create_inverse_functions_pdf,
+        "filename": "Inverse_Functions_Study_Guide.pdf"
+    }
+}
+
+# Batch generation for class packs.
+#
+# FPDF documents are built in pure Python, so a pack of guides is rendered
+# across a process pool (one guide per task) and each PDF is written into
+# the ZIP as soon as its worker finishes (modules.process_pool).
+
+def _render_guide(topic, params):
+    return STUDY_GUIDES[topic]['generator'](params)
+
+def study_guide_pdf(topic, params):
+    """PDF bytes of one study guide, generated once per topic and parameter set"""
+    return pdf_cache.cached_pdf(topic, params, lambda: _render_guide(topic, params))
+
+def _archive_name(topic, index, count):
+    stem = STUDY_GUIDES[topic]['filename'][:-len('.pdf')]
+    return f"{stem}.pdf" if count == 1 else f"{stem}_{index + 1}.pdf"
+
+def generate_study_guide_zip(jobs, progress=None, parallel=True):
+    """ZIP bytes with one PDF per (topic, params) job.
+
+    Several jobs may share a topic (one guide per parameter set); their
+    files are numbered in job order. progress(done, total) is called as
+    each guide is added. Guides already in the PDF cache are reused; the
+    rest are generated (and cached) across the process pool, or in this
+    process when parallel is False, only one guide is missing, or the pool
+    is unavailable. PDFs are already compressed, so they are stored as-is.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        raise ValueError("no study guides selected")
+    for topic, _ in jobs:
+        if topic not in STUDY_GUIDES:
+            raise ValueError(f"unknown study guide topic: {topic}")
+
+    counts = {topic: sum(1 for t, _ in jobs if t == topic) for topic, _ in jobs}
+    seen = {}
+    names = []
+    for topic, _ in jobs:
+        names.append(_archive_name(topic, seen.get(topic, 0), counts[topic]))
+        seen[topic] = seen.get(topic, 0) + 1
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:
+        def add(index, pdf_bytes):
+            archive.writestr(names[index], pdf_bytes)
+            if progress is not None:
+                progress(len(archive.namelist()), len(jobs))
+
+        def generated(index, pdf_bytes):
+            pdf_cache.store(*jobs[index], pdf_bytes)
+            add(index, pdf_bytes)
+
+        pending = []
+        for index, (topic, params) in enumerate(jobs):
+            cached = pdf_cache.lookup(topic, params)
+            if cached is None:
+                pending.append(index)
+            else:
+                add(index, cached)
+
+        if parallel and len(pending) > 1:
+            try:
+                pool = shared_executor()
+                futures = {pool.submit(_render_guide, *jobs[i]): i for i in pending}
+                for future in as_completed(futures):
+                    generated(futures[future], future.result())
+                    pending.remove(futures[future])
+            except (BrokenProcessPool, OSError):
+                reset_executor()
+
+        for index in pending:
+            generated(index, _render_guide(*jobs[index]))
+
+    return buffer.getvalue()
+
+# Generated bytes come from the PDF cache (modules.pdf_cache) and are
+# handed to st.download_button as raw bytes, served from Streamlit's media
+# endpoint rather than inlined into the page as a base64 data URL.
+
+def _params_key(params):
+    """Hashable, order-independent form of a parameter dict (None = defaults)"""
+    return tuple(sorted(params.items())) if params else ()
 
 def show_pdf_download_center():
     """Main PDF Download Center - Call this from algebra_overview.py"""
@@ -332,47 +453,14 @@ def show_pdf_download_center():
     st.header("📚 Download Study Materials")
     st.markdown("Generate personalized PDF study guides for any topic with current parameters and solutions.")
     
-    # Topic selection
-    available_topics = {
-        "📈 Linear Functions": {
-            "description": "Maya's Tea Stall - Profit analysis and break-even calculations",
-            "generator": create_linear_functions_pdf,
-            "filename": "Linear_Functions_Study_Guide.pdf"
-        },
-        "📊 Quadratic Functions": {
-            "description": "Maya's Pricing Experiment - Finding the sweet spot",
-            "generator": create_quadratic_functions_pdf,
-            "filename": "Quadratic_Functions_Study_Guide.pdf"
-        },
-        "🌱 Exponential Functions": {
-            "description": "Investment Growth - Compound interest and exponential growth",
-            "generator": create_exponential_functions_pdf,
-            "filename": "Exponential_Functions_Study_Guide.pdf"
-        },
-        "📉 Logarithmic Functions": {
-            "description": "Marketing Analytics - Diminishing returns and optimization",
-            "generator": create_logarithmic_functions_pdf,
-            "filename": "Logarithmic_Functions_Study_Guide.pdf"
-        },
-        "🔗 Piecewise Functions": {
-            "description": "Shipping Logistics - Tiered pricing strategies",
-            "generator": create_piecewise_functions_pdf,
-            "filename": "Piecewise_Functions_Study_Guide.pdf"
-        },
-        "🔄 Inverse Functions": {
-            "description": "Revenue Planning - Working backward from goals",
-            "generator": create_inverse_functions_pdf,
-            "filename": "Inverse_Functions_Study_Guide.pdf"
-        }
-    }
-    
     # Download options
     col1, col2 = st.columns([2, 1])
     
     with col1:
         st.subheader("🎯 Individual Topic Downloads")
         
-        for topic, info in available_topics.items():
+        chosen_params = {}
+        for topic, info in STUDY_GUIDES.items():
             with st.expander(f"{topic} - Study Guide"):
                 st.write(f"**Description:** {info['description']}")
                 
@@ -397,18 +485,24 @@ def show_pdf_download_center():
                     }
                 else:
                     params = None  # Use defaults for other topics
+                chosen_params[topic] = params
                 
-                # Generate and download button
+                # Generate on click, then offer the cached bytes for download
+                # until the parameters change
                 if st.button(f"📥 Generate {topic} PDF", key=f"btn_{topic}"):
+                    st.session_state[f"pdf_{topic}"] = _params_key(params)
+                
+                if st.session_state.get(f"pdf_{topic}") == _params_key(params):
                     with st.spinner(f"Creating {topic} study guide..."):
                         try:
-                            pdf_bytes = info['generator'](params)
-                            download_link = create_download_link(
-                                pdf_bytes, 
-                                info['filename'],
-                                f"📥 Download {topic} PDF"
+                            pdf_bytes = study_guide_pdf(topic, params)
+                            st.download_button(
+                                f"📥 Download {topic} PDF",
+                                pdf_bytes,
+                                file_name=info['filename'],
+                                mime="application/pdf",
+                                key=f"download_{topic}"
                             )
-                            st.markdown(download_link, unsafe_allow_html=True)
                             st.success("✅ PDF generated successfully!")
                         except Exception as e:
                             st.error("Install required library: pip install fpdf2")
@@ -418,23 +512,50 @@ def show_pdf_download_center():
         st.subheader("📦 Bulk Download")
         
         st.info("""
-        **Coming Soon:**
-        - Download all topics as one PDF
-        - Create custom study packs
-        - Export with practice exercises
-        - Share with classmates
+        **Class Pack:**
+        - One ZIP with a study guide per topic
+        - Uses the parameters set in each topic's expander
+        - Guides are generated in parallel
         """)
         
         # Bulk download option
         selected_topics = st.multiselect(
             "Select topics for bulk download:",
-            list(available_topics.keys()),
+            list(STUDY_GUIDES.keys()),
             help="Choose multiple topics to download together"
         )
         
         if selected_topics:
-            if st.button("📥 Generate Combined PDF", key="bulk_download"):
-                st.info("Bulk download feature coming soon!")
+            jobs_key = tuple((topic, _params_key(chosen_params[topic])) for topic in selected_topics)
+            if st.button("📦 Generate Class Pack (ZIP)", key="bulk_download"):
+                st.session_state['class_pack'] = jobs_key
+            
+            if st.session_state.get('class_pack') == jobs_key:
+                progress = st.empty()
+                try:
+                    pack = generate_study_guide_zip(
+                        [(topic, chosen_params[topic]) for topic in selected_topics],
+                        progress=lambda done, total: progress.progress(
+                            done / total, text=f"{done}/{total} study guides ready"
+                        ),
+                    )
+                    progress.empty()
+                    st.download_button(
+                        "📥 Download Class Pack",
+                        pack,
+                        file_name="Algebra_Class_Pack.zip",
+                        mime="application/zip",
+                        key="class_pack_download"
+                    )
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+        
+        stats = pdf_cache.cache_info()
+        if stats['requests']:
+            st.caption(
+                f"PDF cache: {stats['hit_rate']:.0%} of {stats['requests']} requests served "
+                f"without regenerating ({stats['generated']} guides generated)"
+            )
     
     # Usage instructions
     st.markdown("---")
@@ -0,0 +1,34 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# One process pool shared by the CPU-heavy batch jobs (study-guide packs,
+# efficient frontiers). It is created on first use and reused, so only the
+# first batch pays for starting the workers. Workers are spawned, not
+# forked: forking a multi-threaded Streamlit server is unsafe.
+
+MAX_WORKERS = 4
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def shared_executor():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=min(MAX_WORKERS, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _pool
+
+
+def reset_executor():
+    """Drop a broken pool; the next shared_executor() call starts a new one"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -5,6 +5,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import math
+from modules.finance import amortization_schedule, amortization_batch, npv, irr, sign_changes
 
 def show_series_sequences():
     # Header with navigation
@@ -86,6 +87,227 @@ def show_series_sequences():
     but increase it by ₹500 every year to beat inflation. How much will I invest in total?"*
     """)
     
+    # Each calculator is an st.fragment (defined below), so moving its
+    # sliders reruns only that section instead of the whole page
+    _show_ap_sip_calculator()
+
+    # AP Applications in Finance
+    st.subheader("💼 AP Applications in Finance")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **📈 Investment Planning**
+        - SIP with annual increases
+        - Salary-based investments
+        - Fixed increment savings
+        - Budget progressions
+        """)
+    
+    with col2:
+        st.markdown("""
+        **💰 Loan & EMI Planning**
+        - Step-up EMI loans
+        - Graduated payment mortgages  
+        - Progressive savings plans
+        - Linear depreciation
+        """)
+    
+    with col3:
+        st.markdown("""
+        **📊 Business Applications**
+        - Revenue projections (linear)
+        - Cost planning with fixed increases
+        - Inventory management
+        - Capacity expansion planning
+        """)
+    
+    # Section 2: Geometric Progression (GP)
+    st.markdown("---")
+    st.header("🚀 Geometric Progression (GP) - The Compound Growth Master")
+    
+    st.markdown("""
+    **Mr. Patel's EMI Challenge:** *"Rajesh, I'm taking a ₹50 lakh home loan at 8% annual interest 
+    for 20 years. Calculate my EMI and explain how compound interest works mathematically."*
+    """)
+    
+    _show_emi_calculator()
+
+    # Investment Growth with GP
+    st.subheader("📈 Investment Growth Using GP")
+    
+    _show_sip_growth_calculator()
+
+    # GP Applications in Finance
+    st.subheader("💼 GP Applications in Finance")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **🏦 Loan Calculations**
+        - EMI computations
+        - Compound interest
+        - Loan amortization
+        - Present value calculations
+        """)
+    
+    with col2:
+        st.markdown("""
+        **📈 Investment Growth**
+        - SIP future value
+        - Compound annual growth
+        - Retirement planning
+        - Wealth creation projections
+        """)
+    
+    with col3:
+        st.markdown("""
+        **📊 Business Modeling**
+        - Revenue growth projections
+        - Population/market expansion
+        - Viral marketing reach
+        - Inflation adjustments
+        """)
+    
+    # Section 3: Harmonic Progression (HP)
+    st.markdown("---")
+    st.header("⚖️ Harmonic Progression (HP) - The Proper Averaging Master")
+    
+    st.markdown("""
+    **Ms. Reddy's P/E Averaging Challenge:** *"Rajesh, I have 5 stocks with P/E ratios: 15, 20, 25, 30, 40. 
+    What's the proper 'average' P/E of my portfolio? Simple average gives 26, but that doesn't seem right for financial ratios."*
+    """)
+    
+    _show_pe_calculator()
+
+    # HP Applications in Finance
+    st.subheader("💼 HP Applications in Finance")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **📊 Ratio Analysis**
+        - P/E ratio averaging
+        - P/B ratio calculations
+        - Debt-to-equity ratios
+        - Efficiency ratios
+        """)
+    
+    with col2:
+        st.markdown("""
+        **⚡ Rate Calculations**
+        - Average return rates
+        - Interest rate averaging
+        - Growth rate analysis
+        - Performance metrics
+        """)
+    
+    with col3:
+        st.markdown("""
+        **💰 Cost Analysis**
+        - Cost per unit averaging
+        - Efficiency measurements
+        - Resource utilization
+        - Productivity ratios
+        """)
+    
+    # Section 4: Integration - Advanced Applications
+    st.markdown("---")
+    st.header("🔗 Integration: IRR and NPV Using Series")
+    
+    st.markdown("""
+    **Rajesh's Ultimate Challenge:** *"A client wants to evaluate a project with varying cash flows. 
+    I need to calculate IRR (Internal Rate of Return) using geometric series principles!"*
+    """)
+    
+    _show_irr_calculator()
+
+    # Practice Exercises
+    st.markdown("---")
+    st.header("💪 Practice: Master All Three Progressions")
+    
+    _show_practice_exercises()
+
+    # Key Takeaways
+    st.markdown("---")
+    st.header("🎓 Rajesh's Series Mastery Summary")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **📈 Arithmetic Progression**
+        
+        **When to Use:**
+        - Fixed incremental changes
+        - Linear growth patterns
+        - SIP with annual increases
+        - Salary progressions
+        
+        **Key Formula:**
+        Sum = n/2 × [2a + (n-1)d]
+        
+        **Business Power:**
+        Predictable planning & budgeting
+        """)
+    
+    with col2:
+        st.markdown("""
+        **🚀 Geometric Progression**
+        
+        **When to Use:**
+        - Compound growth/interest
+        - EMI calculations
+        - Investment projections
+        - Exponential patterns
+        
+        **Key Formula:**
+        Sum = a × (rⁿ - 1)/(r - 1)
+        
+        **Business Power:**
+        Wealth creation & loan analysis
+        """)
+    
+    with col3:
+        st.markdown("""
+        **⚖️ Harmonic Progression**
+        
+        **When to Use:**
+        - Ratio averaging
+        - Rate calculations
+        - Efficiency metrics
+        - Performance analysis
+        
+        **Key Formula:**
+        HM = n / (1/a₁ + 1/a₂ + ... + 1/aₙ)
+        
+        **Business Power:**
+        Accurate ratio & rate analysis
+        """)
+    
+    st.success("""
+    🎉 **Rajesh's Complete Transformation Achieved!**
+    
+    From three confused client questions to mastering all financial series applications:
+    ✅ **AP Mastery** - SIP planning and linear growth analysis
+    ✅ **GP Expertise** - EMI calculations and compound growth projections  
+    ✅ **HP Precision** - Proper ratio averaging and performance metrics
+    ✅ **Integration Skills** - IRR and NPV calculations using series principles
+    
+    **The Power of Series:** Rajesh can now handle any financial calculation involving 
+    patterns, growth, or proper averaging - making him the go-to expert for complex 
+    portfolio management challenges!
+    """)
+    
+    st.markdown("---")
+
+
+@st.fragment
+def _show_ap_sip_calculator():
+    """Mrs. Sharma's step-up SIP calculator"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -178,48 +400,11 @@ Sum = n/2 × [2a + (n-1)d]
         - **Final Year Investment:** ₹{yearly_investments[-1]:,}
         - **Average Annual Investment:** ₹{total_invested/years:,.0f}
         """)
-    
-    # AP Applications in Finance
-    st.subheader("💼 AP Applications in Finance")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **📈 Investment Planning**
-        - SIP with annual increases
-        - Salary-based investments
-        - Fixed increment savings
-        - Budget progressions
-        """)
-    
-    with col2:
-        st.markdown("""
-        **💰 Loan & EMI Planning**
-        - Step-up EMI loans
-        - Graduated payment mortgages  
-        - Progressive savings plans
-        - Linear depreciation
-        """)
-    
-    with col3:
-        st.markdown("""
-        **📊 Business Applications**
-        - Revenue projections (linear)
-        - Cost planning with fixed increases
-        - Inventory management
-        - Capacity expansion planning
-        """)
-    
-    # Section 2: Geometric Progression (GP)
-    st.markdown("---")
-    st.header("🚀 Geometric Progression (GP) - The Compound Growth Master")
-    
-    st.markdown("""
-    **Mr. Patel's EMI Challenge:** *"Rajesh, I'm taking a ₹50 lakh home loan at 8% annual interest 
-    for 20 years. Calculate my EMI and explain how compound interest works mathematically."*
-    """)
-    
+
+
+@st.fragment
+def _show_emi_calculator():
+    """Mr. Patel's EMI calculator and amortization breakdown"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -283,22 +468,12 @@ Total Interest = ₹{total_interest:,.0f}
     with col2:
         st.subheader("📊 EMI & Interest Breakdown")
         
-        # Calculate month-wise breakdown for first few years
-        months = list(range(1, min(61, total_months + 1)))  # First 5 years or total tenure
-        outstanding_balance = []
-        principal_component = []
-        interest_component = []
-        
-        remaining_principal = loan_amount
-        
-        for month in months:
-            interest_part = remaining_principal * monthly_rate
-            principal_part = emi - interest_part
-            remaining_principal -= principal_part
-            
-            outstanding_balance.append(remaining_principal)
-            principal_component.append(principal_part)
-            interest_component.append(interest_part)
+        # Month-wise breakdown for the whole tenure (closed form, no loop)
+        schedule = amortization_schedule(loan_amount, annual_rate, total_months)
+        months = schedule['month']
+        outstanding_balance = schedule['balance']
+        principal_component = schedule['principal']
+        interest_component = schedule['interest']
         
         # Create EMI breakdown visualization
         fig = make_subplots(
@@ -319,6 +494,7 @@ Total Interest = ₹{total_interest:,.0f}
             name='Interest Component',
             marker_color='red'
         ), row=1, col=1)
+        fig.update_layout(barmode='stack')
         
         # Outstanding balance
         fig.add_trace(go.Scatter(
@@ -337,14 +513,78 @@ Total Interest = ₹{total_interest:,.0f}
         
         st.info(f"""
         **GP Pattern Insights:**
-        - **Initial Interest:** ₹{interest_component[0]:,.0f}/month
-        - **Initial Principal:** ₹{principal_component[0]:,.0f}/month
+        - **Initial Interest:** ₹{interest_component.iloc[0]:,.0f}/month
+        - **Initial Principal:** ₹{principal_component.iloc[0]:,.0f}/month
         - **Ratio shifts over time** due to reducing balance
         """)
     
-    # Investment Growth with GP
-    st.subheader("📈 Investment Growth Using GP")
-    
+    with st.expander("🔁 What if Mr. Patel prepays, or the rate resets?"):
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            prepayment = st.slider("One-time prepayment (₹ lakhs)", 0, 50, 5, 1) * 100000
+            prepayment_month = st.slider("Prepayment month", 1, total_months, min(24, total_months))
+            new_rate = st.slider("Rate after reset (%)", 5.0, 15.0, annual_rate, 0.5)
+            reset_month = st.slider("Rate reset month", 2, total_months, min(60, total_months))
+            keep_emi = st.radio(
+                "After a change, Mr. Patel keeps...",
+                ["the same tenure (EMI changes)", "the same EMI (tenure changes)"]
+            ).startswith("the same EMI")
+        
+        with col2:
+            try:
+                what_if = amortization_schedule(
+                    loan_amount, annual_rate, total_months,
+                    prepayments={prepayment_month: prepayment} if prepayment else None,
+                    rate_changes={reset_month: new_rate} if new_rate != annual_rate else None,
+                    keep_emi=keep_emi
+                )
+            except ValueError:
+                st.error("At the new rate the current EMI no longer covers the monthly interest.")
+            else:
+                interest_saved = schedule['interest'].sum() - what_if['interest'].sum()
+                
+                # EMI once both changes have taken effect
+                changes = [m for m, active in [(prepayment_month, prepayment), (reset_month, new_rate != annual_rate)] if active]
+                settled_month = min(max(changes, default=0) + 1, len(what_if))
+                new_emi = what_if['payment'].iloc[settled_month - 1]
+                
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=schedule['month'], y=schedule['balance'],
+                    mode='lines', name='Original plan',
+                    line=dict(color='blue', width=2)
+                ))
+                fig.add_trace(go.Scatter(
+                    x=what_if['month'], y=what_if['balance'],
+                    mode='lines', name='What-if plan',
+                    line=dict(color='orange', width=3)
+                ))
+                fig.update_layout(
+                    title="Outstanding Balance: Original vs What-if",
+                    xaxis_title="Month", yaxis_title="Balance (₹)", height=350
+                )
+                st.plotly_chart(fig, use_container_width=True)
+                
+                st.success(f"""
+                - **Tenure:** {total_months} → {len(what_if)} months
+                - **EMI:** ₹{emi:,.0f} → ₹{new_emi:,.0f}
+                - **Interest {'saved' if interest_saved >= 0 else 'added'}:** ₹{abs(interest_saved):,.0f}
+                """)
+        
+        # Every tenure from 5 to 30 years, evaluated as one batch
+        tenures = np.arange(5, 31)
+        batch = amortization_batch(loan_amount, annual_rate, tenures * 12)
+        st.dataframe(pd.DataFrame({
+            'Tenure (years)': tenures,
+            'EMI (₹)': batch['emi'].round(0),
+            'Total Interest (₹)': np.nansum(batch['interest'], axis=1).round(0),
+        }), use_container_width=True, hide_index=True)
+
+
+@st.fragment
+def _show_sip_growth_calculator():
+    """SIP future value with compounding market returns"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -431,48 +671,11 @@ Wealth Created = ₹{wealth_created:,.0f}
         Green line shows exponential growth due to compounding.
         Red dashed line shows what linear growth would look like.
         """)
-    
-    # GP Applications in Finance
-    st.subheader("💼 GP Applications in Finance")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **🏦 Loan Calculations**
-        - EMI computations
-        - Compound interest
-        - Loan amortization
-        - Present value calculations
-        """)
-    
-    with col2:
-        st.markdown("""
-        **📈 Investment Growth**
-        - SIP future value
-        - Compound annual growth
-        - Retirement planning
-        - Wealth creation projections
-        """)
-    
-    with col3:
-        st.markdown("""
-        **📊 Business Modeling**
-        - Revenue growth projections
-        - Population/market expansion
-        - Viral marketing reach
-        - Inflation adjustments
-        """)
-    
-    # Section 3: Harmonic Progression (HP)
-    st.markdown("---")
-    st.header("⚖️ Harmonic Progression (HP) - The Proper Averaging Master")
-    
-    st.markdown("""
-    **Ms. Reddy's P/E Averaging Challenge:** *"Rajesh, I have 5 stocks with P/E ratios: 15, 20, 25, 30, 40. 
-    What's the proper 'average' P/E of my portfolio? Simple average gives 26, but that doesn't seem right for financial ratios."*
-    """)
-    
+
+
+@st.fragment
+def _show_pe_calculator():
+    """Ms. Reddy's portfolio P/E averaging calculator"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -584,48 +787,11 @@ Weighted Harmonic Mean = {weighted_harmonic:.2f}
         **Verification:** Total time = 1h + 0.5h = 1.5h
         Average speed = 60km/1.5h = 40 km/h ✓
         """)
-    
-    # HP Applications in Finance
-    st.subheader("💼 HP Applications in Finance")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **📊 Ratio Analysis**
-        - P/E ratio averaging
-        - P/B ratio calculations
-        - Debt-to-equity ratios
-        - Efficiency ratios
-        """)
-    
-    with col2:
-        st.markdown("""
-        **⚡ Rate Calculations**
-        - Average return rates
-        - Interest rate averaging
-        - Growth rate analysis
-        - Performance metrics
-        """)
-    
-    with col3:
-        st.markdown("""
-        **💰 Cost Analysis**
-        - Cost per unit averaging
-        - Efficiency measurements
-        - Resource utilization
-        - Productivity ratios
-        """)
-    
-    # Section 4: Integration - Advanced Applications
-    st.markdown("---")
-    st.header("🔗 Integration: IRR and NPV Using Series")
-    
-    st.markdown("""
-    **Rajesh's Ultimate Challenge:** *"A client wants to evaluate a project with varying cash flows. 
-    I need to calculate IRR (Internal Rate of Return) using geometric series principles!"*
-    """)
-    
+
+
+@st.fragment
+def _show_irr_calculator():
+    """IRR calculator and NPV profile for the project cash flows"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -655,54 +821,55 @@ Weighted Harmonic Mean = {weighted_harmonic:.2f}
         
         initial_investment = st.slider("Initial Investment (₹ lakhs)", 50, 200, 100, 10)
         
-        cash_flows = []
-        for i in range(4):
-            cf = st.slider(f"Year {i+1} Cash Flow (₹ lakhs)", 10, 100, [30, 40, 50, 60][i], 5, key=f"cf_{i}")
-            cash_flows.append(cf)
-        
-        # Simple IRR approximation using iteration
-        def calculate_npv(rate, investment, flows):
-            npv = -investment
-            for i, cf in enumerate(flows):
-                npv += cf / (1 + rate)**(i+1)
-            return npv
-        
-        # Find IRR using binary search approximation
-        low_rate, high_rate = 0.0, 1.0
-        for _ in range(50):  # 50 iterations for approximation
-            mid_rate = (low_rate + high_rate) / 2
-            npv = calculate_npv(mid_rate, initial_investment, cash_flows)
-            if abs(npv) < 0.01:
-                break
-            elif npv > 0:
-                low_rate = mid_rate
-            else:
-                high_rate = mid_rate
+        # Any number of years; negative values model later outlays
+        cash_flow_table = st.data_editor(
+            pd.DataFrame({'Cash Flow (₹ lakhs)': [30.0, 40.0, 50.0, 60.0]},
+                         index=pd.RangeIndex(1, 5, name='Year')),
+            num_rows="dynamic",
+            use_container_width=True,
+            key="irr_cash_flows"
+        )
+        cash_flows = cash_flow_table['Cash Flow (₹ lakhs)'].fillna(0).tolist()
+        all_flows = [-initial_investment] + cash_flows
         
-        irr = mid_rate
+        # IRR = real roots of the NPV polynomial in 1/(1+r)
+        irrs = irr(all_flows)
         
-        st.code(f"""
+        if len(irrs) == 1:
+            irr_rate = irrs[0]
+            
+            st.code(f"""
 IRR Calculation Result:
-Internal Rate of Return = {irr*100:.2f}%
+Internal Rate of Return = {irr_rate*100:.2f}%
 
 Verification:
-NPV at {irr*100:.2f}% = ₹{calculate_npv(irr, initial_investment, cash_flows):.2f} lakhs
+NPV at {irr_rate*100:.2f}% = ₹{npv(irr_rate, all_flows):.2f} lakhs
 (Should be approximately 0)
-        """)
-        
-        if irr > 0.15:
-            st.success(f"✅ **Excellent Project** - IRR = {irr*100:.1f}%")
-        elif irr > 0.10:
-            st.info(f"✅ **Good Project** - IRR = {irr*100:.1f}%")
+            """)
+            
+            if irr_rate > 0.15:
+                st.success(f"✅ **Excellent Project** - IRR = {irr_rate*100:.1f}%")
+            elif irr_rate > 0.10:
+                st.info(f"✅ **Good Project** - IRR = {irr_rate*100:.1f}%")
+            else:
+                st.warning(f"⚠️ **Marginal Project** - IRR = {irr_rate*100:.1f}%")
+        elif len(irrs) > 1:
+            st.warning(f"""
+            ⚠️ **Multiple IRRs:** {', '.join(f'{rate*100:.2f}%' for rate in irrs)}
+            
+            The cash flows change sign {sign_changes(all_flows)} times, so NPV crosses zero 
+            more than once and the IRR rule is ambiguous. Judge the project by its NPV at 
+            your cost of capital instead.
+            """)
         else:
-            st.warning(f"⚠️ **Marginal Project** - IRR = {irr*100:.1f}%")
+            st.error("❌ **No IRR** - NPV never reaches zero for these cash flows")
     
     with col2:
         st.subheader("📊 NPV Profile Analysis")
         
-        # Create NPV profile
-        discount_rates = np.linspace(0, 0.5, 50)
-        npv_values = [calculate_npv(rate, initial_investment, cash_flows) for rate in discount_rates]
+        # Create NPV profile (one vectorized evaluation over the whole rate grid)
+        discount_rates = np.linspace(0, 0.5, 201)
+        npv_values = npv(discount_rates, all_flows)
         
         fig = go.Figure()
         
@@ -717,13 +884,14 @@ NPV at {irr*100:.2f}% = ₹{calculate_npv(irr, initial_investment, cash_flows):.
         # Zero line
         fig.add_hline(y=0, line_dash="dash", line_color="gray")
         
-        # IRR point
-        fig.add_trace(go.Scatter(
-            x=[irr*100], y=[0],
-            mode='markers',
-            name=f'IRR = {irr*100:.1f}%',
-            marker=dict(color='red', size=12, symbol='star')
-        ))
+        # IRR point(s)
+        for rate in irrs:
+            fig.add_trace(go.Scatter(
+                x=[rate*100], y=[0],
+                mode='markers',
+                name=f'IRR = {rate*100:.1f}%',
+                marker=dict(color='red', size=12, symbol='star')
+            ))
         
         fig.update_layout(
             title="NPV Profile - Finding IRR",
@@ -736,15 +904,15 @@ NPV at {irr*100:.2f}% = ₹{calculate_npv(irr, initial_investment, cash_flows):.
         
         st.info(f"""
         **IRR Insights:**
-        - **IRR:** {irr*100:.1f}% (where NPV = 0)
-        - **At 10% discount:** NPV = ₹{calculate_npv(0.10, initial_investment, cash_flows):.1f} lakhs
-        - **At 20% discount:** NPV = ₹{calculate_npv(0.20, initial_investment, cash_flows):.1f} lakhs
+        - **IRR:** {', '.join(f'{rate*100:.1f}%' for rate in irrs) or 'none'} (where NPV = 0)
+        - **At 10% discount:** NPV = ₹{npv(0.10, all_flows):.1f} lakhs
+        - **At 20% discount:** NPV = ₹{npv(0.20, all_flows):.1f} lakhs
         """)
-    
-    # Practice Exercises
-    st.markdown("---")
-    st.header("💪 Practice: Master All Three Progressions")
-    
+
+
+@st.fragment
+def _show_practice_exercises():
+    """Practice exercises with show-solution buttons"""
     col1, col2 = st.columns(2)
     
     with col1:
@@ -798,76 +966,3 @@ NPV at {irr*100:.2f}% = ₹{calculate_npv(irr, initial_investment, cash_flows):.
                 3. **Why HP:** P/E is price/earnings ratio - rates need harmonic averaging
                 4. **Result:** HP gives more realistic portfolio valuation
                 """)
-    
-    # Key Takeaways
-    st.markdown("---")
-    st.header("🎓 Rajesh's Series Mastery Summary")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **📈 Arithmetic Progression**
-        
-        **When to Use:**
-        - Fixed incremental changes
-        - Linear growth patterns
-        - SIP with annual increases
-        - Salary progressions
-        
-        **Key Formula:**
-        Sum = n/2 × [2a + (n-1)d]
-        
-        **Business Power:**
-        Predictable planning & budgeting
-        """)
-    
-    with col2:
-        st.markdown("""
-        **🚀 Geometric Progression**
-        
-        **When to Use:**
-        - Compound growth/interest
-        - EMI calculations
-        - Investment projections
-        - Exponential patterns
-        
-        **Key Formula:**
-        Sum = a × (rⁿ - 1)/(r - 1)
-        
-        **Business Power:**
-        Wealth creation & loan analysis
-        """)
-    
-    with col3:
-        st.markdown("""
-        **⚖️ Harmonic Progression**
-        
-        **When to Use:**
-        - Ratio averaging
-        - Rate calculations
-        - Efficiency metrics
-        - Performance analysis
-        
-        **Key Formula:**
-        HM = n / (1/a₁ + 1/a₂ + ... + 1/aₙ)
-        
-        **Business Power:**
-        Accurate ratio & rate analysis
-        """)
-    
-    st.success("""
-    🎉 **Rajesh's Complete Transformation Achieved!**
-    
-    From three confused client questions to mastering all financial series applications:
-    ✅ **AP Mastery** - SIP planning and linear growth analysis
-    ✅ **GP Expertise** - EMI calculations and compound growth projections  
-    ✅ **HP Precision** - Proper ratio averaging and performance metrics
-    ✅ **Integration Skills** - IRR and NPV calculations using series principles
-    
-    **The Power of Series:** Rajesh can now handle any financial calculation involving 
-    patterns, growth, or proper averaging - making him the go-to expert for complex 
-    portfolio management challenges!
-    """)
-    
-    st.markdown("---")
\ No newline at end of file